@@ -0,0 +1,181 @@
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+# ── Cached adaptive function plots ──
+# Axes.plot samples a function at a fixed step and joins every sample, so a
+# jump turns into a steep line and a highlighted sub-range re-evaluates the
+# same function.  adaptive_samples() starts from a coarse grid and bisects only the
+# intervals whose midpoint is off the chord by more than `tol` (a fraction of
+# the sampled y-range), which concentrates points where the curve bends.  An
+# interval still off by more than `tol` at the finest width is a jump: the
+# path is broken there instead of bridged.
+#
+# Samples are memoised per (function, range, tol), a function being its code
+# plus the values of the globals and closure cells it reads; a range inside a
+# cached one is sliced out of it without calling the function again.
+#
+#     parabola = plot(axes2, f, [0.5, 3.2], color=WHITE)
+#     highlight = plot(axes2, f, [1.8, 2.2], color=YELLOW)     # cache hit
+
+
+def _names(code):
+    """Global names a code object (or any lambda nested in it) may load."""
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _names(c)
+    return names
+
+
+def _value_key(v, depth):
+    # values are keyed by content, so `k = 2` vs `k = 3` differ; anything
+    # opaque (modules, ufuncs, other objects) by identity
+    if v is None or isinstance(v, (bool, int, float, complex, str, bytes)):
+        return v
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return (v.dtype.str, v.shape, v.tobytes())
+    if isinstance(v, (tuple, list)):
+        return (type(v).__name__,) + tuple(_value_key(x, depth) for x in v)
+    if isinstance(v, dict):
+        return ("dict",) + tuple((k, _value_key(x, depth)) for k, x in v.items())
+    if isinstance(v, types.FunctionType) and depth < 3:
+        return function_key(v, depth + 1)
+    return ("id", id(v))
+
+
+def function_key(f, depth=0):
+    """Same key for the same lambda written twice: code, defaults, and the
+    current values of the globals and closure cells it reads."""
+    code = getattr(f, "__code__", None)
+    if code is None:
+        return ("id", id(f))
+    g = getattr(f, "__globals__", {})
+    refs = tuple((n, _value_key(g[n], depth)) for n in sorted(_names(code)) if n in g)
+    cells = []
+    for c in f.__closure__ or ():
+        try:
+            cells.append(_value_key(c.cell_contents, depth))
+        except ValueError:           # cell not filled in yet
+            cells.append(("empty",))
+    return (code.co_code, code.co_consts, code.co_names,
+            _value_key(f.__defaults__, depth), refs, tuple(cells))
+
+
+def evaluate(f, x):
+    """f over an array, whether or not f itself is vectorised."""
+    try:
+        y = np.asarray(f(x), dtype=float)
+    except (TypeError, ValueError):
+        y = None
+    if y is None or y.shape != x.shape:
+        y = np.broadcast_to(y, x.shape) if y is not None and y.ndim == 0 else \
+            np.array([f(v) for v in x], dtype=float)
+    return np.array(y, dtype=float)
+
+
+def adaptive_samples(f, x_min, x_max, tol=1e-3, n_init=33, max_depth=14):
+    """x, y and a per-interval `jump` mask for f on [x_min, x_max]."""
+    x = np.linspace(x_min, x_max, n_init)
+    y = evaluate(f, x)
+    finite = np.isfinite(y)
+    span = np.ptp(y[finite]) if finite.any() else 0.0
+    tol_y = tol * (span if span > 0 else 1.0)
+    min_dx = (x_max - x_min) / (n_init - 1) / 2 ** max_depth
+
+    todo = np.ones(len(x) - 1, dtype=bool)
+    for _ in range(max_depth):
+        i = np.flatnonzero(todo)
+        if not len(i):
+            break
+        xm = (x[i] + x[i + 1]) / 2
+        ym = evaluate(f, xm)
+        off = np.abs(ym - (y[i] + y[i + 1]) / 2)
+        bad = ~(off <= tol_y)                    # also catches NaN / inf
+        i, xm, ym = i[bad], xm[bad], ym[bad]
+        if not len(i):
+            break
+        x = np.insert(x, i + 1, xm)
+        y = np.insert(y, i + 1, ym)
+        # each split interval becomes two candidates for the next round
+        todo = np.zeros(len(x) - 1, dtype=bool)
+        new = i + np.arange(len(i))
+        todo[new] = todo[new + 1] = True
+        todo &= np.diff(x) > min_dx
+
+    ok = np.isfinite(y)
+    jump = ~ok[:-1] | ~ok[1:]
+    steep = np.flatnonzero((np.diff(x) <= min_dx * 1.5) & (np.abs(np.diff(y)) > tol_y) & ~jump)
+    jump[steep] = _is_jump(f, x[steep], x[steep + 1], y[steep], y[steep + 1])
+    return x, y, jump
+
+
+def _is_jump(f, lo, hi, y_lo, y_hi, iters=20):
+    """Follow the larger half of each interval down; a jump keeps its full height."""
+    height = np.abs(y_hi - y_lo)
+    for _ in range(iters):
+        mid = (lo + hi) / 2
+        y_mid = evaluate(f, mid)
+        left = np.abs(y_mid - y_lo) >= np.abs(y_hi - y_mid)
+        hi, y_hi = np.where(left, mid, hi), np.where(left, y_mid, y_hi)
+        lo, y_lo = np.where(left, lo, mid), np.where(left, y_lo, y_mid)
+    return ~(np.abs(y_hi - y_lo) < 0.5 * height)
+
+
+class SampleCache:
+    MAX_ENTRIES = 256
+
+    def __init__(self):
+        self.entries = OrderedDict()     # (key, tol) -> list of (x_min, x_max, x, y, jump)
+        self.hits = self.misses = 0
+
+    def samples(self, f, x_min, x_max, tol=1e-3):
+        key = (function_key(f), tol)
+        for lo, hi, x, y, jump in self.entries.get(key, ()):
+            if lo <= x_min and x_max <= hi:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return slice_samples(x, y, jump, x_min, x_max)
+        self.misses += 1
+        x, y, jump = adaptive_samples(f, x_min, x_max, tol)
+        self.entries.setdefault(key, []).append((x_min, x_max, x, y, jump))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.MAX_ENTRIES:
+            self.entries.popitem(last=False)
+        return x, y, jump
+
+
+def slice_samples(x, y, jump, x_min, x_max):
+    """Samples on [x_min, x_max] cut from a covering sample set, ends interpolated."""
+    a = np.searchsorted(x, x_min, side="right")       # x[a - 1] <= x_min < x[a]
+    b = np.searchsorted(x, x_max, side="left")        # x[b - 1] < x_max <= x[b]
+    ends = []
+    for v, i in ((x_min, max(a - 1, 0)), (x_max, min(b, len(x) - 1) - 1)):
+        t = (v - x[i]) / (x[i + 1] - x[i])
+        # inside a jump take the value of the side the end point is nearer to
+        ends.append(y[i + int(t > 0.5)] if jump[i] else y[i] + t * (y[i + 1] - y[i]))
+    xs = np.concatenate([[x_min], x[a:b], [x_max]])
+    ys = np.concatenate([[ends[0]], y[a:b], [ends[1]]])
+    return xs, ys, jump[max(a - 1, 0):b]
+
+
+cache = SampleCache()
+
+
+def plot(axes, f, x_range, tol=1e-3, **kwargs):
+    """Axes.plot replacement: one VMobject, one subpath per continuous piece."""
+    from manim import VMobject
+
+    x, y, jump = cache.samples(f, float(x_range[0]), float(x_range[1]), tol)
+    graph = VMobject(**kwargs)
+    for piece in np.split(np.arange(len(x)), np.flatnonzero(jump) + 1):
+        piece = piece[np.isfinite(y[piece])]
+        if len(piece) < 2:
+            continue
+        pts = np.array([axes.c2p(x[k], y[k]) for k in piece])
+        graph.start_new_path(pts[0])
+        graph.add_points_as_corners(pts[1:])
+    return graph
@@ -1,6 +1,10 @@
 from manim import *
+import numpy as np
 import random
 
+from bandit_sim import simulate
+from tex_cache import MathTex
+
 random.seed(42)
 
 class MultiArmedBandit(Scene):
@@ -12,6 +16,9 @@ class MultiArmedBandit(Scene):
         def clear(*mobjects):
             self.play(*[FadeOut(m) for m in mobjects])
 
+        def fmt(v):
+            return f"{round(float(v), 2):g}"
+
         def section_title(text):
             t = Text(text, font_size=40, weight=BOLD, color=YELLOW)
             self.play(FadeIn(t))
@@ -21,6 +28,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 1. TITLE
         # ============================
+        self.next_section("1. TITLE")
         title = Text("Standard Multi-Armed\nBandit", font_size=52, weight=BOLD)
         subtitle = Text(
             "A Stochastic Framework",
@@ -34,6 +42,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 2. THE ARMS
         # ============================
+        self.next_section("2. THE ARMS")
         section_title("The Setup")
 
         c1 = cap("We have K actions,\ncalled arms.")
@@ -48,11 +57,18 @@ class MultiArmedBandit(Scene):
         # ============================
         # 3. SLOT MACHINES + ARM PULL DEMO
         # ============================
+        self.next_section("3. SLOT MACHINES + ARM PULL DEMO")
         # -- Build 3 slot machines with true means shown --
         arm_colors = [RED, BLUE, GREEN]
         arm_names = ["a_1", "a_2", "a_3"]
         true_means = [0.8, 0.5, 0.7]
 
+        # One UCB1 episode drives the pull demo and the worked regret table
+        demo = simulate(true_means, policy="ucb1", horizon=5, arms="gaussian",
+                        sigma=0.1, bounds=(0, 1), seed=42)
+        gaps = demo.gaps
+        best = int(np.argmax(true_means))
+
         machines = VGroup()
         for i in range(3):
             body = RoundedRectangle(
@@ -88,10 +104,9 @@ class MultiArmedBandit(Scene):
         self.play(FadeIn(c4))
         self.wait(0.5)
 
-        # Pull sequence: arm indices 0,1,2,0,2
-        pull_sequence = [0, 1, 2, 0, 2]
-        # Pre-generate stochastic rewards near the true means
-        stochastic_rewards = [0.72, 0.61, 0.65, 0.88, 0.74]
+        # Pull sequence and stochastic rewards come from the simulated episode
+        pull_sequence = demo.arms[0].tolist()
+        stochastic_rewards = demo.rewards[0].round(2).tolist()
 
         reward_texts_all = VGroup()  # to clean up later
 
@@ -138,6 +153,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 4. FORMAL REWARD NOTATION
         # ============================
+        self.next_section("4. FORMAL REWARD NOTATION")
         c6 = cap("Formally, at round t\nwe pick arm A_t and\nreceive reward X.")
         round_eq = MathTex(
             r"\text{Round } t:",
@@ -153,6 +169,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 5. MEAN REWARDS
         # ============================
+        self.next_section("5. MEAN REWARDS")
         c7 = cap("Each arm has a fixed\nbut unknown mean reward.")
         mu_eq = MathTex(
             r"\mu_i = \mathbb{E}[X_{a_i}(t)]",
@@ -165,6 +182,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 6. OPTIMAL ARM
         # ============================
+        self.next_section("6. OPTIMAL ARM")
         c8 = cap("The best arm's mean\nis called mu-star.")
         mustar_eq = MathTex(
             r"\mu^\star = \max_{a_i \in \mathcal{A}} \mu_i",
@@ -177,6 +195,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 7. GOAL
         # ============================
+        self.next_section("7. GOAL")
         c9 = cap("Our goal: maximize\ntotal expected rewards.")
         goal_eq = MathTex(
             r"\text{Maximize } \; \mathbb{E}\!\left[\sum_{t=1}^T X_{a_{n_t}}\right]",
@@ -189,6 +208,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 8. REGRET DEFINITION
         # ============================
+        self.next_section("8. REGRET DEFINITION")
         section_title("Regret")
 
         c10 = cap("Regret measures loss\ncompared to the best arm.")
@@ -214,6 +234,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 9. REGRET DECOMPOSITION
         # ============================
+        self.next_section("9. REGRET DECOMPOSITION")
         c11 = cap("We can also decompose\nregret by arm.")
         decomp_eq = MathTex(
             r"R_T = \sum_{a_i \in \mathcal{A}} \Delta_i \, \mathbb{E}[n_i(T\!+\!1)]",
@@ -232,6 +253,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 10. COIN FLIP ANALOGY (EXPANDED)
         # ============================
+        self.next_section("10. COIN FLIP ANALOGY (EXPANDED)")
         section_title("Why Can't We See Regret?")
 
         # --- Part A: Setup the coin ---
@@ -340,6 +362,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 11. SUBOPTIMALITY GAP
         # ============================
+        self.next_section("11. SUBOPTIMALITY GAP")
         section_title("Suboptimality Gap")
 
         c17 = cap("The gap measures how far\nan arm is from the best.")
@@ -354,11 +377,13 @@ class MultiArmedBandit(Scene):
         # ============================
         # 12. EXAMPLE: 3 ARMS
         # ============================
+        self.next_section("12. EXAMPLE: 3 ARMS")
         section_title("Example: Three Arms")
 
         c18 = cap("Suppose three arms with\nthese true means.")
         means_eq = MathTex(
-            r"\mu_1 = 0.8, \quad \mu_2 = 0.5, \quad \mu_3 = 0.7",
+            r", \quad ".join(r"\mu_{" + str(i+1) + r"} = " + fmt(m)
+                             for i, m in enumerate(true_means)),
             font_size=38
         ).shift(UP * 1.8)
         self.play(Write(means_eq), FadeIn(c18))
@@ -366,7 +391,7 @@ class MultiArmedBandit(Scene):
 
         # Bar chart
         bars = VGroup()
-        bar_data = [(0.8, RED, "a_1"), (0.5, BLUE, "a_2"), (0.7, GREEN, "a_3")]
+        bar_data = list(zip(true_means, arm_colors, arm_names))
         baseline_y = -1.5
         for i, (val, col, lab) in enumerate(bar_data):
             bar = Rectangle(
@@ -376,11 +401,11 @@ class MultiArmedBandit(Scene):
             bar.move_to(RIGHT * (i - 1) * 2)
             bar.align_to(UP * baseline_y, DOWN)
             label = MathTex(lab, font_size=28).next_to(bar, DOWN, buff=0.15)
-            val_label = MathTex(str(val), font_size=24).next_to(bar, UP, buff=0.1)
+            val_label = MathTex(fmt(val), font_size=24).next_to(bar, UP, buff=0.1)
             bars.add(VGroup(bar, label, val_label))
 
         self.play(FadeOut(c18))
-        c19 = cap("The best arm is a_1\nwith mu-star = 0.8.")
+        c19 = cap(f"The best arm is a_{best+1}\nwith mu-star = {fmt(true_means[best])}.")
         self.play(
             LaggedStart(*[GrowFromEdge(b, DOWN) for b in bars], lag_ratio=0.2),
             FadeIn(c19)
@@ -388,12 +413,12 @@ class MultiArmedBandit(Scene):
         self.wait(1.5)
 
         star_line = DashedLine(
-            start=LEFT * 3.5 + UP * (baseline_y + 0.8 * 3),
-            end=RIGHT * 3.5 + UP * (baseline_y + 0.8 * 3),
+            start=LEFT * 3.5 + UP * (baseline_y + true_means[best] * 3),
+            end=RIGHT * 3.5 + UP * (baseline_y + true_means[best] * 3),
             color=YELLOW, dash_length=0.15
         )
         star_label = MathTex(
-            r"\mu^\star\!=\!0.8", font_size=24, color=YELLOW
+            r"\mu^\star\!=\!" + fmt(true_means[best]), font_size=24, color=YELLOW
         ).next_to(star_line, RIGHT, buff=0.15)
         self.play(Create(star_line), FadeIn(star_label))
         self.wait(2)
@@ -402,9 +427,9 @@ class MultiArmedBandit(Scene):
         # Deltas
         c20 = cap("Now compute the\nsuboptimality gaps.")
         delta_calc = MathTex(
-            r"\Delta_1 &= 0.8 - 0.8 = 0 \\",
-            r"\Delta_2 &= 0.8 - 0.5 = 0.3 \\",
-            r"\Delta_3 &= 0.8 - 0.7 = 0.1",
+            *[r"\Delta_{" + str(i+1) + r"} &= " + fmt(true_means[best]) + " - " + fmt(m)
+              + " = " + fmt(g) + (r" \\" if i < len(true_means) - 1 else "")
+              for i, (m, g) in enumerate(zip(true_means, gaps))],
             font_size=36
         )
         self.play(Write(delta_calc), FadeIn(c20))
@@ -414,6 +439,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 13. CAN DELTA BE NEGATIVE?
         # ============================
+        self.next_section("13. CAN DELTA BE NEGATIVE?")
         c21 = cap("Can the gap ever\nbe negative?")
         neg_eq = MathTex(
             r"\Delta_a = \mu^\star - \mu_a \ge 0",
@@ -441,6 +467,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 14. IS REGRET NONNEG?
         # ============================
+        self.next_section("14. IS REGRET NONNEG?")
         c23 = cap("Is regret always\nnonnegative?")
         reg_pos = MathTex(r"R_T \ge 0", font_size=48).shift(UP * 0.5)
         reg_explain = Text(
@@ -456,6 +483,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 15. UPPER BOUND
         # ============================
+        self.next_section("15. UPPER BOUND")
         c24 = cap("What is an upper\nbound on regret?")
         bound_eq = MathTex(r"0 \le R_T \le T", font_size=48).shift(UP * 0.5)
         bound_text = Text(
@@ -471,6 +499,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 16. WORKED TABLE EXAMPLE
         # ============================
+        self.next_section("16. WORKED TABLE EXAMPLE")
         section_title("Worked Example")
 
         c25 = cap("Let's trace regret\nround by round.")
@@ -485,12 +514,12 @@ class MultiArmedBandit(Scene):
         self.play(FadeIn(header), Create(h_line), FadeIn(c25))
         self.wait(1)
 
+        # Per-round pseudo-regret of the simulated episode
+        round_regret = demo.regret[0]
         table_data = [
-            ("1", "a_1", "0.0", GREEN),
-            ("2", "a_2", "0.3", RED),
-            ("3", "a_3", "0.1", ORANGE),
-            ("4", "a_1", "0.0", GREEN),
-            ("5", "a_3", "0.1", ORANGE),
+            (str(t + 1), arm_names[a], fmt(reg),
+             GREEN if reg == 0 else (RED if reg == gaps.max() else ORANGE))
+            for t, (a, reg) in enumerate(zip(pull_sequence, round_regret))
         ]
 
         rows = VGroup()
@@ -513,16 +542,18 @@ class MultiArmedBandit(Scene):
         # ============================
         # 17. TOTAL REGRET
         # ============================
+        self.next_section("17. TOTAL REGRET")
         c26 = cap("Add up the regrets\nfor total regret.")
         total_eq = MathTex(
-            r"R_5 = 0.0 + 0.3 + 0.1 + 0.0 + 0.1",
+            r"R_{" + str(demo.horizon) + r"} = " + " + ".join(fmt(r) for r in round_regret),
             font_size=36
         ).shift(UP * 0.5)
         self.play(Write(total_eq), FadeIn(c26))
         self.wait(2)
 
+        total_regret = demo.cumulative_regret[0, -1]
         total_result = MathTex(
-            r"= 0.5", font_size=42, color=YELLOW
+            r"= " + fmt(total_regret), font_size=42, color=YELLOW
         ).next_to(total_eq, DOWN, buff=0.4)
         self.play(Write(total_result))
         self.wait(2)
@@ -531,6 +562,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 18. DECOMPOSITION VERIFICATION
         # ============================
+        self.next_section("18. DECOMPOSITION VERIFICATION")
         c27 = cap("Verify using the\ndecomposition formula.")
         decomp_check = MathTex(
             r"R_T = \sum_a n_a(T) \, \Delta_a",
@@ -539,16 +571,18 @@ class MultiArmedBandit(Scene):
         self.play(Write(decomp_check), FadeIn(c27))
         self.wait(1.5)
 
+        n_pulls = demo.counts[0]
         counts = MathTex(
-            r"n_1 = 2, \quad n_2 = 1, \quad n_3 = 2",
+            r", \quad ".join(f"n_{i+1} = {n}" for i, n in enumerate(n_pulls)),
             font_size=32
         ).next_to(decomp_check, DOWN, buff=0.5)
         self.play(FadeIn(counts))
         self.wait(1)
 
         calc = MathTex(
-            r"R_T &= 2(0) + 1(0.3) + 2(0.1) \\",
-            r"&= 0 + 0.3 + 0.2 = 0.5",
+            r"R_T &= " + " + ".join(f"{n}({fmt(g)})" for n, g in zip(n_pulls, gaps)) + r" \\",
+            r"&= " + " + ".join(fmt(n * g) for n, g in zip(n_pulls, gaps))
+            + " = " + fmt(n_pulls @ gaps),
             font_size=34
         ).next_to(counts, DOWN, buff=0.5)
         self.play(Write(calc))
@@ -566,6 +600,7 @@ class MultiArmedBandit(Scene):
         # ============================
         # 19. SUMMARY
         # ============================
+        self.next_section("19. SUMMARY")
         summary_title = Text(
             "Key Takeaways", font_size=40, weight=BOLD, color=YELLOW
         ).shift(UP * 2.5)
@@ -0,0 +1,104 @@
+import numpy as np
+
+# ── Batched multi-armed bandit simulator ──
+# Every policy runs all independent runs at once: the only Python loop is
+# over rounds, each round is a handful of (n_runs, K) array operations.
+
+POLICIES = ("greedy", "epsilon_greedy", "ucb1", "thompson")
+
+
+class BanditRun:
+    """Result of `simulate`: pulls and rewards for every run and round."""
+
+    def __init__(self, true_means, arms, rewards):
+        self.true_means = true_means
+        self.arms = arms          # (n_runs, horizon) arm index per round
+        self.rewards = rewards    # (n_runs, horizon) observed reward
+
+    @property
+    def n_runs(self):
+        return self.arms.shape[0]
+
+    @property
+    def horizon(self):
+        return self.arms.shape[1]
+
+    @property
+    def gaps(self):
+        return self.true_means.max() - self.true_means
+
+    @property
+    def regret(self):
+        # per-round pseudo-regret  Δ_{A_t}
+        return self.gaps[self.arms]
+
+    @property
+    def cumulative_regret(self):
+        return np.cumsum(self.regret, axis=1)
+
+    @property
+    def counts(self):
+        # n_i(T) per run: (n_runs, K)
+        K = len(self.true_means)
+        offsets = np.arange(self.n_runs)[:, None] * K
+        flat = np.bincount((self.arms + offsets).ravel(), minlength=self.n_runs * K)
+        return flat.reshape(self.n_runs, K)
+
+    def regret_curve(self):
+        """Mean cumulative regret over runs, shape (horizon,)."""
+        return self.regret.mean(axis=0).cumsum()
+
+
+def _sample_rewards(rng, means, arms, kind, sigma, bounds):
+    mu = means[arms]
+    if kind == "bernoulli":
+        return (rng.random(mu.shape) < mu).astype(float)
+    if kind == "gaussian":
+        r = mu + sigma * rng.standard_normal(mu.shape)
+        if bounds is not None:
+            np.clip(r, bounds[0], bounds[1], out=r)
+        return r
+    raise ValueError(f"unknown arm distribution: {kind!r}")
+
+
+def simulate(true_means, policy="ucb1", horizon=1000, n_runs=1,
+             arms="bernoulli", sigma=0.1, bounds=None, epsilon=0.1, seed=None):
+    """Run `n_runs` independent bandit episodes of `horizon` rounds."""
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {POLICIES}")
+    means = np.asarray(true_means, dtype=float)
+    K = len(means)
+    rng = np.random.default_rng(seed)
+
+    counts = np.zeros((n_runs, K))
+    sums = np.zeros((n_runs, K))
+    out_arms = np.empty((n_runs, horizon), dtype=np.int32)
+    out_rewards = np.empty((n_runs, horizon))
+    rows = np.arange(n_runs)
+
+    for t in range(horizon):
+        if t < K:
+            # initial round-robin: every policy pulls each arm once
+            a = np.full(n_runs, t, dtype=np.int32)
+        else:
+            est = sums / np.maximum(counts, 1)
+            if policy == "greedy":
+                a = est.argmax(axis=1)
+            elif policy == "epsilon_greedy":
+                a = est.argmax(axis=1)
+                explore = rng.random(n_runs) < epsilon
+                a[explore] = rng.integers(0, K, explore.sum())
+            elif policy == "ucb1":
+                a = (est + np.sqrt(2 * np.log(t + 1) / counts)).argmax(axis=1)
+            elif arms == "bernoulli":
+                a = rng.beta(1 + sums, 1 + counts - sums).argmax(axis=1)
+            else:
+                a = (est + sigma / np.sqrt(counts) * rng.standard_normal((n_runs, K))).argmax(axis=1)
+
+        r = _sample_rewards(rng, means, a, arms, sigma, bounds)
+        counts[rows, a] += 1
+        sums[rows, a] += r
+        out_arms[:, t] = a
+        out_rewards[:, t] = r
+
+    return BanditRun(means, out_arms, out_rewards)
@@ -0,0 +1,75 @@
+import numpy as np
+
+# ── Confidence ellipsoids ──
+# C_t = {θ : ||θ − θ̂_t||_{V_t} ≤ √β}.  With V_t = Q diag(λ) Qᵀ this is an
+# ellipsoid centred at θ̂_t with semi-axes √(β/λ_i) along the eigenvectors
+# q_i, so a non-diagonal V_t gives a rotated ellipse.  Everything carries
+# optional leading axes: trajectory() builds V_t, b_t and θ̂_t for every
+# round of a run with cumulative sums and one batched eigh, which is cheap
+# enough to animate each of 10,000 rounds.  For a live learner use
+# confidence_ellipsoid(learner.V[0], learner.theta[0], beta) after each
+# LinUCB.update.
+#
+#     E = trajectory(X, r, lam=1.0, beta=4.0)
+#     E[19].radii, E[19].angle, E[19].boundary(64)       # round t = 20
+
+
+class Ellipsoid:
+    def __init__(self, centre, radii, axes):
+        self.centre = centre      # (..., d)
+        self.radii = radii        # (..., d) semi-axis lengths, largest first
+        self.axes = axes          # (..., d, d) unit semi-axis directions as columns
+
+    def __len__(self):
+        return len(self.centre)
+
+    def __getitem__(self, i):
+        return Ellipsoid(self.centre[i], self.radii[i], self.axes[i])
+
+    @property
+    def angle(self):
+        """Rotation of the major axis from the θ₁ axis (2-D)."""
+        major = self.axes[..., :, 0]
+        return np.arctan2(major[..., 1], major[..., 0])
+
+    def contains(self, theta):
+        local = ((np.asarray(theta, dtype=float) - self.centre)[..., None, :] @ self.axes)[..., 0, :]
+        return ((local / self.radii) ** 2).sum(axis=-1) <= 1.0
+
+    def boundary(self, n=96):
+        """(n, 2) points around a single 2-D ellipse, counter-clockwise."""
+        phi = np.linspace(0, 2 * np.pi, n, endpoint=False)
+        circle = np.stack([np.cos(phi), np.sin(phi)], axis=1) * self.radii
+        return self.centre + circle @ self.axes.T
+
+
+def confidence_ellipsoid(V, theta_hat, beta=1.0):
+    """{θ : (θ − θ̂)ᵀ V (θ − θ̂) ≤ β} for V of shape (..., d, d)."""
+    lam, Q = np.linalg.eigh(np.asarray(V, dtype=float))
+    if np.any(lam <= 0):
+        raise ValueError("V must be positive definite")
+    # eigh sorts ascending, so the longest semi-axis (smallest eigenvalue) comes first
+    # sign convention: each direction's larger component is positive
+    idx = np.abs(Q).argmax(axis=-2)[..., None, :]
+    Q = Q * np.sign(np.take_along_axis(Q, idx, axis=-2))
+    return Ellipsoid(np.asarray(theta_hat, dtype=float), np.sqrt(beta / lam), Q)
+
+
+def trajectory(X, r, lam=1.0, beta=1.0):
+    """Confidence ellipsoid after each of the T rounds of contexts X (T, d), rewards r (T,)."""
+    X = np.asarray(X, dtype=float)
+    r = np.asarray(r, dtype=float)
+    d = X.shape[1]
+    V = np.cumsum(X[:, :, None] * X[:, None, :], axis=0) + lam * np.eye(d)
+    b = np.cumsum(r[:, None] * X, axis=0)
+    theta = np.linalg.solve(V, b[:, :, None])[..., 0]
+    return confidence_ellipsoid(V, theta, beta)
+
+
+def simulate(theta_star, T, cov=((1.0, 0.6), (0.6, 0.5)), noise=0.3, lam=1.0, beta=1.0, seed=0):
+    """Ellipsoids for T rounds of correlated Gaussian contexts with linear rewards."""
+    rng = np.random.default_rng(seed)
+    theta_star = np.asarray(theta_star, dtype=float)
+    X = rng.multivariate_normal(np.zeros(len(theta_star)), cov, size=T)
+    r = X @ theta_star + noise * rng.standard_normal(T)
+    return trajectory(X, r, lam, beta)
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from confidence import confidence_ellipsoid, simulate
+from linucb import fmt, fmt_vec, run_episode
+from ridge import StreamingRidge
+from tex_cache import MathTex
+
 
 class ContextualBanditsVideo(Scene):
     def construct(self):
@@ -26,6 +31,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  TITLE
         # ═══════════════════════════════════════════════════════
+        self.next_section("TITLE")
         title = Text("Contextual Bandits", font_size=48, color=BLUE)
         sub = Text("From Multi-Armed Bandits\nto Linear Models", font_size=26).next_to(title, DOWN, 0.5)
         self.play(Write(title), run_time=1.5)
@@ -36,6 +42,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  1  STANDARD MAB
         # ═══════════════════════════════════════════════════════
+        self.next_section("1  STANDARD MAB")
         c = swap(None, "Consider a standard\nmulti-armed bandit.")
         machine_colors = [RED, GREEN, YELLOW, TEAL]
         machines = VGroup()
@@ -66,6 +73,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  2  ADD CONTEXT
         # ═══════════════════════════════════════════════════════
+        self.next_section("2  ADD CONTEXT")
         c = swap(None, "Now suppose each arm\ncomes with a context.")
         learner = VGroup(
             RoundedRectangle(width=1.6, height=0.8, corner_radius=0.1, color=BLUE, fill_opacity=0.2),
@@ -96,6 +104,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  3  LINEAR REWARD + SHARED θ*
         # ═══════════════════════════════════════════════════════
+        self.next_section("3  LINEAR REWARD + SHARED θ*")
         c = swap(None, "Reward is linear\nin the context vector.")
         eq_model = MathTex(r"\mathbb{E}[r_t(a) \mid x_t(a)]", r"=", r"\langle x_t(a),\;\theta^\star \rangle", font_size=32).move_to(UP * 2)
         self.play(Write(eq_model)); self.wait(1)
@@ -117,6 +126,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  4  BEST ARM CHANGES
         # ═══════════════════════════════════════════════════════
+        self.next_section("4  BEST ARM CHANGES")
         c = swap(None, "But unlike standard bandits,\nthe best arm can change.")
         theta_disp = MathTex(r"\theta^\star = (1,\;-1)", font_size=32, color=GOLD).to_edge(UP, buff=0.6)
         self.play(Write(theta_disp))
@@ -143,6 +153,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  5  TRANSITION → LEAST SQUARES
         # ═══════════════════════════════════════════════════════
+        self.next_section("5  TRANSITION → LEAST SQUARES")
         c = swap(None, "So the whole problem\nreduces to estimating θ*.")
         big_q = MathTex(r"\text{How do we estimate }\theta^\star\text{ from data?}", font_size=32, color=GOLD).move_to(UP * 1)
         self.play(Write(big_q)); self.wait(1.5)
@@ -159,6 +170,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  6  LEAST SQUARES 1-D = EMPIRICAL MEAN
         # ═══════════════════════════════════════════════════════
+        self.next_section("6  LEAST SQUARES 1-D = EMPIRICAL MEAN")
         c = swap(None, "But least squares\nis not a new idea.")
         ls_title = Text("Least Squares", font_size=38, color=BLUE).to_edge(UP, buff=0.5)
         self.play(Write(ls_title)); self.wait(0.5)
@@ -200,14 +212,19 @@ class ContextualBanditsVideo(Scene):
 
         c = swap(c, "Visually: the mean\nminimizes total squared error.")
         ax = NumberLine(x_range=[0, 10, 1], length=9, include_numbers=True, font_size=18).shift(UP * 0.5)
-        pts = [2, 4, 5, 7, 8]; mean_v = sum(pts) / len(pts)
+        pts = [2, 4, 5, 7, 8]
+        # 1-D least squares on a constant context: θ̂ is the mean, residuals are the error bars
+        ones = np.ones((len(pts), 1))
+        ls_1d = StreamingRidge(d=1).add(ones, pts)
+        mean_v = ls_1d.solve()[0]
+        resid = ls_1d.residuals(ones, pts)
         dots = VGroup(*[Dot(ax.n2p(p), color=BLUE, radius=0.08) for p in pts])
         self.play(Create(ax))
         self.play(LaggedStart(*[FadeIn(d, scale=0.5) for d in dots], lag_ratio=0.12))
         mean_line = DashedLine(ax.n2p(mean_v) + UP * 0.7, ax.n2p(mean_v) + DOWN * 0.7, color=GOLD, stroke_width=3)
-        mean_lbl = MathTex(r"\bar{r}=5.2", font_size=24, color=GOLD).next_to(mean_line, UP, 0.1)
+        mean_lbl = MathTex(r"\bar{r}=" + fmt(mean_v), font_size=24, color=GOLD).next_to(mean_line, UP, 0.1)
         self.play(Create(mean_line), Write(mean_lbl))
-        err_lines = VGroup(*[Line(ax.n2p(p) + UP * 0.12, ax.n2p(mean_v) + UP * 0.12, color=RED, stroke_width=2) for p in pts])
+        err_lines = VGroup(*[Line(ax.n2p(p) + UP * 0.12, ax.n2p(p - e) + UP * 0.12, color=RED, stroke_width=2) for p, e in zip(pts, resid)])
         self.play(LaggedStart(*[Create(e) for e in err_lines], lag_ratio=0.1))
         self.wait(2)
         clear()
@@ -215,6 +232,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  7  VECTOR LEAST SQUARES
         # ═══════════════════════════════════════════════════════
+        self.next_section("7  VECTOR LEAST SQUARES")
         c = swap(None, "Now generalize:\nfit θ in R^d\ninstead of one number.")
         compare_title = Text("Scalar → Vector", font_size=30, color=BLUE).to_edge(UP, buff=0.5)
         self.play(Write(compare_title))
@@ -272,6 +290,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  8  V_t IN BANDITS + REGULARIZATION
         # ═══════════════════════════════════════════════════════
+        self.next_section("8  V_t IN BANDITS + REGULARIZATION")
         c = swap(None, "In the bandit setting,\nwe update V each round.")
         vt = MathTex(r"V_t = \lambda I + \sum_{s=1}^t A_s A_s^\top", font_size=34, color=BLUE).move_to(UP * 2.2)
         self.play(Write(vt)); self.wait(0.8)
@@ -309,6 +328,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         #  9  POSITIVE DEFINITENESS
         # ═══════════════════════════════════════════════════════
+        self.next_section("9  POSITIVE DEFINITENESS")
         c = swap(None, "But does V_t^{-1}\nalways exist?")
         q_inv = MathTex(r"V_t^{-1}\;\text{exists}\;?", font_size=34, color=YELLOW).move_to(UP * 1)
         self.play(Write(q_inv)); self.wait(1)
@@ -346,6 +366,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 10  CONFIDENCE ELLIPSOID
         # ═══════════════════════════════════════════════════════
+        self.next_section("10  CONFIDENCE ELLIPSOID")
         c = swap(None, "We have an estimate.\nBut how confident are we?")
         hat_theta = MathTex(r"\widehat{\theta}_t \approx \theta^\star \;\;?", font_size=36, color=GOLD).move_to(UP * 1)
         self.play(Write(hat_theta)); self.wait(1.5)
@@ -360,6 +381,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 11  CIRCLE EXAMPLE — SLOW, STEP BY STEP
         # ═══════════════════════════════════════════════════════
+        self.next_section("11  CIRCLE EXAMPLE — SLOW, STEP BY STEP")
         c = swap(None, "Let's compute an example\nstep by step.")
 
         circ_title = Text("Example: circular confidence set", font_size=26, color=BLUE).to_edge(UP, buff=0.5)
@@ -435,6 +457,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 12  ELLIPSE EXAMPLE — SLOW, STEP BY STEP
         # ═══════════════════════════════════════════════════════
+        self.next_section("12  ELLIPSE EXAMPLE — SLOW, STEP BY STEP")
         c = swap(None, "Now try unequal\ndiagonal entries.")
 
         ell_title = Text("Example: elliptical confidence set", font_size=26, color=GOLD).to_edge(UP, buff=0.5)
@@ -482,19 +505,20 @@ class ContextualBanditsVideo(Scene):
         ye_lab = MathTex("x_2", font_size=22).next_to(axes_e.y_axis, UP, 0.1)
         self.play(Create(axes_e), Write(xe_lab), Write(ye_lab))
 
-        ue = 5.5 / 8
-        uey = 4.5 / 6
-        ell_shape = Ellipse(width=2 * 3 * ue, height=2 * 2 * uey, color=GOLD, stroke_width=3, fill_opacity=0.1, fill_color=GOLD).move_to(axes_e.c2p(0, 0))
+        # {x : xᵀV⁻¹x ≤ 1} has semi-axes √λ(V) along V's eigenvectors
+        ell_e = confidence_ellipsoid(np.linalg.inv(np.diag([9.0, 4.0])), np.zeros(2))
+        ell_shape = Polygon(*[axes_e.c2p(*p) for p in ell_e.boundary()], color=GOLD, stroke_width=3, fill_opacity=0.1, fill_color=GOLD)
+        semi_1, semi_2 = (ell_e.centre + ell_e.radii[i] * ell_e.axes[:, i] for i in range(2))
         self.play(Create(ell_shape)); self.wait(1)
 
         # annotate semi-axes
         c = swap(c, "Semi-axis in x₁ direction:\n√9 = 3.")
-        sa_h = DoubleArrow(axes_e.c2p(0, 0), axes_e.c2p(3, 0), buff=0, color=GOLD, stroke_width=2, max_tip_length_to_length_ratio=0.06)
+        sa_h = DoubleArrow(axes_e.c2p(*ell_e.centre), axes_e.c2p(*semi_1), buff=0, color=GOLD, stroke_width=2, max_tip_length_to_length_ratio=0.06)
         sa_h_lbl = MathTex(r"\sqrt{9}=3", font_size=22, color=GOLD).next_to(sa_h, DOWN, 0.1)
         self.play(Create(sa_h), Write(sa_h_lbl)); self.wait(1.5)
 
         c = swap(c, "Semi-axis in x₂ direction:\n√4 = 2.")
-        sa_v = DoubleArrow(axes_e.c2p(0, 0), axes_e.c2p(0, 2), buff=0, color=GOLD, stroke_width=2, max_tip_length_to_length_ratio=0.08)
+        sa_v = DoubleArrow(axes_e.c2p(*ell_e.centre), axes_e.c2p(*semi_2), buff=0, color=GOLD, stroke_width=2, max_tip_length_to_length_ratio=0.08)
         sa_v_lbl = MathTex(r"\sqrt{4}=2", font_size=22, color=GOLD).next_to(sa_v, RIGHT, 0.1)
         self.play(Create(sa_v), Write(sa_v_lbl)); self.wait(1)
 
@@ -509,21 +533,24 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 13  SHRINKING ELLIPSOID
         # ═══════════════════════════════════════════════════════
+        self.next_section("13  SHRINKING ELLIPSOID")
         c = swap(None, "As we collect data,\nthe ellipsoid shrinks.")
         axes4 = Axes(x_range=[-4, 4, 1], y_range=[-4, 4, 1], x_length=6, y_length=6,
                      axis_config={"include_tip": True, "tip_length": 0.12, "include_numbers": False})
         th1 = MathTex(r"\theta_1", font_size=22).next_to(axes4.x_axis, RIGHT, 0.1)
         th2 = MathTex(r"\theta_2", font_size=22).next_to(axes4.y_axis, UP, 0.1)
         self.play(Create(axes4), Write(th1), Write(th2))
-        th_dot = Dot(axes4.c2p(0.5, -0.3), color=GOLD, radius=0.09)
+        theta_star = np.array([0.5, -0.3])
+        th_dot = Dot(axes4.c2p(*theta_star), color=GOLD, radius=0.09)
         th_lbl = MathTex(r"\theta^\star", font_size=24, color=GOLD).next_to(th_dot, UR, 0.08)
         self.play(FadeIn(th_dot), Write(th_lbl))
-        u4 = 6 / 8
-        ell_specs = [(2.8, 2.2, BLUE_A, "t=1"), (2.0, 1.5, BLUE_B, "t=5"), (1.2, 0.9, BLUE_C, "t=20"), (0.5, 0.4, BLUE_D, "t=100")]
+        # confidence sets of a simulated run (ridge λ = 1, β = 4), centred at θ̂_t
+        run = simulate(theta_star, T=100, beta=4.0, seed=0)
+        ell_specs = [(1, BLUE_A), (5, BLUE_B), (20, BLUE_C), (100, BLUE_D)]
         drawn = []
-        for w, h, col, lbl_text in ell_specs:
-            e = Ellipse(width=2*w*u4, height=2*h*u4, color=col, stroke_width=2.5, fill_opacity=0.08, fill_color=col).move_to(axes4.c2p(0.5, -0.3))
-            tlbl = MathTex(lbl_text, font_size=20, color=col).next_to(e, UR, 0.05)
+        for t, col in ell_specs:
+            e = Polygon(*[axes4.c2p(*p) for p in run[t - 1].boundary()], color=col, stroke_width=2.5, fill_opacity=0.08, fill_color=col)
+            tlbl = MathTex(f"t={t}", font_size=20, color=col).next_to(e, UR, 0.05)
             self.play(Create(e), Write(tlbl), run_time=0.8)
             for prev in drawn:
                 prev.set_stroke(opacity=0.25); prev.set_fill(opacity=0.02)
@@ -536,6 +563,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 14  LinUCB ALGORITHM
         # ═══════════════════════════════════════════════════════
+        self.next_section("14  LinUCB ALGORITHM")
         c = swap(None, "Now: how do we\nuse this to choose arms?")
         linucb_title = Text("LinUCB", font_size=42, color=BLUE).to_edge(UP, buff=0.5)
         self.play(Write(linucb_title)); self.wait(0.5)
@@ -565,6 +593,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 15  LinUCB INDEX + UPDATES
         # ═══════════════════════════════════════════════════════
+        self.next_section("15  LinUCB INDEX + UPDATES")
         c = swap(None, "So the LinUCB index\nfor each arm is:")
         ucb_formula = MathTex(r"\text{UCB}_t(a)", r"=", r"\langle x_t(a),\;\widehat{\theta}_{t-1} \rangle", r"+",
                               r"\sqrt{\beta_t}", r"\cdot \|x_t(a)\|_{V_{t-1}^{-1}}", font_size=28).move_to(UP * 1.5)
@@ -588,6 +617,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 16  WORKED EXAMPLE
         # ═══════════════════════════════════════════════════════
+        self.next_section("16  WORKED EXAMPLE")
         c = swap(None, "Let's walk through\na concrete example.")
         setup_title = Text("LinUCB Worked Example", font_size=32, color=BLUE).to_edge(UP, buff=0.5)
         self.play(Write(setup_title))
@@ -602,6 +632,31 @@ class ContextualBanditsVideo(Scene):
         self.play(Write(init)); self.wait(2)
         self.play(FadeOut(setup_title), FadeOut(setup_params), FadeOut(init))
 
+        # The example episode: θ* = (1, -1), noiseless rewards
+        ex_contexts = [[(1, 0), (0, 1)], [(0, 1), (1, 0)], [(1, 0), (0, 2)]]
+        ex_theta_star = (1, -1)
+        ep = run_episode(ex_contexts, ex_theta_star, lam=1.0, beta=1.0)
+
+        def ctx_caption(rd):
+            return f"Round {rd.t}: x(a₁)={fmt_vec(rd.X[0])},\nx(a₂)={fmt_vec(rd.X[1])}."
+
+        def ctx_group(rd, y):
+            return VGroup(MathTex(rd.context_tex(0), font_size=22, color=RED),
+                          MathTex(rd.context_tex(1), font_size=22, color=GREEN)).arrange(RIGHT, buff=0.8).move_to(UP * y)
+
+        def ucb_pair(rd, y):
+            return (MathTex(rd.ucb_tex(0), font_size=20, color=RED).move_to(LEFT * 2 + UP * y),
+                    MathTex(rd.ucb_tex(1), font_size=20, color=GREEN).move_to(RIGHT * 2 + UP * y))
+
+        def table_row(rd, y):
+            # pulled arm in green, a negative reward in red
+            cols = [WHITE] * len(col_x)
+            cols[3] = GREEN
+            if rd.reward < 0:
+                cols[4] = RED
+            return VGroup(*[Text(val, font_size=15, color=col).move_to(RIGHT * x_pos + UP * y)
+                            for x_pos, val, col in zip(col_x, rd.row(), cols)])
+
         # TABLE HEADER
         col_x = [-5.2, -3.2, -1.2, 0.8, 2.3, 3.8, 5.3]
         header_texts = ["t", "UCB(a₁)", "UCB(a₂)", "Pull", "rₜ", "θ̂ₜ", "Vₜ diag"]
@@ -610,63 +665,58 @@ class ContextualBanditsVideo(Scene):
         self.play(FadeIn(headers), Create(header_line))
 
         # ──── ROUND 1 ────
-        c = swap(c, "Round 1: x(a₁)=(1,0),\nx(a₂)=(0,1).")
-        ctx_r1 = VGroup(MathTex(r"x(a_1)=(1,0)", font_size=22, color=RED), MathTex(r"x(a_2)=(0,1)", font_size=22, color=GREEN)).arrange(RIGHT, buff=0.8).move_to(UP * 1.7)
+        c = swap(c, ctx_caption(ep[0]))
+        ctx_r1 = ctx_group(ep[0], 1.7)
         self.play(FadeIn(ctx_r1)); self.wait(0.8)
 
         c = swap(c, "Both UCBs equal 1.\nTie-break: pull arm 1.")
-        ucb1_calc = MathTex(r"0 + 1 \cdot 1 = 1.0", font_size=20, color=RED).move_to(LEFT * 2 + UP * 0.9)
-        ucb2_calc = MathTex(r"0 + 1 \cdot 1 = 1.0", font_size=20, color=GREEN).move_to(RIGHT * 2 + UP * 0.9)
+        ucb1_calc, ucb2_calc = ucb_pair(ep[0], 0.9)
         self.play(Write(ucb1_calc), Write(ucb2_calc)); self.wait(1)
 
-        r1_data = ["1", "1.00", "1.00", "a₁", "1", "(0.5, 0)", "(2, 1)"]
-        row1 = VGroup(*[Text(val, font_size=15, color=(GREEN if val == "a₁" else WHITE)).move_to(RIGHT * x_pos + UP * 1.8) for x_pos, val in zip(col_x, r1_data)])
+        row1 = table_row(ep[0], 1.8)
         self.play(FadeOut(ctx_r1), FadeOut(ucb1_calc), FadeOut(ucb2_calc), FadeIn(row1)); self.wait(1)
 
         # ──── ROUND 2 ────
-        c = swap(c, "Round 2: x(a₁)=(0,1),\nx(a₂)=(1,0).")
-        ctx_r2 = VGroup(MathTex(r"x(a_1)=(0,1)", font_size=22, color=RED), MathTex(r"x(a_2)=(1,0)", font_size=22, color=GREEN)).arrange(RIGHT, buff=0.8).move_to(UP * 0.9)
+        c = swap(c, ctx_caption(ep[1]))
+        ctx_r2 = ctx_group(ep[1], 0.9)
         self.play(FadeIn(ctx_r2)); self.wait(0.5)
 
         c = swap(c, "Arm 2 has higher UCB\nthanks to the exploit term.")
-        ucb1_r2 = MathTex(r"0 + \sqrt{1} = 1.0", font_size=20, color=RED).move_to(LEFT * 2 + UP * 0.1)
-        ucb2_r2 = MathTex(r"0.5 + \sqrt{0.5} \approx 1.21", font_size=20, color=GREEN).move_to(RIGHT * 2 + UP * 0.1)
+        ucb1_r2, ucb2_r2 = ucb_pair(ep[1], 0.1)
         self.play(Write(ucb1_r2), Write(ucb2_r2)); self.wait(1)
 
-        r2_data = ["2", "1.00", "1.21", "a₂", "1", "(0.67, 0)", "(3, 1)"]
-        row2 = VGroup(*[Text(val, font_size=15, color=(GREEN if val == "a₂" else WHITE)).move_to(RIGHT * x_pos + UP * 1.3) for x_pos, val in zip(col_x, r2_data)])
+        row2 = table_row(ep[1], 1.3)
         self.play(FadeOut(ctx_r2), FadeOut(ucb1_r2), FadeOut(ucb2_r2), FadeIn(row2)); self.wait(1)
 
         # ──── ROUND 3 ────
-        c = swap(c, "Round 3: x(a₁)=(1,0),\nx(a₂)=(0,2).")
-        ctx_r3 = VGroup(MathTex(r"x(a_1)=(1,0)", font_size=22, color=RED), MathTex(r"x(a_2)=(0,2)", font_size=22, color=GREEN)).arrange(RIGHT, buff=0.8).move_to(UP * 0.5)
+        c = swap(c, ctx_caption(ep[2]))
+        ctx_r3 = ctx_group(ep[2], 0.5)
         self.play(FadeIn(ctx_r3)); self.wait(0.5)
 
         c = swap(c, "Arm 2 has huge\nuncertainty in direction 2.\nHigh exploration bonus!")
-        ucb1_r3 = MathTex(r"0.67 + \sqrt{1/3} \approx 1.24", font_size=20, color=RED).move_to(LEFT * 2 + DOWN * 0.3)
-        ucb2_r3 = MathTex(r"0 + \sqrt{4} = 2.0", font_size=20, color=GREEN).move_to(RIGHT * 2 + DOWN * 0.3)
+        ucb1_r3, ucb2_r3 = ucb_pair(ep[2], -0.3)
         self.play(Write(ucb1_r3), Write(ucb2_r3)); self.wait(1.5)
 
-        r3_data = ["3", "1.24", "2.00", "a₂", "-2", "(0.67, -0.8)", "(3, 5)"]
-        row3 = VGroup(*[Text(val, font_size=15, color=(GREEN if val == "a₂" else (RED if val == "-2" else WHITE))).move_to(RIGHT * x_pos + UP * 0.8) for x_pos, val in zip(col_x, r3_data)])
+        row3 = table_row(ep[2], 0.8)
         self.play(FadeOut(ctx_r3), FadeOut(ucb1_r3), FadeOut(ucb2_r3), FadeIn(row3)); self.wait(1)
 
         c = swap(c, "Reward = -2!\nBut now we learned\nthat θ*₂ is negative.")
         conv_box = SurroundingRectangle(row3[5], color=GOLD, buff=0.08, stroke_width=2)
-        conv_note = MathTex(r"\widehat{\theta}_3 = (0.67,\;-0.8) \;\approx\; \theta^\star = (1,\;-1)", font_size=22, color=GOLD).move_to(DOWN * 0.1)
+        conv_note = MathTex(r"\widehat{\theta}_" + str(ep[-1].t) + " = " + fmt_vec(ep[-1].theta) + r" \;\approx\; \theta^\star = " + fmt_vec(ex_theta_star), font_size=22, color=GOLD).move_to(DOWN * 0.1)
         self.play(Create(conv_box), Write(conv_note)); self.wait(2)
         clear()
 
         # ═══════════════════════════════════════════════════════
         # 17  WHAT THE EXAMPLE SHOWS
         # ═══════════════════════════════════════════════════════
+        self.next_section("17  WHAT THE EXAMPLE SHOWS")
         c = swap(None, "Notice the pattern:")
         takeaway = VGroup(
             VGroup(Text("1.", font_size=24, color=BLUE), Text("Round 1-2: explore both", font_size=22), Text("coordinate directions", font_size=22)).arrange(RIGHT, buff=0.15),
             VGroup(Text("2.", font_size=24, color=BLUE), Text("Round 3: high uncertainty", font_size=22), Text("in direction 2 → explore it", font_size=22)).arrange(RIGHT, buff=0.15),
             VGroup(Text("3.", font_size=24, color=BLUE), Text("Negative reward teaches us", font_size=22), Text("θ*₂ < 0 — information gain!", font_size=22)).arrange(RIGHT, buff=0.15),
             VGroup(Text("4.", font_size=24, color=BLUE), Text("θ̂ converges:", font_size=22),
-                   MathTex(r"(0,0) \to (0.5,0) \to (0.67,0) \to (0.67,-0.8)", font_size=20)).arrange(RIGHT, buff=0.15),
+                   MathTex(r" \to ".join(fmt_vec(th) for th in [ep[0].theta_prev] + [rd.theta for rd in ep]), font_size=20)).arrange(RIGHT, buff=0.15),
         ).arrange(DOWN, buff=0.4, aligned_edge=LEFT).move_to(UP * 0.5)
         for b in takeaway:
             self.play(FadeIn(b), run_time=0.7); self.wait(0.6)
@@ -677,6 +727,7 @@ class ContextualBanditsVideo(Scene):
         # ═══════════════════════════════════════════════════════
         # 18  RECAP
         # ═══════════════════════════════════════════════════════
+        self.next_section("18  RECAP")
         c = swap(None, "Putting it all together:")
         bullets = VGroup(
             VGroup(Text("1.", font_size=24, color=BLUE), Text("Context vectors let the best", font_size=22), Text("arm change each round", font_size=22)).arrange(RIGHT, buff=0.15),
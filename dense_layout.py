@@ -0,0 +1,48 @@
+import numpy as np
+
+# ── Dense layer geometry ──
+# The numbers behind nn_diagram.DenseEdges / NetworkDiagram, without manim:
+# neuron columns, the strongest-k edge selection and the quantisation of
+# signed weights into `bins` stroke styles.  Level 0 is the most negative
+# weight, bins - 1 the most positive and (bins - 1) / 2 zero.
+#
+#     rows, cols, level = edge_levels(W, bins=9, max_edges=4000)
+#     starts, ends = src[cols], dst[rows]            # W[i, j] is src j -> dst i
+
+
+def layer_points(n, x, height=6.0, spacing=1.1):
+    """Centres of `n` neurons in a column at `x`, squeezed to fit `height`."""
+    step = min(spacing, height / max(n - 1, 1))
+    y = (np.arange(n) - (n - 1) / 2) * -step
+    return np.column_stack([np.full(n, float(x)), y, np.zeros(n)])
+
+
+def strongest(weights, max_edges):
+    """Flat indices of the `max_edges` largest |w| (all indices if there are fewer)."""
+    flat = np.abs(np.asarray(weights, dtype=float)).ravel()
+    if max_edges is None or flat.size <= max_edges:
+        return np.arange(flat.size)
+    return np.sort(np.argpartition(flat, -max_edges)[-max_edges:])
+
+
+def edge_levels(weights, bins=9, max_edges=None):
+    """Target row, source column and style level of every kept edge of W (n_dst, n_src)."""
+    weights = np.asarray(weights, dtype=float)
+    keep = strongest(weights, max_edges)
+    rows, cols = np.divmod(keep, weights.shape[1])
+    w = weights.ravel()[keep]
+    scale = np.abs(w).max() if len(w) else 0.0
+    t = w / scale if scale > 0 else np.zeros_like(w)
+    level = np.rint((t + 1) / 2 * (bins - 1)).astype(int)
+    return rows, cols, level
+
+
+def level_weight(level, bins):
+    """The signed weight in [-1, 1] a style level stands for."""
+    return 2 * level / (bins - 1) - 1 if bins > 1 else 1.0
+
+
+def line_curves(starts, ends):
+    """Straight segments as cubic Bézier points, four rows per segment."""
+    d = ends - starts
+    return np.stack([starts, starts + d / 3, starts + 2 * d / 3, ends], axis=1).reshape(-1, 3)
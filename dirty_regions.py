@@ -0,0 +1,91 @@
+import numpy as np
+
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+# ── Dirty-region rasterisation ──
+# Manim rasterises the "static" mobjects of a play() once into a background
+# image and redraws only the "moving" ones each frame.  But it counts every
+# mobject drawn after the first animated one as moving, so Indicate on a dot
+# that was added early re-rasterises the whole diagram on top of it.
+#
+# DirtyRegionMixin narrows the moving set to the animated mobjects plus the
+# ones above them whose bounding box overlaps the dirty region (start and
+# target boxes of everything animated, padded for Indicate-style scaling).
+# Everything else is baked into the cached background.  When the region
+# can't be bounded up front (updaters, camera moves) it keeps manim's result.
+#
+#     class MDPVideo(DirtyRegionMixin, Scene): ...
+
+
+def _boxes(mobs):
+    out = []
+    for m in mobs:
+        for leaf in m.get_family():
+            if len(leaf.points):
+                out.append((leaf.points[:, :2].min(axis=0), leaf.points[:, :2].max(axis=0)))
+    return out
+
+
+def animation_extent(anim, out):
+    """Collect every mobject whose area `anim` may touch."""
+    for attr in ("mobject", "target_mobject", "starting_mobject", "path"):
+        mob = getattr(anim, attr, None)
+        if mob is not None:
+            out.append(mob)
+            target = getattr(mob, "target", None)
+            if target is not None:
+                out.append(target)
+    for sub in getattr(anim, "animations", ()):
+        animation_extent(sub, out)
+    return out
+
+
+class DirtyRegionMixin:
+    dirty_scale = 1.3       # Indicate scales to 1.2 by default
+    dirty_margin = 0.1      # stroke widths and antialiasing
+
+    def get_moving_and_static_mobjects(self, animations):
+        moving, static = super().get_moving_and_static_mobjects(animations)
+        if not moving:
+            return moving, static
+        extent = []
+        for anim in animations:
+            animation_extent(anim, extent)
+        frame = getattr(self.camera, "frame", None)
+        animated = set()
+        for mob in extent:
+            animated.update(mob.get_family())
+        if frame is not None and frame in animated:
+            return moving, static
+        if any(m.get_family_updaters() for m in self.mobjects) or self.foreground_mobjects:
+            return moving, static
+
+        dirty = _boxes(extent)
+        if not dirty:
+            return moving, static
+        lo = np.array([b[0] for b in dirty])
+        hi = np.array([b[1] for b in dirty])
+        centre, half = (lo + hi) / 2, (hi - lo) / 2 * self.dirty_scale + self.dirty_margin
+        lo, hi = centre - half, centre + half
+
+        keep = []
+        for m in moving:
+            if m in animated:
+                keep.append(m)
+                continue
+            if not len(m.points):
+                continue
+            m_lo, m_hi = m.points[:, :2].min(axis=0), m.points[:, :2].max(axis=0)
+            if np.any(np.all((m_lo <= hi) & (m_hi >= lo), axis=1)):
+                keep.append(m)
+        if len(keep) == len(moving):
+            return moving, static
+
+        kept = set(keep)
+        everything = extract_mobject_family_members(
+            list_update(self.mobjects, self.foreground_mobjects),
+            use_z_index=self.renderer.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        return keep, [m for m in everything if m not in kept]
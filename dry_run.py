@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import manim
+
+import render_sections
+from play_profiler import caller_tag
+
+# ── Plan-only dry run ──
+# Runs construct() with every section skipped: animations jump straight to
+# their end state and nothing is rasterised or encoded, so a full video
+# replays in seconds.  Every play/wait is recorded on a timeline with its
+# run time, source line and the mobjects it touched, together with section
+# boundaries and the caption on screen at each moment.
+#
+# Captions are recognised as Text mobjects sitting in the band along the
+# bottom edge of the frame, which is where every scene's caption helper
+# puts them (`to_edge(DOWN, buff=0.25..0.45)`).
+#
+#     python dry_run.py LimitsVideo
+#     python dry_run.py ContextualBanditsVideo --json cb_timeline.json --strict
+
+CAPTION_BAND = 0.8          # scene units above the bottom edge
+READING_SPEED = 15.0        # characters per second a viewer can comfortably read
+
+
+def _describe(mob):
+    text = getattr(mob, "original_text", None) or getattr(mob, "text", None)
+    if text is None:
+        text = getattr(mob, "tex_string", None)
+    name = type(mob).__name__
+    return f"{name}({' '.join(str(text).split())[:40]!r})" if text else name
+
+
+def _animation_mobjects(args):
+    out = []
+    for a in args:
+        mob = getattr(a, "mobject", None)
+        if mob is not None:
+            out.append(_describe(mob))
+    return out
+
+
+def captions_on_screen(scene):
+    bottom = -manim.config.frame_height / 2 + CAPTION_BAND
+    frame = getattr(scene.camera, "frame", None)
+    if frame is not None:
+        bottom = frame.get_bottom()[1] + CAPTION_BAND * frame.height / manim.config.frame_height
+    out = []
+    for m in scene.mobjects:
+        if isinstance(m, manim.Text) and m.get_bottom()[1] < bottom and m.get_fill_opacity() > 0:
+            out.append(" ".join((getattr(m, "original_text", None) or m.text).split()))
+    return out
+
+
+class Timeline:
+    def __init__(self):
+        self.t = 0.0
+        self.events = []
+        self.sections = []
+        self.captions = []       # [text, start, end]
+        self._open = {}          # caption text -> index into self.captions
+        self._depth = 0
+
+    def start_section(self, name):
+        if self.sections:
+            self.sections[-1]["end"] = self.t
+        self.sections.append({"name": name, "start": self.t, "end": None})
+
+    def run(self, scene, kind, fn, args, kwargs):
+        if self._depth:
+            return fn(*args, **kwargs)
+        tag = caller_tag(3)
+        before = set(captions_on_screen(scene))
+        self._depth += 1
+        try:
+            fn(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        start, self.t = self.t, self.t + float(scene.duration)
+        after = set(captions_on_screen(scene))
+        for text in after - before:
+            self._open[text] = len(self.captions)
+            self.captions.append([text, start, None])
+        for text in before - after:
+            self.captions[self._open.pop(text)][2] = self.t
+        self.events.append({
+            "start": start, "end": self.t, "kind": kind, "tag": tag,
+            "section": self.sections[-1]["name"] if self.sections else None,
+            "mobjects": _animation_mobjects(args) if kind == "play" else [],
+        })
+
+    def finish(self):
+        if self.sections:
+            self.sections[-1]["end"] = self.t
+        for i in self._open.values():
+            self.captions[i][2] = self.t
+        self._open.clear()
+
+    def caption_at(self, t):
+        return [text for text, a, b in self.captions if a <= t < b]
+
+    def short_captions(self, speed=READING_SPEED):
+        """Captions that leave the screen before they can be read at `speed` chars/s."""
+        return [(text, a, b) for text, a, b in self.captions if b - a < len(text) / speed]
+
+    def to_json(self):
+        return {"duration": self.t, "sections": self.sections, "events": self.events,
+                "captions": [{"text": c, "start": a, "end": b} for c, a, b in self.captions]}
+
+
+def timeline_scene(scene_cls, timeline):
+    """Subclass of `scene_cls` that skips every section and records `timeline`."""
+
+    class TimelineScene(scene_cls):
+        def setup(self):
+            super().setup()
+            super().next_section("prelude", skip_animations=True)
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            timeline.start_section(name)
+            super().next_section(name, skip_animations=True)
+
+        def play(self, *args, **kwargs):
+            timeline.run(self, "play", super().play, args, kwargs)
+
+        def wait(self, *args, **kwargs):
+            timeline.run(self, "wait", super().wait, args, kwargs)
+
+    TimelineScene.__name__ = f"{scene_cls.__name__}_dry"
+    return TimelineScene
+
+
+def dry_run(name):
+    timeline = Timeline()
+    cfg = {
+        "media_dir": os.path.join(render_sections.ROOT, "media", "dry_run"),
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+        "progress_bar": "none",
+    }
+    with manim.tempconfig(cfg):
+        timeline_scene(render_sections.load_scene(name), timeline)().render()
+    timeline.finish()
+    return timeline
+
+
+def fmt_time(t):
+    return f"{int(t // 60)}:{t % 60:05.2f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute a scene's timeline without rendering frames.")
+    parser.add_argument("scene", choices=sorted(render_sections.SCENES))
+    parser.add_argument("--json", help="write the full timeline here")
+    parser.add_argument("--events", action="store_true", help="print every play/wait")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit non-zero if a caption is on screen too briefly to read")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tl = dry_run(args.scene)
+    elapsed = time.perf_counter() - start
+
+    for s in tl.sections:
+        print(f"{fmt_time(s['start'])} - {fmt_time(s['end'])}  {s['name']}")
+    print(f"total {fmt_time(tl.t)} ({len(tl.events)} play/wait calls, computed in {elapsed:.1f}s)")
+    if args.events:
+        for e in tl.events:
+            print(f"  {fmt_time(e['start'])} +{e['end'] - e['start']:.2f}s {e['kind']:<4} {e['tag']:<24} "
+                  + ", ".join(e["mobjects"]))
+    print("captions:")
+    for text, a, b in tl.captions:
+        print(f"  {fmt_time(a)} - {fmt_time(b)}  {text}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(tl.to_json(), f, indent=1)
+
+    short = tl.short_captions()
+    for text, a, b in short:
+        print(f"WARNING caption at {fmt_time(a)} shown {b - a:.1f}s, needs {len(text) / READING_SPEED:.1f}s: {text}")
+    if args.strict and short:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import numpy as np
+
+# ── ε–N analysis of sequences ──
+# A sequence is a vectorised a(n) over an integer index array (n = 1, 2, ...),
+# or the partial sums of vectorised terms(k).  find_N returns the smallest N
+# with |a_n − L| < ε for every N < n ≤ n_max, scanning in fixed-size chunks so
+# 1e8 terms never sit in memory at once.  When |a_n − L| is known to be
+# eventually non-increasing (monotone=True) the scan stops at the first term
+# inside the band; for a closed-form a(n) that is a galloping search, so even
+# N ≈ 1e8 costs a few dozen evaluations.
+#
+#     fit = EpsilonN(SEQUENCES["1/n"], eps=0.2, n_show=20)
+#     fit.N, fit.before, fit.after          # 5, n = 1..5, n = 6..20
+
+
+class Sequence:
+    def __init__(self, a=None, terms=None, limit=0.0, tex=None):
+        if (a is None) == (terms is None):
+            raise ValueError("give exactly one of a(n) or terms(k)")
+        self.a, self.terms = a, terms
+        self.limit = float(limit)
+        self.tex = tex
+
+    def chunks(self, n_max, chunk):
+        """(n, a_n) blocks covering n = 1..n_max in order."""
+        total = 0.0
+        for start in range(1, n_max + 1, chunk):
+            n = np.arange(start, min(start + chunk, n_max + 1), dtype=np.int64)
+            if self.a is not None:
+                yield n, np.asarray(self.a(n), dtype=float)
+            else:
+                s = np.cumsum(np.asarray(self.terms(n), dtype=float))
+                s += total
+                total = s[-1]
+                yield n, s
+
+    def head(self, n_show):
+        """a_1..a_{n_show}."""
+        return next(self.chunks(n_show, n_show))[1]
+
+
+def _sign(n):
+    return np.where(n % 2, -1.0, 1.0)
+
+
+SEQUENCES = {
+    "1/n": Sequence(a=lambda n: 1.0 / n, tex=r"\frac{1}{n}"),
+    "1/sqrt(n)": Sequence(a=lambda n: 1.0 / np.sqrt(n), tex=r"\frac{1}{\sqrt{n}}"),
+    "(-1)^n/n": Sequence(a=lambda n: _sign(n) / n, tex=r"\frac{(-1)^n}{n}"),
+    "alternating harmonic": Sequence(terms=lambda k: -_sign(k) / k, limit=np.log(2),
+                                     tex=r"\sum_{k=1}^{n} \frac{(-1)^{k+1}}{k}"),
+}
+
+
+def _first_inside(seq, eps, n_max):
+    """Galloping search for the first n with |a_n − L| < ε (errors non-increasing)."""
+    def inside(n):
+        return abs(float(seq.a(np.array([n], dtype=np.int64))[0]) - seq.limit) < eps
+
+    if inside(1):
+        return 1
+    lo, hi = 1, 2
+    while hi < n_max and not inside(hi):
+        lo, hi = hi, 2 * hi
+    hi = min(hi, n_max)
+    if not inside(hi):
+        return None
+    while hi - lo > 1:          # inside(hi) and not inside(lo)
+        mid = (lo + hi) // 2
+        if inside(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+def find_N(seq, eps, n_max=10**8, chunk=1 << 20, monotone=False):
+    """Smallest N with |a_n − L| < ε for all N < n ≤ n_max."""
+    if eps <= 0:
+        raise ValueError("eps must be positive")
+    n_max = int(n_max)
+    if monotone and seq.a is not None:
+        first = _first_inside(seq, eps, n_max)
+        if first is None:
+            raise ValueError(f"sequence does not enter the {eps:g}-band by n = {n_max}")
+        return first - 1
+
+    last_out = 0
+    for n, a in seq.chunks(n_max, chunk):
+        out = np.flatnonzero(np.abs(a - seq.limit) >= eps)
+        if monotone and len(out) < len(n):
+            # first term inside the band: nothing after it leaves again
+            inside = np.flatnonzero(np.abs(a - seq.limit) < eps)[0]
+            return int(n[inside]) - 1
+        if len(out):
+            last_out = int(n[out[-1]])
+    if last_out == n_max:
+        raise ValueError(f"sequence does not enter the {eps:g}-band by n = {n_max}")
+    return last_out
+
+
+class EpsilonN:
+    """Everything the sequence graph needs: terms 1..n_show, the band and the cutoff N."""
+
+    def __init__(self, seq, eps, n_show=20, n_max=10**6, monotone=False, chunk=1 << 20):
+        self.seq, self.eps, self.limit = seq, float(eps), seq.limit
+        self.N = find_N(seq, eps, n_max=n_max, chunk=chunk, monotone=monotone)
+        self.n = np.arange(1, n_show + 1)
+        self.a = seq.head(n_show)
+        self.inside = np.abs(self.a - self.limit) < self.eps
+
+    @property
+    def before(self):
+        return self.n[self.n <= self.N]
+
+    @property
+    def after(self):
+        return self.n[self.n > self.N]
+
+    @property
+    def band(self):
+        return self.limit - self.eps, self.limit + self.eps
+
+    def points(self, ns):
+        """(n, a_n) pairs for the given indices (1-based, within n_show)."""
+        return [(int(k), float(self.a[k - 1])) for k in ns]
+
+
+# ── ε–δ for functions ──
+# δ(ε) = the largest δ with |f(x) − L| < ε whenever 0 < |x − c| < δ.  The
+# worst error over the punctured interval, sup_{0<|x−c|<h} |f(x) − L|, is
+# non-decreasing in h, so DeltaSolver samples f once on a geometric grid of
+# offsets on both sides of c and keeps its running maximum.  δ for any ε is
+# then a searchsorted into that profile plus a bisection inside the bracket,
+# vectorised over a whole array of ε values, so an ε-sweep costs one f call
+# per bisection step for all frames together.
+#
+#     solver = DeltaSolver(lambda x: x**2, c=2, L=4)
+#     fit = solver.solve(1.0)         # fit.delta ≈ √5 − 2, fit.band, fit.strip
+
+
+class DeltaSolver:
+    def __init__(self, f, c, L, delta_max=1.0, samples=4096, smallest=1e-9):
+        self.f, self.c, self.L = f, float(c), float(L)
+        self.delta_max = float(delta_max)
+        self.h = np.geomspace(smallest * delta_max, delta_max, samples)
+        err = self.error(self.h)
+        self.sup = np.maximum.accumulate(err)
+
+    def error(self, h):
+        """max(|f(c − h) − L|, |f(c + h) − L|), elementwise."""
+        h = np.asarray(h, dtype=float)
+        left = np.abs(np.asarray(self.f(self.c - h), dtype=float) - self.L)
+        right = np.abs(np.asarray(self.f(self.c + h), dtype=float) - self.L)
+        return np.maximum(left, right)
+
+    def deltas(self, eps, iters=50):
+        """Largest valid δ ≤ delta_max for every ε in `eps`."""
+        eps = np.atleast_1d(np.asarray(eps, dtype=float))
+        if np.any(eps <= 0):
+            raise ValueError("eps must be positive")
+        i = np.searchsorted(self.sup, eps, side="left")    # first grid offset that fails
+        if np.any(i == 0):
+            raise ValueError(f"|f(x) - L| >= eps arbitrarily close to c = {self.c:g}; is L the limit?")
+        done = i == len(self.h)
+        i = np.minimum(i, len(self.h) - 1)
+        lo, hi = self.h[i - 1], self.h[i]
+        for _ in range(iters):
+            mid = (lo + hi) / 2
+            bad = self.error(mid) >= eps
+            hi = np.where(bad, mid, hi)
+            lo = np.where(bad, lo, mid)
+        return np.where(done, self.delta_max, lo)
+
+    def solve(self, eps):
+        return EpsilonDelta(self, float(eps), float(self.deltas(eps)[0]))
+
+    def sweep(self, eps_values):
+        eps_values = np.asarray(eps_values, dtype=float)
+        return [EpsilonDelta(self, e, d) for e, d in zip(eps_values, self.deltas(eps_values))]
+
+
+class EpsilonDelta:
+    """Geometry for one frame: the ε-band, the δ-strip and the curve inside the strip."""
+
+    def __init__(self, solver, eps, delta):
+        self.solver, self.eps, self.delta = solver, eps, delta
+        self.c, self.L = solver.c, solver.L
+
+    @property
+    def band(self):
+        return self.L - self.eps, self.L + self.eps
+
+    @property
+    def strip(self):
+        return self.c - self.delta, self.c + self.delta
+
+    def band_corners(self, x_min, x_max):
+        lo, hi = self.band
+        return [(x_min, lo), (x_max, lo), (x_max, hi), (x_min, hi)]
+
+    def strip_corners(self, y_min, y_max):
+        lo, hi = self.strip
+        return [(lo, y_min), (hi, y_min), (hi, y_max), (lo, y_max)]
+
+    def curve(self, n=101):
+        """(x, f(x)) samples of the graph over the strip."""
+        x = np.linspace(*self.strip, n)
+        return x, np.asarray(self.solver.f(x), dtype=float)
@@ -0,0 +1,97 @@
+import numpy as np
+
+import manim
+
+# ── Batched style animation ──
+# `*[m.animate.set_opacity(op) for m in group]` builds one animation (and one
+# deep copy of the starting mobject) per member, and every frame walks all of
+# them.  GroupStyle packs the fill / stroke / background-stroke RGBA rows of
+# every VMobject in the family into one array, interpolates that array with
+# a single NumPy expression per frame and copies the rows back in place.
+#
+#     self.play(GroupStyle(*self.mdp_group, opacity=0.12), run_time=0.6)
+#
+# Pass on-screen members unpacked: a single mobject is animated as itself,
+# so a fresh VGroup(*members) would be added to the scene on top of everything.
+
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+class GroupStyle(manim.Animation):
+    def __init__(self, *mobjects, opacity=None, color=None, fill_opacity=None,
+                 stroke_opacity=None, **kwargs):
+        # several mobjects share a wrapper Group that never enters the scene
+        self._temporary = len(mobjects) != 1
+        mobject = manim.Group(*mobjects) if self._temporary else mobjects[0]
+        self.style = {"opacity": opacity, "color": color,
+                      "fill_opacity": fill_opacity, "stroke_opacity": stroke_opacity}
+        super().__init__(mobject, **kwargs)
+
+    def _target(self, start, attr):
+        end = start.copy()
+        s = self.style
+        if s["color"] is not None:
+            end[:, :3] = manim.color_to_rgb(s["color"])
+        opacity = s["fill_opacity"] if attr == "fill_rgbas" else s["stroke_opacity"]
+        if opacity is None:
+            opacity = s["opacity"]
+        if opacity is not None:
+            end[:, 3] = opacity
+        return end
+
+    def begin(self):
+        self.slices, starts, ends = [], [], []
+        row = 0
+        for m in self.mobject.get_family():
+            if not isinstance(m, manim.VMobject):
+                continue
+            for attr in STYLE_ARRAYS:
+                arr = getattr(m, attr, None)
+                if arr is None or not len(arr):
+                    continue
+                self.slices.append((arr, row, row + len(arr)))
+                starts.append(arr.copy())
+                ends.append(self._target(arr, attr))
+                row += len(arr)
+        self.start = np.concatenate(starts) if starts else np.zeros((0, 4))
+        self.delta = (np.concatenate(ends) if ends else self.start) - self.start
+        self.current = np.empty_like(self.start)
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def interpolate_mobject(self, alpha):
+        np.multiply(self.delta, self.rate_func(alpha), out=self.current)
+        self.current += self.start
+        for arr, a, b in self.slices:
+            arr[...] = self.current[a:b]
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    # The members are already on screen in their own z-order, so the wrapper is
+    # not appended like an introduced mobject (that would redraw them on top).
+    # It is slotted into scene.mobjects just before the first member instead:
+    # the members then count as moving without changing the draw order, and
+    # only the wrapper itself is taken out again afterwards.
+    def is_introducer(self):
+        return self._temporary or super().is_introducer()
+
+    def _setup_scene(self, scene):
+        if not self._temporary:
+            return super()._setup_scene(scene)
+        if scene is None:
+            return
+        on_screen = set(scene.get_mobject_family_members())
+        missing = [m for m in self.mobject.submobjects if m not in on_screen]
+        if missing:
+            scene.add(*missing)
+        members = set(self.mobject.submobjects)
+        i = next((i for i, top in enumerate(scene.mobjects) if members & set(top.get_family())), None)
+        if i is not None:
+            scene.mobjects.insert(i, self.mobject)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self._temporary and scene is not None and self.mobject in scene.mobjects:
+            scene.mobjects.remove(self.mobject)
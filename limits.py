@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from adaptive_plot import plot
+from epsilon import SEQUENCES, DeltaSolver, EpsilonN
+from tex_cache import MathTex
+
 class LimitsVideo(Scene):
     def construct(self):
         self.camera.background_color = "#1a1a2e"
@@ -15,6 +19,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 1: Title
         # ═══════════════════════════════════════
+        self.next_section("SCENE 1: Title")
         title = Text("Limits of Sequences\nand Functions", font_size=52, line_spacing=1.3)
         subtitle = Text("An Introduction", font_size=30, color=GREY_B).next_to(title, DOWN, buff=0.5)
         self.play(Write(title), run_time=2)
@@ -26,6 +31,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 2: Motivation
         # ═══════════════════════════════════════
+        self.next_section("SCENE 2: Motivation")
         cap1 = caption("Imagine a sequence\nof numbers...")
         seq_tex = MathTex(r"a_1,\; a_2,\; a_3,\; \dots", font_size=48)
         self.play(Write(seq_tex), FadeIn(cap1))
@@ -44,6 +50,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 3: Epsilon-N definition
         # ═══════════════════════════════════════
+        self.next_section("SCENE 3: Epsilon-N definition")
         def_title = Text("Definition: Limit of a Sequence", font_size=36, color=BLUE_B)
         def_title.to_edge(UP, buff=0.5)
         self.play(Write(def_title))
@@ -91,6 +98,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 4: Intuition paragraph
         # ═══════════════════════════════════════
+        self.next_section("SCENE 4: Intuition paragraph")
         intuition_lines = [
             Text("No matter how small", font_size=30),
             Text("a tolerance ε you pick,", font_size=30),
@@ -109,6 +117,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 5: Example a_n = 1/n (detailed)
         # ═══════════════════════════════════════
+        self.next_section("SCENE 5: Example a_n = 1/n (detailed)")
         ex_title = Text("Example", font_size=36, color=GREEN_B).to_edge(UP, buff=0.5)
         ex_seq = MathTex(r"a_n = \frac{1}{n}", font_size=44).next_to(ex_title, DOWN, buff=0.35)
         ex_claim = MathTex(r"\text{Prove: } \lim_{n\to\infty} a_n = 0", font_size=38).next_to(ex_seq, DOWN, buff=0.25)
@@ -127,9 +136,9 @@ class LimitsVideo(Scene):
         self.wait(1.5)
 
         # Step 2: Choose N
-        cap7b = caption("Choose N > 1/ε.")
+        cap7b = caption("Choose N ≥ 1/ε.")
         pf_choose = MathTex(
-            r"\text{Choose } N > \frac{1}{\epsilon}.",
+            r"\text{Choose } N \ge \frac{1}{\epsilon}.",
             font_size=34
         ).next_to(pf_let, DOWN, buff=0.3)
         self.play(ReplacementTransform(cap7a, cap7b), Write(pf_choose))
@@ -148,8 +157,8 @@ class LimitsVideo(Scene):
             r"|a_n - 0|",
             r"= \left|\frac{1}{n}\right|",
             r"= \frac{1}{n}",
-            r"\le \frac{1}{N}",
-            r"< \epsilon",
+            r"< \frac{1}{N}",
+            r"\le \epsilon",
             font_size=34
         ).next_to(pf_impl_header, DOWN, buff=0.3)
 
@@ -161,12 +170,12 @@ class LimitsVideo(Scene):
         self.play(Write(pf_chain[2]))
         self.wait(0.5)
 
-        cap8b = caption("Since n > N,\nwe have 1/n ≤ 1/N.")
+        cap8b = caption("Since n > N,\nwe have 1/n < 1/N.")
         self.play(ReplacementTransform(cap8, cap8b))
         self.play(Write(pf_chain[3]))
         self.wait(1)
 
-        cap8c = caption("And N > 1/ε means\n1/N < ε.")
+        cap8c = caption("And N ≥ 1/ε means\n1/N ≤ ε.")
         self.play(ReplacementTransform(cap8b, cap8c))
         self.play(Write(pf_chain[4]))
         self.wait(2)
@@ -185,9 +194,15 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 6: Graph of a_n = 1/n
         # ═══════════════════════════════════════
+        self.next_section("SCENE 6: Graph of a_n = 1/n")
         graph_title = Text("Visualizing the Limit", font_size=36, color=BLUE_B).to_edge(UP, buff=0.4)
         self.play(Write(graph_title))
 
+        # ε-band, cutoff N and the plotted terms, all computed from the sequence
+        fit = EpsilonN(SEQUENCES["1/n"], eps=0.2, n_show=20)
+        eps_lo, eps_hi = fit.band
+        N = fit.N
+
         axes = Axes(
             x_range=[0, 21, 2],
             y_range=[-0.15, 1.1, 0.2],
@@ -202,7 +217,7 @@ class LimitsVideo(Scene):
             x_labels.add(lab)
 
         y_labels = VGroup()
-        for val, txt in [(0.2, r"\epsilon"), (0.5, "0.5"), (1.0, "1")]:
+        for val, txt in [(eps_hi, r"\epsilon"), (0.5, "0.5"), (1.0, "1")]:
             lab = MathTex(txt, font_size=22).next_to(axes.c2p(0, val), LEFT, buff=0.15)
             y_labels.add(lab)
 
@@ -212,17 +227,16 @@ class LimitsVideo(Scene):
         self.play(Create(axes), FadeIn(x_labels), FadeIn(y_labels), FadeIn(n_label), FadeIn(a_label))
 
         # Epsilon band
-        eps_val = 0.2
         eps_band = Polygon(
-            axes.c2p(0, -eps_val), axes.c2p(21, -eps_val),
-            axes.c2p(21, eps_val), axes.c2p(0, eps_val),
+            axes.c2p(0, eps_lo), axes.c2p(21, eps_lo),
+            axes.c2p(21, eps_hi), axes.c2p(0, eps_hi),
             fill_color=BLUE, fill_opacity=0.15, stroke_width=0
         )
         eps_line = DashedLine(
-            axes.c2p(0, eps_val), axes.c2p(21, eps_val),
+            axes.c2p(0, eps_hi), axes.c2p(21, eps_hi),
             color=BLUE, dash_length=0.1
         )
-        limit_line = Line(axes.c2p(0, 0), axes.c2p(21, 0), color=WHITE, stroke_width=2)
+        limit_line = Line(axes.c2p(0, fit.limit), axes.c2p(21, fit.limit), color=WHITE, stroke_width=2)
 
         cap10 = caption("The blue band is\nthe ε-neighborhood.")
         self.play(FadeIn(eps_band), Create(eps_line), Create(limit_line), FadeIn(cap10))
@@ -230,28 +244,28 @@ class LimitsVideo(Scene):
 
         # Plot dots before N
         dots_before = VGroup()
-        for n in range(1, 7):
-            dot = Dot(axes.c2p(n, 1/n), radius=0.05, color=WHITE)
+        for n, a_n in fit.points(fit.before):
+            dot = Dot(axes.c2p(n, a_n), radius=0.05, color=WHITE)
             dots_before.add(dot)
 
-        cap11 = caption("Terms before N = 6\nmay be outside.")
+        cap11 = caption(f"Terms up to N = {N} ≥ 1/ε\nmay be outside.")
         self.play(ReplacementTransform(cap10, cap11))
         self.play(LaggedStart(*[FadeIn(d, scale=0.5) for d in dots_before], lag_ratio=0.15))
         self.wait(1.5)
 
         # Cutoff line
         cutoff = DashedLine(
-            axes.c2p(6, -0.12), axes.c2p(6, 1.05),
+            axes.c2p(N, -0.12), axes.c2p(N, 1.05),
             color=RED, stroke_width=2.5, dash_length=0.08
         )
-        n_label_cutoff = MathTex(r"N=6", font_size=24, color=RED).next_to(axes.c2p(6, -0.12), DOWN, buff=0.15)
+        n_label_cutoff = MathTex(f"N={N}", font_size=24, color=RED).next_to(axes.c2p(N, -0.12), DOWN, buff=0.15)
         self.play(Create(cutoff), FadeIn(n_label_cutoff))
         self.wait(1)
 
         # Dots after N
         dots_after = VGroup()
-        for n in range(7, 21):
-            dot = Dot(axes.c2p(n, 1/n), radius=0.05, color=BLUE)
+        for n, a_n in fit.points(fit.after):
+            dot = Dot(axes.c2p(n, a_n), radius=0.05, color=BLUE)
             dots_after.add(dot)
 
         cap12 = caption("All terms after N\nstay inside the band!")
@@ -262,7 +276,7 @@ class LimitsVideo(Scene):
         annotation = MathTex(
             r"|a_n - 0| < \epsilon \text{ for all } n > N",
             font_size=26, color=BLUE_B
-        ).next_to(axes.c2p(14, 0.2), UP, buff=0.2)
+        ).next_to(axes.c2p(14, eps_hi), UP, buff=0.2)
         self.play(FadeIn(annotation))
         self.wait(3)
 
@@ -278,6 +292,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 7: Key takeaway about N depending on epsilon
         # ═══════════════════════════════════════
+        self.next_section("SCENE 7: Key takeaway about N depending on epsilon")
         takeaway = VGroup(
             Text("Key Point:", font_size=34, color=YELLOW),
             Text("Smaller ε means", font_size=30),
@@ -291,6 +306,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 8: Transition to function limits
         # ═══════════════════════════════════════
+        self.next_section("SCENE 8: Transition to function limits")
         trans_text = Text(
             "Now: Limits of Functions",
             font_size=42, color=TEAL_B
@@ -303,6 +319,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 9: Epsilon-delta definition
         # ═══════════════════════════════════════
+        self.next_section("SCENE 9: Epsilon-delta definition")
         def2_title = Text("Definition: Limit of a Function", font_size=36, color=BLUE_B)
         def2_title.to_edge(UP, buff=0.5)
         self.play(Write(def2_title))
@@ -338,6 +355,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 10: Comparing the two definitions
         # ═══════════════════════════════════════
+        self.next_section("SCENE 10: Comparing the two definitions")
         comp_title = Text("Comparing the Two Definitions", font_size=34, color=TEAL_B).to_edge(UP, buff=0.5)
         self.play(Write(comp_title))
 
@@ -377,6 +395,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 11: Continuity definition
         # ═══════════════════════════════════════
+        self.next_section("SCENE 11: Continuity definition")
         cont_title = Text("Continuity", font_size=36, color=BLUE_B).to_edge(UP, buff=0.5)
         self.play(Write(cont_title))
 
@@ -397,6 +416,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 12: Example f(x) = x^2, lim x->2
         # ═══════════════════════════════════════
+        self.next_section("SCENE 12: Example f(x) = x^2, lim x->2")
         ex2_title = Text("Example", font_size=36, color=GREEN_B).to_edge(UP, buff=0.5)
         ex2_claim = MathTex(
             r"\text{Prove: } \lim_{x\to 2} x^2 = 4",
@@ -498,9 +518,17 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 13: Epsilon-delta graph for x^2
         # ═══════════════════════════════════════
+        self.next_section("SCENE 13: Epsilon-delta graph for x^2")
         g_title = Text("Epsilon-Delta Visualization", font_size=34, color=BLUE_B).to_edge(UP, buff=0.4)
         self.play(Write(g_title))
 
+        # largest δ for ε = 1 around (2, 4), and the band/strip it implies
+        f2 = lambda x: x**2
+        fit2 = DeltaSolver(f2, c=2, L=4).solve(1.0)
+        c2, L2 = fit2.c, fit2.L
+        band_lo, band_hi = fit2.band
+        strip_lo, strip_hi = fit2.strip
+
         axes2 = Axes(
             x_range=[0.5, 3.5, 0.5],
             y_range=[0, 9, 1],
@@ -510,12 +538,12 @@ class LimitsVideo(Scene):
         ).shift(DOWN*0.4)
 
         x2_labels = VGroup()
-        for val, txt in [(1, "1"), (1.8, r"2{-}\delta"), (2, "2"), (2.2, r"2{+}\delta"), (3, "3")]:
+        for val, txt in [(1, "1"), (strip_lo, r"2{-}\delta"), (c2, "2"), (strip_hi, r"2{+}\delta"), (3, "3")]:
             lab = MathTex(txt, font_size=20).next_to(axes2.c2p(val, 0), DOWN, buff=0.15)
             x2_labels.add(lab)
 
         y2_labels = VGroup()
-        for val, txt in [(3, r"4{-}\epsilon"), (4, "4"), (5, r"4{+}\epsilon"), (9, "9")]:
+        for val, txt in [(band_lo, r"4{-}\epsilon"), (L2, "4"), (band_hi, r"4{+}\epsilon"), (9, "9")]:
             lab = MathTex(txt, font_size=20).next_to(axes2.c2p(0.5, val), LEFT, buff=0.15)
             y2_labels.add(lab)
 
@@ -526,13 +554,12 @@ class LimitsVideo(Scene):
 
         # Epsilon band (horizontal)
         eps_band2 = Polygon(
-            axes2.c2p(0.5, 3), axes2.c2p(3.5, 3),
-            axes2.c2p(3.5, 5), axes2.c2p(0.5, 5),
+            *[axes2.c2p(x, y) for x, y in fit2.band_corners(0.5, 3.5)],
             fill_color=BLUE, fill_opacity=0.15, stroke_width=0
         )
-        eps_top = DashedLine(axes2.c2p(0.5, 5), axes2.c2p(3.5, 5), color=BLUE, dash_length=0.08)
-        eps_bot = DashedLine(axes2.c2p(0.5, 3), axes2.c2p(3.5, 3), color=BLUE, dash_length=0.08)
-        l_line = DashedLine(axes2.c2p(0.5, 4), axes2.c2p(3.5, 4), color=WHITE, stroke_width=1.5, dash_length=0.06)
+        eps_top = DashedLine(axes2.c2p(0.5, band_hi), axes2.c2p(3.5, band_hi), color=BLUE, dash_length=0.08)
+        eps_bot = DashedLine(axes2.c2p(0.5, band_lo), axes2.c2p(3.5, band_lo), color=BLUE, dash_length=0.08)
+        l_line = DashedLine(axes2.c2p(0.5, L2), axes2.c2p(3.5, L2), color=WHITE, stroke_width=1.5, dash_length=0.06)
 
         cap23 = caption("Blue band:\n|f(x) − 4| < ε.")
         self.play(FadeIn(eps_band2), Create(eps_top), Create(eps_bot), Create(l_line), FadeIn(cap23))
@@ -540,12 +567,11 @@ class LimitsVideo(Scene):
 
         # Delta strip (vertical)
         delta_strip = Polygon(
-            axes2.c2p(1.8, 0), axes2.c2p(2.2, 0),
-            axes2.c2p(2.2, 9), axes2.c2p(1.8, 9),
+            *[axes2.c2p(x, y) for x, y in fit2.strip_corners(0, 9)],
             fill_color=RED, fill_opacity=0.12, stroke_width=0
         )
-        d_left = DashedLine(axes2.c2p(1.8, 0), axes2.c2p(1.8, 9), color=RED, dash_length=0.08)
-        d_right = DashedLine(axes2.c2p(2.2, 0), axes2.c2p(2.2, 9), color=RED, dash_length=0.08)
+        d_left = DashedLine(axes2.c2p(strip_lo, 0), axes2.c2p(strip_lo, 9), color=RED, dash_length=0.08)
+        d_right = DashedLine(axes2.c2p(strip_hi, 0), axes2.c2p(strip_hi, 9), color=RED, dash_length=0.08)
 
         cap24 = caption("Red strip:\n0 < |x − 2| < δ.")
         self.play(
@@ -555,14 +581,12 @@ class LimitsVideo(Scene):
         self.wait(1.5)
 
         # Parabola
-        parabola = axes2.plot(lambda x: x**2, x_range=[0.5, 3.2], color=WHITE, stroke_width=2.5)
+        parabola = plot(axes2, f2, [0.5, 3.2], color=WHITE, stroke_width=2.5)
         parabola_label = MathTex(r"f(x) = x^2", font_size=24).next_to(axes2.c2p(3.1, 9), LEFT, buff=0.2)
 
         # Highlighted portion
-        parabola_highlight = axes2.plot(
-            lambda x: x**2, x_range=[1.8, 2.2],
-            color=YELLOW, stroke_width=4
-        )
+        # sliced from the parabola's cached samples
+        parabola_highlight = plot(axes2, f2, [strip_lo, strip_hi], color=YELLOW, stroke_width=4)
 
         cap25 = caption("Inside the strip,\nthe curve stays in the band!")
         self.play(
@@ -573,7 +597,7 @@ class LimitsVideo(Scene):
         self.play(Create(parabola_highlight))
 
         # Point (2,4)
-        pt = Dot(axes2.c2p(2, 4), radius=0.06, color=YELLOW)
+        pt = Dot(axes2.c2p(c2, L2), radius=0.06, color=YELLOW)
         pt_label = MathTex(r"(2,4)", font_size=22).next_to(pt, UR, buff=0.1)
         self.play(FadeIn(pt), FadeIn(pt_label))
         self.wait(3)
@@ -591,6 +615,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # ADDENDUM: When a Limit Does Not Exist
         # ═══════════════════════════════════════
+        self.next_section("ADDENDUM: When a Limit Does Not Exist")
         add_label = Text("Addendum", font_size=28, color=GREY_B).to_corner(UL, buff=0.3)
         dne_title = Text("When a Limit Does Not Exist", font_size=34, color=RED_B).to_edge(UP, buff=0.5)
         self.play(FadeIn(add_label), Write(dne_title))
@@ -701,8 +726,8 @@ class LimitsVideo(Scene):
             axis_config={"include_numbers": True, "font_size": 20, "tip_width": 0.1, "tip_height": 0.1},
         ).shift(DOWN*1.7)
 
-        pos_line_dne = dne_axes.plot(lambda x: 1, x_range=[0.01, 3], color=BLUE)
-        neg_line_dne = dne_axes.plot(lambda x: -1, x_range=[-3, -0.01], color=BLUE)
+        # both branches in one graph, broken at the jump
+        sign_graph = plot(dne_axes, np.sign, [-3, 3], color=BLUE)
         open_dot_top = Circle(radius=0.07, color=BLUE, stroke_width=2).move_to(dne_axes.c2p(0, 1))
         open_dot_bot = Circle(radius=0.07, color=BLUE, stroke_width=2).move_to(dne_axes.c2p(0, -1))
 
@@ -711,7 +736,7 @@ class LimitsVideo(Scene):
             ReplacementTransform(cap_ex0, cap_ex1),
         )
         self.play(
-            Create(dne_axes), Create(pos_line_dne), Create(neg_line_dne),
+            Create(dne_axes), Create(sign_graph),
             FadeIn(open_dot_top), FadeIn(open_dot_bot),
         )
         self.wait(1.5)
@@ -729,7 +754,7 @@ class LimitsVideo(Scene):
         # Step 2: Choose epsilon_0 = 1/2
         # Clear graph to make room for algebra
         self.play(
-            FadeOut(dne_axes), FadeOut(pos_line_dne), FadeOut(neg_line_dne),
+            FadeOut(dne_axes), FadeOut(sign_graph),
             FadeOut(open_dot_top), FadeOut(open_dot_bot),
         )
 
@@ -821,6 +846,7 @@ class LimitsVideo(Scene):
         # ═══════════════════════════════════════
         # SCENE 16: Summary
         # ═══════════════════════════════════════
+        self.next_section("SCENE 16: Summary")
         summary_title = Text("Summary", font_size=42, color=YELLOW).to_edge(UP, buff=0.8)
         self.play(Write(summary_title))
 
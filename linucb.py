@@ -0,0 +1,125 @@
+from fractions import Fraction
+
+import numpy as np
+
+# ── LinUCB with Sherman–Morrison updates ──
+# V⁻¹ and θ̂ are kept up to date with rank-one updates, so a round costs
+# O(K·d²) instead of a fresh d×d inverse.  All state carries a leading
+# batch axis: B independent learners run side by side.
+
+
+def fmt(v):
+    return f"{round(float(v), 2) + 0.0:g}"
+
+
+def fmt_vec(v):
+    return "(" + ", ".join(fmt(x) for x in v) + ")"
+
+
+def fmt_frac(v, max_den=12):
+    # exact small fractions read better in the video ("1/3" instead of "0.333")
+    f = Fraction(float(v)).limit_denominator(max_den)
+    if abs(float(f) - v) > 1e-9:
+        return fmt(v)
+    return str(f.numerator) if f.denominator == 1 else f"{f.numerator}/{f.denominator}"
+
+
+class LinUCB:
+    def __init__(self, d, lam=1.0, beta=1.0, batch=1):
+        self.d, self.lam, self.beta, self.batch = d, lam, beta, batch
+        self.t = 0
+        self.V = np.tile(lam * np.eye(d), (batch, 1, 1))
+        self.V_inv = np.tile(np.eye(d) / lam, (batch, 1, 1))
+        self.b = np.zeros((batch, d))
+        self.theta = np.zeros((batch, d))
+
+    def _batched(self, X):
+        X = np.asarray(X, dtype=float)
+        return X[None] if X.ndim == 2 else X
+
+    def scores(self, X):
+        """Exploit term, ||x||²_{V⁻¹} and UCB for contexts X of shape (B, K, d) or (K, d)."""
+        X = self._batched(X)
+        mean = (X @ self.theta[:, :, None])[..., 0]
+        var = ((X @ self.V_inv) * X).sum(axis=-1)
+        ucb = mean + np.sqrt(self.beta) * np.sqrt(var)
+        return mean, var, ucb
+
+    def select(self, X):
+        # ties go to the lowest arm index
+        return self.scores(X)[2].argmax(axis=1)
+
+    def update(self, x, r):
+        """Rank-one update with pulled contexts x (B, d) and rewards r (B,)."""
+        x = np.atleast_2d(np.asarray(x, dtype=float))
+        r = np.broadcast_to(np.asarray(r, dtype=float), (self.batch,))
+        Vx = (self.V_inv @ x[:, :, None])[..., 0]
+        denom = 1.0 + (x * Vx).sum(axis=1)
+        self.V_inv -= Vx[:, :, None] * (Vx / denom[:, None])[:, None, :]
+        self.V += x[:, :, None] * x[:, None, :]
+        self.b += r[:, None] * x
+        self.theta = (self.V_inv @ self.b[:, :, None])[..., 0]
+        self.t += 1
+
+    def step(self, X, reward_fn):
+        """Select, observe `reward_fn(x_pulled)` and update; returns a round record."""
+        X = self._batched(X)
+        theta_prev = self.theta.copy()
+        mean, var, ucb = self.scores(X)
+        arm = ucb.argmax(axis=1)
+        x = X[np.arange(self.batch), arm]
+        # a reward_fn may return a scalar when the batch has one learner
+        r = np.broadcast_to(np.asarray(reward_fn(x), dtype=float), (self.batch,))
+        self.update(x, r)
+        return Round(self.t, X, theta_prev, mean, var, ucb, arm, r,
+                     self.theta.copy(), np.diagonal(self.V, axis1=1, axis2=2).copy(),
+                     self.beta)
+
+
+def linear_rewards(theta_star, noise=0.0, rng=None):
+    theta_star = np.asarray(theta_star, dtype=float)
+    rng = rng if rng is not None else np.random.default_rng()
+
+    def reward_fn(x):
+        r = x @ theta_star
+        return r + noise * rng.standard_normal(r.shape) if noise else r
+    return reward_fn
+
+
+def run_episode(contexts, theta_star, lam=1.0, beta=1.0, noise=0.0, seed=None):
+    """Play a single learner through `contexts` (T, K, d); returns the Round list."""
+    contexts = np.asarray(contexts, dtype=float)
+    learner = LinUCB(contexts.shape[-1], lam=lam, beta=beta)
+    reward_fn = linear_rewards(theta_star, noise, np.random.default_rng(seed))
+    return [learner.step(X, reward_fn) for X in contexts]
+
+
+class Round:
+    """One LinUCB round for the worked-example table (batch element 0)."""
+
+    def __init__(self, t, X, theta_prev, mean, var, ucb, arm, reward, theta, V_diag, beta):
+        self.t = t
+        self.X = X[0]
+        self.theta_prev = theta_prev[0]
+        self.mean, self.var, self.ucb = mean[0], var[0], ucb[0]
+        self.arm = int(arm[0])
+        self.reward = float(reward[0])
+        self.theta = theta[0]
+        self.V_diag = V_diag[0]
+        self.beta = beta
+
+    def context_tex(self, k):
+        return f"x(a_{k+1})=" + fmt_vec(self.X[k])
+
+    def ucb_tex(self, k):
+        # e.g.  0.5 + \sqrt{1/2} \approx 1.21
+        bonus = r"\sqrt{" + fmt_frac(self.var[k]) + "}"
+        if self.beta != 1:
+            bonus = r"\sqrt{" + fmt(self.beta) + r"} \cdot " + bonus
+        rel = "=" if abs(self.ucb[k] - round(self.ucb[k], 2)) < 1e-9 else r"\approx"
+        return f"{fmt(self.mean[k])} + {bonus} {rel} {self.ucb[k]:.2f}".replace("+ -", "- ")
+
+    def row(self, arm_names=("a₁", "a₂")):
+        # t | UCB(a₁) | UCB(a₂) | Pull | rₜ | θ̂ₜ | Vₜ diag
+        return ([str(self.t)] + [f"{u:.2f}" for u in self.ucb]
+                + [arm_names[self.arm], fmt(self.reward), fmt_vec(self.theta), fmt_vec(self.V_diag)])
@@ -0,0 +1,235 @@
+import numpy as np
+
+# ── Layered finite-horizon MDPs ──
+# Layer h = 0..H-1 holds up to S states with A actions each; layer H is the
+# terminal layer with V = 0.  Rewards are a dense (H, S, A) array, transitions
+# a sparse (H, S, A, S') tensor stored per layer as COO triples.  A Bellman
+# backup for a whole layer is one gather + one bincount.
+
+
+def fmt(v, nd=3):
+    return f"{round(float(v), nd) + 0.0:g}"
+
+
+class SparseTransitions:
+    """P[h, s, a, s'] stored as flat (row = s*A + a, col = s', prob) triples per layer."""
+
+    def __init__(self, H, S, A, rows, cols, probs):
+        self.shape = (H, S, A, S)
+        self.rows, self.cols, self.probs = rows, cols, probs   # lists of length H
+        self._samplers = {}
+
+    @classmethod
+    def from_dense(cls, P):
+        P = np.asarray(P, dtype=float)
+        H, S, A, _ = P.shape
+        rows, cols, probs = [], [], []
+        for h in range(H):
+            sa, sp = np.nonzero(P[h].reshape(S * A, -1))
+            rows.append(sa); cols.append(sp); probs.append(P[h].reshape(S * A, -1)[sa, sp])
+        return cls(H, S, A, rows, cols, probs)
+
+    def expect(self, h, v_next):
+        """Σ_{s'} P[h, s, a, s'] v_next[s'] for every (s, a), shape (S, A)."""
+        _, S, A, _ = self.shape
+        out = np.bincount(self.rows[h], weights=self.probs[h] * v_next[self.cols[h]],
+                          minlength=S * A)
+        return out.reshape(S, A)
+
+    def sampler(self, h):
+        """Row pointers and a global inverse-CDF key for layer h.
+
+        Entries are sorted by row; key = row + cumulative probability within
+        the row, so `searchsorted(key, row + u)` finds the sampled successor
+        for every episode at once.
+        """
+        cache = self._samplers
+        if h not in cache:
+            _, S, A, _ = self.shape
+            order = np.argsort(self.rows[h], kind="stable")
+            rows, cols, probs = self.rows[h][order], self.cols[h][order], self.probs[h][order]
+            indptr = np.zeros(S * A + 1, dtype=np.intp)
+            np.cumsum(np.bincount(rows, minlength=S * A), out=indptr[1:])
+            cum = np.concatenate([[0.0], np.cumsum(probs)])
+            within = cum[1:] - np.repeat(cum[indptr[:-1]], np.diff(indptr))
+            cache[h] = (indptr, rows + within, cols)
+        return cache[h]
+
+    def sample(self, h, rows, u):
+        """Next states for flat (s*A + a) `rows` given uniforms `u`, all episodes at once."""
+        indptr, key, cols = self.sampler(h)
+        idx = np.searchsorted(key, rows + u, side="right")
+        # guard against cumulative sums that fall just short of 1
+        idx = np.clip(idx, indptr[rows], indptr[rows + 1] - 1)
+        return cols[idx]
+
+    def successors(self, h, s, a):
+        _, S, A, _ = self.shape
+        sel = self.rows[h] == s * A + a
+        return self.cols[h][sel], self.probs[h][sel]
+
+    def to_dense(self):
+        H, S, A, _ = self.shape
+        P = np.zeros((H, S * A, S))
+        for h in range(H):
+            P[h, self.rows[h], self.cols[h]] = self.probs[h]
+        return P.reshape(H, S, A, S)
+
+
+class LayeredMDP:
+    def __init__(self, rewards, transitions, n_states=None, names=None):
+        self.R = np.asarray(rewards, dtype=float)      # (H, S, A)
+        self.P = transitions                           # SparseTransitions
+        self.H, self.S, self.A = self.R.shape
+        # states actually present per layer (incl. terminal layer H); the rest is padding
+        self.n_states = list(n_states) if n_states is not None else [self.S] * (self.H + 1)
+        self.names = names
+
+    @classmethod
+    def from_state_data(cls, layers, state_data):
+        """Build from the video's per-state tuples.
+
+        `layers` lists state keys layer by layer, the last entry being the
+        terminal layer; `state_data[k] = (r_1, .., r_A, p_1, .., p_A)` where
+        p_a are probabilities over the next layer's states in order.
+        """
+        H = len(layers) - 1
+        S = max(len(l) for l in layers)
+        A = len(next(iter(state_data.values()))) // 2
+        R = np.zeros((H, S, A))
+        rows, cols, probs = [], [], []
+        for h in range(H):
+            r_h, c_h, p_h = [], [], []
+            for s, key in enumerate(layers[h]):
+                entry = state_data[key]
+                R[h, s] = entry[:A]
+                for a, dist in enumerate(entry[A:]):
+                    for sp, p in enumerate(dist):
+                        if p:
+                            r_h.append(s * A + a); c_h.append(sp); p_h.append(p)
+            rows.append(np.array(r_h, dtype=np.intp))
+            cols.append(np.array(c_h, dtype=np.intp))
+            probs.append(np.array(p_h, dtype=float))
+        P = SparseTransitions(H, S, A, rows, cols, probs)
+        return cls(R, P, n_states=[len(l) for l in layers], names=layers)
+
+    def index(self, key):
+        for h, layer in enumerate(self.names):
+            if key in layer:
+                return h, layer.index(key)
+        raise KeyError(key)
+
+    def policy_array(self, policy):
+        """Accept an (H, S) array, a single action for every state, or {key: action}."""
+        if isinstance(policy, dict):
+            pi = np.zeros((self.H, self.S), dtype=np.intp)
+            for key, a in policy.items():
+                h, s = self.index(key)
+                pi[h, s] = a
+            return pi
+        return np.broadcast_to(np.asarray(policy, dtype=np.intp), (self.H, self.S))
+
+    def evaluate(self, policy):
+        """V^π for every layer, shape (H + 1, S)."""
+        pi = self.policy_array(policy)
+        V = np.zeros((self.H + 1, self.S))
+        states = np.arange(self.S)
+        for h in range(self.H - 1, -1, -1):
+            V[h] = (self.R[h] + self.P.expect(h, V[h + 1]))[states, pi[h]]
+        return V
+
+    def rollout(self, policy, n_episodes, start=0, seed=None):
+        """Sample `n_episodes` trajectories of `policy` in one pass per layer."""
+        pi = self.policy_array(policy)
+        rng = np.random.default_rng(seed)
+        states = np.empty((n_episodes, self.H + 1), dtype=np.intp)
+        actions = np.empty((n_episodes, self.H), dtype=np.intp)
+        rewards = np.empty((n_episodes, self.H))
+        states[:, 0] = start
+        for h in range(self.H):
+            s = states[:, h]
+            a = pi[h, s]
+            actions[:, h] = a
+            rewards[:, h] = self.R[h, s, a]
+            states[:, h + 1] = self.P.sample(h, s * self.A + a, rng.random(n_episodes))
+        return Rollouts(self, states, actions, rewards)
+
+    def solve(self):
+        """Backward induction: Q*, V*, π* for every layer."""
+        Q = np.zeros((self.H, self.S, self.A))
+        V = np.zeros((self.H + 1, self.S))
+        for h in range(self.H - 1, -1, -1):
+            Q[h] = self.R[h] + self.P.expect(h, V[h + 1])
+            V[h] = Q[h].max(axis=1)
+        return Solution(self, Q, V, Q.argmax(axis=2))
+
+
+class Solution:
+    def __init__(self, mdp, Q, V, pi):
+        self.mdp, self.Q, self.V, self.pi = mdp, Q, V, pi
+
+    def value(self, key):
+        h, s = self.mdp.index(key)
+        return self.V[h, s]
+
+    def q_value(self, key, a):
+        h, s = self.mdp.index(key)
+        return self.Q[h, s, a]
+
+    def action(self, key):
+        h, s = self.mdp.index(key)
+        return int(self.pi[h, s])
+
+    # ── TeX pieces for the backward-induction walkthrough ──
+    def q_tex_parts(self, key, a, tex_names):
+        """[Q*(x,a), =, r, +p₁, ·V₁, +p₂, ·V₂, ..., =Q] as separate MathTex strings.
+
+        There is a (+p, ·V) pair for every state of the next layer, zero
+        probabilities included, so part i is the same term for every (key, a).
+        """
+        h, s = self.mdp.index(key)
+        parts = [r"Q^\star(" + tex_names[key] + f",a_{a+1})", r"=", fmt(self.mdp.R[h, s, a])]
+        p_next = np.zeros(self.mdp.n_states[h + 1])
+        nxt, probs = self.mdp.P.successors(h, s, a)
+        np.add.at(p_next, nxt, probs)
+        for sp, p in enumerate(p_next):
+            parts += [r"+\," + fmt(p), r"\!\cdot\!" + fmt(self.V[h + 1, sp])]
+        parts.append("=" + fmt(self.Q[h, s, a]))
+        return parts
+
+    def v_tex(self, key, tex_names, show_action=False):
+        h, s = self.mdp.index(key)
+        qs = ",".join(fmt(q) for q in self.Q[h, s])
+        tex = r"V^\star(" + tex_names[key] + r")=\max\{" + qs + r"\}=" + fmt(self.V[h, s])
+        if show_action:
+            tex += r"\;\;(a_" + str(self.pi[h, s] + 1) + ")"
+        return tex
+
+
+class Rollouts:
+    def __init__(self, mdp, states, actions, rewards):
+        self.mdp = mdp
+        self.states = states      # (N, H + 1) state index per layer
+        self.actions = actions    # (N, H)
+        self.rewards = rewards    # (N, H)
+
+    @property
+    def returns(self):
+        return self.rewards.sum(axis=1)
+
+    def running_mean(self):
+        return np.cumsum(self.returns) / np.arange(1, len(self.returns) + 1)
+
+    def visit_counts(self):
+        """Visits per (layer, state), shape (H + 1, S)."""
+        H1 = self.states.shape[1]
+        S = self.mdp.S
+        flat = self.states + np.arange(H1) * S
+        return np.bincount(flat.ravel(), minlength=H1 * S).reshape(H1, S)
+
+    def trajectory(self, i):
+        """Episode i as [(state_key, action, reward, next_key), ...]."""
+        names = self.mdp.names
+        st = self.states[i]
+        return [(names[h][st[h]], int(self.actions[i, h]), float(self.rewards[i, h]),
+                 names[h + 1][st[h + 1]]) for h in range(self.actions.shape[1])]
@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from dirty_regions import DirtyRegionMixin
+from group_style import GroupStyle
+from mdp_solver import LayeredMDP, fmt
+from raster_layer import RasterLayerMixin
+from tex_cache import MathTex
+
 BG        = "#1a1a2e"
 ACCENT    = "#e94560"
 GOLD      = "#f5c542"
@@ -19,7 +25,8 @@ def cap(text, **kw):
     return t
 
 
-class MDPVideo(Scene):
+class MDPVideo(RasterLayerMixin, DirtyRegionMixin, Scene):
+    section_state = ("mdp_group",)      # see section_manifest.py
 
     def build_mdp(self):
         self.S = {
@@ -43,6 +50,9 @@ class MDPVideo(Scene):
             "x1R": (0.3, 0.4, [1],[1]),
             "x2R": (0.7, 0.8, [1],[1]),
         }
+        self.layers = [["x0"], ["x1L","x2L"], ["x1R","x2R"], ["T"]]
+        self.mdp = LayeredMDP.from_state_data(self.layers, self.state_data)
+        self.sol = self.mdp.solve()
         self.circles={}; self.labels={}; self.act_dots={}; self.info_txts={}
         self.mdp_group = VGroup()
         for k in ["x0","x1L","x2L","x1R","x2R","T"]:
@@ -81,10 +91,10 @@ class MDPVideo(Scene):
                                      buff=0.08, stroke_width=2.5, corner_radius=0.3)
 
     def fade_mdp(self, op=0.12):
-        self.play(*[m.animate.set_opacity(op) for m in self.mdp_group], run_time=0.6)
+        self.play(GroupStyle(*self.mdp_group, opacity=op), run_time=0.6)
 
     def restore_mdp(self):
-        self.play(*[m.animate.set_opacity(1.0) for m in self.mdp_group], run_time=0.6)
+        self.play(GroupStyle(*self.mdp_group, opacity=1.0), run_time=0.6)
 
     def make_agent(self):
         a = Triangle(color=ACCENT, fill_opacity=0.9).scale(0.16)
@@ -104,6 +114,7 @@ class MDPVideo(Scene):
         self.build_mdp()
 
         # ═══════════════════ TITLE ═══════════════════
+        self.next_section("TITLE")
         title = Text("Markov Decision\nProcesses", font_size=52,
                       color=WHITE, line_spacing=1.2)
         tag = Text("(MDPs)", font_size=32, color=SOFT_BLUE).next_to(title, DOWN, buff=0.4)
@@ -113,6 +124,7 @@ class MDPVideo(Scene):
         self.play(FadeOut(title), FadeOut(tag)); self.wait(0.3)
 
         # ═══════════════════ PART 1 – BUILD MDP ═══════════════════
+        self.next_section("PART 1 – BUILD MDP")
         c = cap("An MDP generalizes the\nbandit problem to\nmultiple states.")
         self.play(FadeIn(c))
         self.play(LaggedStart(*[FadeIn(m) for m in self.mdp_group],
@@ -147,9 +159,12 @@ class MDPVideo(Scene):
         self.play(*[ll.animate.set_color(GOLD) for ll in self.layer_labs], run_time=0.5)
         self.wait(2)
         self.play(*[ll.animate.set_color(GREY) for ll in self.layer_labs], run_time=0.3)
+        # the graph stays put from here on: draw it from a cached bitmap
+        self.freeze_layer(self.mdp_group)
         self.play(FadeOut(c5))
 
         # ═══════════════════ PART 2 – POLICY + TRAVERSALS ═══════════════════
+        self.next_section("PART 2 – POLICY + TRAVERSALS")
         c = cap("A policy π maps each\nstate to an action.")
         self.play(FadeIn(c))
         peq = MathTex(r"\pi : \mathcal{S} \to \mathcal{A}", font_size=32, color=TEAL)
@@ -189,11 +204,11 @@ class MDPVideo(Scene):
         self.play(FadeIn(ag, shift=DOWN*0.2)); self.wait(0.3)
         self.play(FadeOut(c))
 
-        trajs = [
-            ("Iter 1",[("x0",1,0.8,"x1L"),("x1L",1,0.4,"x1R"),("x1R",1,0.4,"T")],1.6),
-            ("Iter 2",[("x0",1,0.8,"x1L"),("x1L",1,0.4,"x2R"),("x2R",1,0.8,"T")],2.0),
-            ("Iter 3",[("x0",1,0.8,"x2L"),("x2L",1,0.6,"x2R"),("x2R",1,0.8,"T")],2.2),
-        ]
+        # Sample episodes of "a₂ everywhere" from the MDP's transition probabilities
+        pol = 1
+        demo = self.mdp.rollout(pol, n_episodes=3, seed=2)
+        trajs = [(f"Iter {i+1}", demo.trajectory(i), demo.returns[i])
+                 for i in range(len(demo.returns))]
         results = VGroup()
         for ti,(label,traj,_) in enumerate(trajs):
             ag.move_to(self.S["x0"]+UP*(self.state_radius+0.22))
@@ -215,18 +230,26 @@ class MDPVideo(Scene):
             self.play(FadeTransform(cnt, final), run_time=0.25)
             results.add(final); self.wait(0.2)
 
-        avg = (1.6+2.0+2.2)/3
+        avg = demo.returns.mean()
         avt = Text(f"Average ≈ {avg:.2f}", font_size=20, color=ACCENT)
         avt.next_to(results, DOWN, buff=0.2, aligned_edge=LEFT)
         self.play(FadeIn(avt))
+        # The empirical mean over many episodes converges to V^π
+        many = self.mdp.rollout(pol, n_episodes=100_000, seed=3)
+        v_pi = self.mdp.evaluate(pol)[0, 0]
+        cvt = Text(f"100,000 runs ≈ {many.running_mean()[-1]:.3f}  (V^π = {v_pi:.3f})",
+                   font_size=16, color=SOFT_BLUE)
+        cvt.next_to(avt, DOWN, buff=0.15, aligned_edge=LEFT)
+        self.play(FadeIn(cvt))
         cs = cap("Same policy, different\noutcomes each time!")
         self.play(FadeIn(cs)); self.wait(2.5)
-        self.play(FadeOut(results), FadeOut(avt), FadeOut(ag),
+        self.play(FadeOut(results), FadeOut(avt), FadeOut(cvt), FadeOut(ag),
                   FadeOut(cs), FadeOut(pol_grp))
 
         # ═══════════════════════════════════════════════════════════
         #  PART 3 – V VALUE (equation + brief visual, no zoom)
         # ═══════════════════════════════════════════════════════════
+        self.next_section("PART 3 – V VALUE (equation + brief visual, no zoom)")
         vt = Text("V-Value Function", font_size=36, color=TEAL).to_edge(UP, buff=0.4)
         self.fade_mdp()
         self.play(FadeIn(vt))
@@ -257,6 +280,7 @@ class MDPVideo(Scene):
         # ═══════════════════════════════════════════════════════════
         #  PART 4 – Q VALUE (equation + brief, no zoom)
         # ═══════════════════════════════════════════════════════════
+        self.next_section("PART 4 – Q VALUE (equation + brief, no zoom)")
         qt = Text("Q-Value Function", font_size=36, color=PINK).to_edge(UP, buff=0.4)
         self.play(FadeIn(qt))
 
@@ -293,6 +317,7 @@ class MDPVideo(Scene):
         # ═══════════════════════════════════════════════════════════
         #  PART 5 – BELLMAN EQUATIONS + RECURSION DIAGRAM
         # ═══════════════════════════════════════════════════════════
+        self.next_section("PART 5 – BELLMAN EQUATIONS + RECURSION DIAGRAM")
         bt = Text("Bellman Equations", font_size=36, color=GOLD).to_edge(UP, buff=0.4)
         self.play(FadeIn(bt))
 
@@ -390,6 +415,7 @@ class MDPVideo(Scene):
         # ═══════════════════════════════════════════════════════════
         #  PART 6 – BACKWARD INDUCTION
         # ═══════════════════════════════════════════════════════════
+        self.next_section("PART 6 – BACKWARD INDUCTION")
         self.restore_mdp()
 
         # Pin Bellman equations in top-left as reference
@@ -409,13 +435,14 @@ class MDPVideo(Scene):
         ex.next_to(bell_pin, DOWN, buff=0.12, aligned_edge=LEFT)
         self.play(FadeIn(ex))
         SP_Y = 3.2
+        sol = self.sol
 
         # Initialize
         c = cap("Initialize: V at the\nterminal state is 0.")
         self.play(FadeIn(c))
         hl_t = self.hl("T", BLUE_C)
         self.play(Create(hl_t))
-        v_T = MathTex(r"V^\star\!=\!0", font_size=14, color=GOLD)
+        v_T = MathTex(r"V^\star\!=\!" + fmt(sol.value("T")), font_size=14, color=GOLD)
         v_T.next_to(self.circles["T"], UP, buff=0.08)
         self.play(FadeIn(v_T)); self.wait(1.5)
         self.play(FadeOut(hl_t))
@@ -425,7 +452,7 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c, c2))
         hl = self.hl("x1R"); self.play(Create(hl))
 
-        eq1 = MathTex(r"Q^\star(x_1^R,a_1)",r"=",r"0.3",r"+\,1",r"\!\cdot\!0",r"=0.3",
+        eq1 = MathTex(*sol.q_tex_parts("x1R", 0, self.nice),
                       font_size=17, color=WHITE).move_to([4.0, SP_Y, 0])
         self.play(FadeIn(eq1[0]),FadeIn(eq1[1]), run_time=0.5)
         self.play(Indicate(self.act_dots["x1R"][0], color=GOLD, scale_factor=2.0), run_time=0.7)
@@ -437,7 +464,7 @@ class MDPVideo(Scene):
         self.play(Indicate(v_T, color=GOLD, scale_factor=2.0), run_time=0.6)
         self.play(FadeIn(eq1[5]), run_time=0.4); self.wait(0.5)
 
-        eq2 = MathTex(r"Q^\star(x_1^R,a_2)",r"=",r"0.4",r"+\,1",r"\!\cdot\!0",r"=0.4",
+        eq2 = MathTex(*sol.q_tex_parts("x1R", 1, self.nice),
                       font_size=17, color=WHITE).next_to(eq1, DOWN, buff=0.12, aligned_edge=LEFT)
         self.play(FadeIn(eq2[0]),FadeIn(eq2[1]), run_time=0.4)
         self.play(Indicate(self.act_dots["x1R"][1], color=GOLD, scale_factor=2.0), run_time=0.6)
@@ -449,11 +476,11 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c2, c2b))
         win = SurroundingRectangle(eq2, color=TEAL, buff=0.04, stroke_width=2)
         self.play(Create(win)); self.wait(1)
-        spv = MathTex(r"V^\star(x_1^R)=\max\{0.3,0.4\}=0.4", font_size=17, color=GOLD)
+        spv = MathTex(sol.v_tex("x1R", self.nice, show_action=False), font_size=17, color=GOLD)
         spv.next_to(eq2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(spv), run_time=0.8); self.wait(1)
 
-        v1r = MathTex(r"V^\star\!=\!0.4", font_size=14, color=GOLD)
+        v1r = MathTex(r"V^\star\!=\!" + fmt(sol.value("x1R")), font_size=14, color=GOLD)
         v1r.next_to(self.circles["x1R"], UP, buff=0.08)
         self.play(FadeIn(v1r), FadeOut(eq1),FadeOut(eq2),FadeOut(spv),FadeOut(win),FadeOut(hl))
 
@@ -461,7 +488,7 @@ class MDPVideo(Scene):
         c3 = cap("Layer 2: solve x₂ᴿ.")
         self.play(FadeTransform(c2b, c3))
         hl = self.hl("x2R"); self.play(Create(hl))
-        eq1 = MathTex(r"Q^\star(x_2^R,a_1)",r"=",r"0.7",r"+\,1",r"\!\cdot\!0",r"=0.7",
+        eq1 = MathTex(*sol.q_tex_parts("x2R", 0, self.nice),
                       font_size=17, color=WHITE).move_to([4.0, SP_Y, 0])
         self.play(FadeIn(eq1[0]),FadeIn(eq1[1]), run_time=0.4)
         self.play(Indicate(self.act_dots["x2R"][0], color=GOLD, scale_factor=2.0), run_time=0.6)
@@ -469,7 +496,7 @@ class MDPVideo(Scene):
         self.play(Indicate(self.info_txts["x2R"][0], color=GOLD, scale_factor=1.5), run_time=0.6)
         self.play(FadeIn(eq1[3]),FadeIn(eq1[4]),FadeIn(eq1[5]), run_time=0.4); self.wait(0.3)
 
-        eq2 = MathTex(r"Q^\star(x_2^R,a_2)",r"=",r"0.8",r"+\,1",r"\!\cdot\!0",r"=0.8",
+        eq2 = MathTex(*sol.q_tex_parts("x2R", 1, self.nice),
                       font_size=17, color=WHITE).next_to(eq1, DOWN, buff=0.12, aligned_edge=LEFT)
         self.play(FadeIn(eq2[0]),FadeIn(eq2[1]), run_time=0.3)
         self.play(Indicate(self.act_dots["x2R"][1], color=GOLD, scale_factor=2.0), run_time=0.5)
@@ -481,10 +508,10 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c3, c3b))
         win = SurroundingRectangle(eq2, color=TEAL, buff=0.04, stroke_width=2)
         self.play(Create(win)); self.wait(0.8)
-        spv = MathTex(r"V^\star(x_2^R)=\max\{0.7,0.8\}=0.8", font_size=17, color=GOLD)
+        spv = MathTex(sol.v_tex("x2R", self.nice, show_action=False), font_size=17, color=GOLD)
         spv.next_to(eq2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(spv), run_time=0.8); self.wait(1)
-        v2r = MathTex(r"V^\star\!=\!0.8", font_size=14, color=GOLD)
+        v2r = MathTex(r"V^\star\!=\!" + fmt(sol.value("x2R")), font_size=14, color=GOLD)
         v2r.next_to(self.circles["x2R"], UP, buff=0.08)
         self.play(FadeIn(v2r), FadeOut(eq1),FadeOut(eq2),FadeOut(spv),FadeOut(win),FadeOut(hl))
 
@@ -493,8 +520,7 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c3b, c4))
         hl = self.hl("x1L"); self.play(Create(hl))
 
-        eq1 = MathTex(r"Q^\star(x_1^L,a_1)",r"=",r"0.3",r"+\,0.4",r"\!\cdot\!0.4",
-                      r"+\,0.6",r"\!\cdot\!0.8",r"=0.94",
+        eq1 = MathTex(*sol.q_tex_parts("x1L", 0, self.nice),
                       font_size=16, color=WHITE).move_to([3.5, SP_Y, 0])
         self.play(FadeIn(eq1[0]),FadeIn(eq1[1]), run_time=0.5)
         self.play(Indicate(self.act_dots["x1L"][0], color=GOLD, scale_factor=2.0), run_time=0.7); self.wait(0.3)
@@ -510,8 +536,7 @@ class MDPVideo(Scene):
         self.play(Indicate(v2r, color=GOLD, scale_factor=2.0), run_time=0.7); self.wait(0.3)
         self.play(FadeIn(eq1[7]), run_time=0.5); self.wait(0.8)
 
-        eq2 = MathTex(r"Q^\star(x_1^L,a_2)",r"=",r"0.4",r"+\,0.5",r"\!\cdot\!0.4",
-                      r"+\,0.5",r"\!\cdot\!0.8",r"=1.0",
+        eq2 = MathTex(*sol.q_tex_parts("x1L", 1, self.nice),
                       font_size=16, color=WHITE).next_to(eq1, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(FadeIn(eq2[0]),FadeIn(eq2[1]), run_time=0.4)
         self.play(Indicate(self.act_dots["x1L"][1], color=GOLD, scale_factor=2.0), run_time=0.6)
@@ -527,14 +552,14 @@ class MDPVideo(Scene):
         self.play(Indicate(v2r, color=GOLD, scale_factor=2.0), run_time=0.6)
         self.play(FadeIn(eq2[7]), run_time=0.4); self.wait(0.8)
 
-        c4b = cap("Two Q values: 0.94 and\n1.0. Pick the larger.")
+        c4b = cap(f"Two Q values: {fmt(sol.q_value('x1L', 0))} and\n{fmt(sol.q_value('x1L', 1))}. Pick the larger.")
         self.play(FadeTransform(c4, c4b))
         win = SurroundingRectangle(eq2, color=TEAL, buff=0.04, stroke_width=2)
         self.play(Create(win)); self.wait(1)
-        spv = MathTex(r"V^\star(x_1^L)=\max\{0.94,1.0\}=1.0\;\;(a_2)", font_size=16, color=GOLD)
+        spv = MathTex(sol.v_tex("x1L", self.nice, show_action=True), font_size=16, color=GOLD)
         spv.next_to(eq2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(spv), run_time=0.8); self.wait(1)
-        v1l = MathTex(r"V^\star\!=\!1.0", font_size=14, color=GOLD)
+        v1l = MathTex(r"V^\star\!=\!" + fmt(sol.value("x1L")), font_size=14, color=GOLD)
         v1l.next_to(self.circles["x1L"], UP, buff=0.08)
         self.play(FadeIn(v1l), FadeOut(eq1),FadeOut(eq2),FadeOut(spv),FadeOut(win),FadeOut(hl))
 
@@ -542,8 +567,7 @@ class MDPVideo(Scene):
         c5 = cap("Layer 1: solve x₂ᴸ.")
         self.play(FadeTransform(c4b, c5))
         hl = self.hl("x2L"); self.play(Create(hl))
-        eq1 = MathTex(r"Q^\star(x_2^L,a_1)",r"=",r"0.5",r"+\,0.1",r"\!\cdot\!0.4",
-                      r"+\,0.9",r"\!\cdot\!0.8",r"=1.26",
+        eq1 = MathTex(*sol.q_tex_parts("x2L", 0, self.nice),
                       font_size=16, color=WHITE).move_to([3.5, SP_Y, 0])
         self.play(FadeIn(eq1[0]),FadeIn(eq1[1]), run_time=0.4)
         self.play(Indicate(self.act_dots["x2L"][0], color=GOLD, scale_factor=2.0), run_time=0.6)
@@ -559,8 +583,7 @@ class MDPVideo(Scene):
         self.play(Indicate(v2r, color=GOLD, scale_factor=2.0), run_time=0.6)
         self.play(FadeIn(eq1[7]), run_time=0.4); self.wait(0.5)
 
-        eq2 = MathTex(r"Q^\star(x_2^L,a_2)",r"=",r"0.6",r"+\,0.3",r"\!\cdot\!0.4",
-                      r"+\,0.7",r"\!\cdot\!0.8",r"=1.28",
+        eq2 = MathTex(*sol.q_tex_parts("x2L", 1, self.nice),
                       font_size=16, color=WHITE).next_to(eq1, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(FadeIn(eq2[0]),FadeIn(eq2[1]), run_time=0.3)
         self.play(Indicate(self.act_dots["x2L"][1], color=GOLD, scale_factor=2.0), run_time=0.5)
@@ -580,10 +603,10 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c5, c5b))
         win = SurroundingRectangle(eq2, color=TEAL, buff=0.04, stroke_width=2)
         self.play(Create(win)); self.wait(0.8)
-        spv = MathTex(r"V^\star(x_2^L)=\max\{1.26,1.28\}=1.28\;\;(a_2)", font_size=16, color=GOLD)
+        spv = MathTex(sol.v_tex("x2L", self.nice, show_action=True), font_size=16, color=GOLD)
         spv.next_to(eq2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(spv), run_time=0.8); self.wait(1)
-        v2l = MathTex(r"V^\star\!=\!1.28", font_size=14, color=GOLD)
+        v2l = MathTex(r"V^\star\!=\!" + fmt(sol.value("x2L")), font_size=14, color=GOLD)
         v2l.next_to(self.circles["x2L"], UP, buff=0.08)
         self.play(FadeIn(v2l), FadeOut(eq1),FadeOut(eq2),FadeOut(spv),FadeOut(win),FadeOut(hl))
 
@@ -591,8 +614,7 @@ class MDPVideo(Scene):
         c6 = cap("Layer 0: solve x₀.")
         self.play(FadeTransform(c5b, c6))
         hl = self.hl("x0"); self.play(Create(hl))
-        eq1 = MathTex(r"Q^\star(x_0,a_1)",r"=",r"0.2",r"+\,0.9",r"\!\cdot\!1.0",
-                      r"+\,0.1",r"\!\cdot\!1.28",r"=1.228",
+        eq1 = MathTex(*sol.q_tex_parts("x0", 0, self.nice),
                       font_size=16, color=WHITE).move_to([3.5, SP_Y, 0])
         self.play(FadeIn(eq1[0]),FadeIn(eq1[1]), run_time=0.4)
         self.play(Indicate(self.act_dots["x0"][0], color=GOLD, scale_factor=2.0), run_time=0.6)
@@ -608,8 +630,7 @@ class MDPVideo(Scene):
         self.play(Indicate(v2l, color=GOLD, scale_factor=2.0), run_time=0.6)
         self.play(FadeIn(eq1[7]), run_time=0.4); self.wait(0.5)
 
-        eq2 = MathTex(r"Q^\star(x_0,a_2)",r"=",r"0.8",r"+\,0.8",r"\!\cdot\!1.0",
-                      r"+\,0.2",r"\!\cdot\!1.28",r"=1.856",
+        eq2 = MathTex(*sol.q_tex_parts("x0", 1, self.nice),
                       font_size=16, color=WHITE).next_to(eq1, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(FadeIn(eq2[0]),FadeIn(eq2[1]), run_time=0.3)
         self.play(Indicate(self.act_dots["x0"][1], color=GOLD, scale_factor=2.0), run_time=0.5)
@@ -629,20 +650,28 @@ class MDPVideo(Scene):
         self.play(FadeTransform(c6, c6b))
         win = SurroundingRectangle(eq2, color=TEAL, buff=0.04, stroke_width=2)
         self.play(Create(win)); self.wait(0.8)
-        spv = MathTex(r"V^\star(x_0)=\max\{1.228,1.856\}=1.856\;\;(a_2)", font_size=16, color=GOLD)
+        spv = MathTex(sol.v_tex("x0", self.nice, show_action=True), font_size=16, color=GOLD)
         spv.next_to(eq2, DOWN, buff=0.15, aligned_edge=LEFT)
         self.play(Write(spv), run_time=0.8); self.wait(1)
-        v0 = MathTex(r"V^\star\!=\!1.856", font_size=14, color=GOLD)
+        v0 = MathTex(r"V^\star\!=\!" + fmt(sol.value("x0")), font_size=14, color=GOLD)
         v0.next_to(self.circles["x0"], UP, buff=0.08)
         self.play(FadeIn(v0), FadeOut(eq1),FadeOut(eq2),FadeOut(spv),FadeOut(win),FadeOut(hl))
         self.wait(0.5)
 
         # Final
-        c7 = cap("The optimal value at x₀\nis 1.856, achieved by\nchoosing a₂ everywhere.")
+        acts = {sol.action(k) for k in self.state_data}
+        if len(acts) == 1:
+            a_star = acts.pop() + 1
+            c7 = cap(f"The optimal value at x₀\nis {fmt(sol.value('x0'))}, achieved by\nchoosing a{'₀₁₂₃₄₅₆₇₈₉'[a_star]} everywhere.")
+            an_tex = r"\pi^\star(\cdot)=a_" + str(a_star) + r"\;\;\forall\,x"
+        else:
+            c7 = cap(f"The optimal value at x₀\nis {fmt(sol.value('x0'))}, achieved by\nthe greedy policy π*.")
+            an_tex = r",\;".join(r"\pi^\star(" + self.nice[k] + ")=a_" + str(sol.action(k) + 1)
+                                 for k in self.state_data)
         self.play(FadeTransform(c6b, c7))
-        result = MathTex(r"V_0^\star(x_0)=1.856", font_size=30, color=GOLD).to_edge(UP, buff=0.4)
+        result = MathTex(r"V_0^\star(x_0)=" + fmt(sol.value("x0")), font_size=30, color=GOLD).to_edge(UP, buff=0.4)
         rb = SurroundingRectangle(result, color=ACCENT, buff=0.12, stroke_width=3)
-        an = MathTex(r"\pi^\star(\cdot)=a_2\;\;\forall\,x", font_size=24, color=ACCENT)
+        an = MathTex(an_tex, font_size=24, color=ACCENT)
         an.next_to(rb, DOWN, buff=0.15)
         self.play(Write(result), Create(rb), run_time=1)
         self.play(FadeIn(an)); self.wait(3)
@@ -0,0 +1,264 @@
+import numpy as np
+
+# ── Small fully-connected network ──
+# Layer l (1..L) maps h^(l-1) to z^(l) = W^(l) h^(l-1) + b^(l), h^(l) = σ_l(z^(l)).
+# Inputs are row-major batches: X has shape (N, d).
+
+
+# Every σ and σ' takes an optional `out` buffer (like a NumPy ufunc), so the
+# training loop evaluates them without allocating.
+
+
+def relu(z, out=None):
+    return np.maximum(z, 0.0, out=out)
+
+
+def relu_grad(z, out=None):
+    if out is None:
+        return (z > 0).astype(z.dtype)
+    return np.greater(z, 0, out=out)
+
+
+def identity(z, out=None):
+    if out is None:
+        return z
+    np.copyto(out, z)
+    return out
+
+
+def identity_grad(z, out=None):
+    if out is None:
+        return np.ones_like(z)
+    out.fill(1.0)
+    return out
+
+
+def sigmoid(z, out=None):
+    out = np.negative(z, out=out)
+    np.exp(out, out=out)
+    out += 1.0
+    return np.reciprocal(out, out=out)
+
+
+def sigmoid_grad(z, out=None):
+    # s(1 − s) = ¼ − (s − ½)², which needs no second buffer
+    s = sigmoid(z, out=out)
+    s -= 0.5
+    np.square(s, out=s)
+    return np.subtract(0.25, s, out=s)
+
+
+def tanh_grad(z, out=None):
+    t = np.tanh(z, out=out)
+    np.square(t, out=t)
+    return np.subtract(1.0, t, out=t)
+
+
+# name -> (σ, σ')
+ACTIVATIONS = {
+    "relu": (relu, relu_grad),
+    "identity": (identity, identity_grad),
+    "sigmoid": (sigmoid, sigmoid_grad),
+    "tanh": (np.tanh, tanh_grad),
+}
+_WRITES_OUT = frozenset(f for pair in ACTIVATIONS.values() for f in pair)
+
+
+def _into(fn):
+    """fn as fn(z, out=...); custom activations without `out` are computed and copied in."""
+    if fn in _WRITES_OUT:
+        return fn
+
+    def into(z, out):
+        out[...] = fn(z)
+        return out
+    return into
+
+
+class MLP:
+    def __init__(self, weights, biases, activations):
+        self.weights = [np.asarray(W, dtype=float) for W in weights]
+        self.biases = [np.asarray(b, dtype=float) for b in biases]
+        if isinstance(activations, str):
+            activations = [activations] * len(self.weights)
+        self.activation_names = [a if isinstance(a, str) else getattr(a[0], "__name__", "custom")
+                                 for a in activations]
+        # each entry is a registry name or an explicit (σ, σ') pair
+        self.activations = [ACTIVATIONS[a] if isinstance(a, str) else tuple(a) for a in activations]
+
+    @classmethod
+    def random(cls, layers_spec, activations="relu", seed=None, scale=None):
+        rng = np.random.default_rng(seed)
+        weights, biases = [], []
+        for n_in, n_out in zip(layers_spec[:-1], layers_spec[1:]):
+            s = np.sqrt(2.0 / n_in) if scale is None else scale
+            weights.append(s * rng.standard_normal((n_out, n_in)))
+            biases.append(np.zeros(n_out))
+        if isinstance(activations, str):
+            activations = [activations] * (len(layers_spec) - 2) + ["identity"]
+        return cls(weights, biases, activations)
+
+    @property
+    def layers_spec(self):
+        return [self.weights[0].shape[1]] + [W.shape[0] for W in self.weights]
+
+    @property
+    def n_params(self):
+        return sum(W.size + b.size for W, b in zip(self.weights, self.biases))
+
+    def forward(self, X):
+        """Batched forward pass keeping z^(l) and h^(l) for every layer."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        zs, hs = [None], [X]
+        h = X
+        for W, b, (act, _) in zip(self.weights, self.biases, self.activations):
+            z = h @ W.T + b
+            h = act(z)
+            zs.append(z); hs.append(h)
+        return Forward(self, zs, hs)
+
+    def predict(self, X, chunk=65536):
+        """Outputs only, in chunks, for very large batches (e.g. region plots)."""
+        X = np.asarray(X, dtype=float)
+        out = np.empty((len(X), self.layers_spec[-1]))
+        for i in range(0, len(X), chunk):
+            h = X[i:i + chunk]
+            for W, b, (act, _) in zip(self.weights, self.biases, self.activations):
+                h = act(h @ W.T + b)
+            out[i:i + chunk] = h
+        return out
+
+    def activation_pattern(self, X, chunk=65536):
+        """Which hidden units are active (z > 0) per input: one bool column per unit."""
+        X = np.asarray(X, dtype=float)
+        n_hidden = sum(self.layers_spec[1:-1])
+        out = np.empty((len(X), n_hidden), dtype=bool)
+        for i in range(0, len(X), chunk):
+            fwd = self.forward(X[i:i + chunk])
+            out[i:i + chunk] = np.concatenate([z > 0 for z in fwd.z[1:-1]], axis=1)
+        return out
+
+
+class Forward:
+    """Cached intermediates of one batched forward pass; z[0] is None, h[0] is the input."""
+
+    def __init__(self, net, z, h):
+        self.net, self.z, self.h = net, z, h
+
+    @property
+    def output(self):
+        return self.h[-1]
+
+    def neuron(self, layer, node, sample=0):
+        """(weights, inputs, bias, z, activation) for one neuron of one sample."""
+        W, b = self.net.weights[layer - 1], self.net.biases[layer - 1]
+        return (W[node], self.h[layer - 1][sample], b[node],
+                self.z[layer][sample, node], self.h[layer][sample, node])
+
+
+# ── Mini-batch SGD on ½·mean‖ŷ − y‖² ──
+# Activations, deltas and gradients live in buffers sized for one batch that
+# are allocated once and reused by every step; σ and σ' write into them.
+
+
+class Snapshot:
+    def __init__(self, step, loss, weights, biases):
+        self.step, self.loss = step, loss
+        self.weights, self.biases = weights, biases
+
+
+class SGD:
+    def __init__(self, net, lr=0.01, batch_size=32, seed=None):
+        self.net, self.lr, self.batch_size = net, lr, batch_size
+        self.rng = np.random.default_rng(seed)
+        spec = net.layers_spec
+        self.grad_W = [np.zeros_like(W) for W in net.weights]
+        self.grad_b = [np.zeros_like(b) for b in net.biases]
+        self._update = [(np.empty_like(W), np.empty_like(b)) for W, b in zip(net.weights, net.biases)]
+        self._h = [np.empty((batch_size, n)) for n in spec]
+        self._z = [None] + [np.empty((batch_size, n)) for n in spec[1:]]
+        self._delta = [None] + [np.empty((batch_size, n)) for n in spec[1:]]
+        self._y = np.empty((batch_size, spec[-1]))
+        self._act = [(_into(act), _into(grad)) for act, grad in net.activations]
+        self._perm, self._pos = None, 0
+        self.step_count = 0
+
+    def backward(self, X, Y):
+        """Fill grad_W / grad_b for the batch (X, Y); returns the batch loss."""
+        m = len(X)
+        if not 0 < m <= self.batch_size:
+            raise ValueError(f"batch of {m} samples; this SGD's buffers hold 1..{self.batch_size}")
+        if len(Y) != m:
+            raise ValueError(f"{m} inputs but {len(Y)} targets")
+        net = self.net
+        h = [buf[:m] for buf in self._h]
+        z = [None] + [buf[:m] for buf in self._z[1:]]
+        delta = [None] + [buf[:m] for buf in self._delta[1:]]
+        h[0][...] = X
+        for l, (W, b, (act, _)) in enumerate(zip(net.weights, net.biases, self._act), 1):
+            np.matmul(h[l - 1], W.T, out=z[l])
+            z[l] += b
+            act(z[l], out=h[l])
+
+        L = len(net.weights)
+        np.subtract(h[L], Y, out=delta[L])
+        loss = 0.5 * np.einsum("ij,ij->", delta[L], delta[L]) / m
+        delta[L] /= m
+        for l in range(L, 0, -1):
+            # z^(l) is not needed past this point, so σ'(z^(l)) overwrites it
+            delta[l] *= self._act[l - 1][1](z[l], out=z[l])
+            np.matmul(delta[l].T, h[l - 1], out=self.grad_W[l - 1])
+            np.sum(delta[l], axis=0, out=self.grad_b[l - 1])
+            if l > 1:
+                np.matmul(delta[l], net.weights[l - 1], out=delta[l - 1])
+        return float(loss)
+
+    def step(self, X, Y):
+        loss = self.backward(X, Y)
+        for W, b, gW, gb, (uW, ub) in zip(self.net.weights, self.net.biases,
+                                          self.grad_W, self.grad_b, self._update):
+            W -= np.multiply(gW, self.lr, out=uW)
+            b -= np.multiply(gb, self.lr, out=ub)
+        self.step_count += 1
+        return loss
+
+    def _batch(self, X, Y):
+        # shuffle once per epoch, then walk the permutation batch by batch
+        n = len(X)
+        if self._perm is None or len(self._perm) != n or self._pos + self.batch_size > n:
+            self._perm = self.rng.permutation(n)
+            self._pos = 0
+        m = min(self.batch_size, n)
+        idx = self._perm[self._pos:self._pos + m]
+        self._pos += m
+        np.take(X, idx, axis=0, out=self._h[0][:m])
+        np.take(Y, idx, axis=0, out=self._y[:m])
+        return self._h[0][:m], self._y[:m]
+
+    def train(self, X, Y, n_steps, snapshot_every=None, on_step=None):
+        """Run `n_steps` SGD steps now; returns the Snapshots taken every `snapshot_every` steps.
+
+        `on_step(step_count, loss)` is called after every step, e.g. to drive a
+        progress bar or a loss curve.
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float).reshape(len(X), -1)
+        snapshots = []
+        for _ in range(n_steps):
+            loss = self.step(*self._batch(X, Y))
+            if on_step is not None:
+                on_step(self.step_count, loss)
+            if snapshot_every and self.step_count % snapshot_every == 0:
+                snapshots.append(Snapshot(self.step_count, loss,
+                                          [W.copy() for W in self.net.weights],
+                                          [b.copy() for b in self.net.biases]))
+        return snapshots
+
+    def fit(self, X, Y, n_steps):
+        """Train without snapshots; returns the last batch loss."""
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float).reshape(len(X), -1)
+        loss = None
+        for _ in range(n_steps):
+            loss = self.step(*self._batch(X, Y))
+        return loss
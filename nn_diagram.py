@@ -0,0 +1,174 @@
+import numpy as np
+
+import manim
+from manim import (BLUE, GREY_B, RED, Circle, Group, ImageMobject, VGroup, VMobject,
+                   color_to_rgb, rgb_to_color)
+
+from dense_layout import edge_levels, layer_points, level_weight, line_curves
+
+# ── Network diagram index ──
+# Neurons, edges and per-neuron labels of a layered network diagram, indexed
+# once by (layer, node), so focusing a neuron is a few lookups instead of a
+# scan over every mobject.  Edges are grouped by the neuron they feed: the
+# edge src -> dst into layer l is edges_by_layer[l][src * width(l) + dst].
+#
+#     index = NetworkIndex(neurons, edges_by_layer)
+#     index.add("value", 0, 1, value_label)
+#     index.incoming(2, 1)                  # VGroup of the edges into h^(2)_2
+#     index.layer("neuron", 1, skip=0)      # layer-1 neurons but the first
+
+
+class NetworkIndex:
+    def __init__(self, neurons, edges_by_layer):
+        self.layers_spec = [len(layer) for layer in neurons]
+        self.items = {"neuron": {l: dict(enumerate(layer)) for l, layer in enumerate(neurons)},
+                      "incoming": {}}
+        self._outgoing = {}
+        for target, elist in edges_by_layer.items():
+            width, prev = self.layers_spec[target], self.layers_spec[target - 1]
+            if len(elist) != width * prev:
+                raise ValueError(f"layer {target}: expected {width * prev} edges, got {len(elist)}")
+            self.items["incoming"][target] = {
+                dst: VGroup(*elist[dst::width]) for dst in range(width)
+            }
+            for src in range(prev):
+                self._outgoing[(target - 1, src)] = VGroup(*elist[src * width:(src + 1) * width])
+
+    def add(self, kind, layer, node, mob):
+        self.items.setdefault(kind, {}).setdefault(layer, {})[node] = mob
+
+    def get(self, kind, layer, node):
+        return self.items[kind][layer][node]
+
+    def incoming(self, layer, node):
+        return self.items["incoming"][layer][node]
+
+    def outgoing(self, layer, node):
+        return self._outgoing.get((layer, node), VGroup())
+
+    def layers(self, kind):
+        return sorted(self.items.get(kind, {}))
+
+    def layer(self, kind, layer, skip=None):
+        """Mobjects of `kind` in `layer` (one per node; edges per target node), minus node `skip`."""
+        return [m for n, m in self.items.get(kind, {}).get(layer, {}).items() if n != skip]
+
+
+# ── Dense layer diagrams ──
+# One Line per edge is fine for 2-3-3-2 but a 784-128-10 network has 100k
+# edges.  DenseEdges draws all edges between two layers as a few batched
+# paths: edges are bucketed by signed weight into `bins` styles (colour
+# from negative to positive, stroke width and opacity by magnitude) and each
+# bucket is one VMobject whose subpaths are the edges.  Cairo strokes a path
+# with a single width, so per-edge style is quantised to `bins` levels.
+# Past `max_edges` only the strongest edges are kept.  The layout and binning
+# live in dense_layout.py.
+#
+# NetworkDiagram lays out a whole network; with mode="heatmap" each weight
+# matrix is shown as a colour band between the layers with the strongest
+# edges drawn on top.
+#
+#     net = MLP.random([784, 128, 10], seed=0)
+#     diagram = NetworkDiagram(net.layers_spec, net.weights, mode="heatmap")
+
+WEIGHT_COLORS = (BLUE, GREY_B, RED)      # negative, zero, positive
+
+
+def weight_colors(t, colors=WEIGHT_COLORS):
+    """RGB rows for t in [-1, 1], interpolated through `colors` (negative, zero, positive)."""
+    rgb = np.array([color_to_rgb(c) for c in colors])
+    t = np.clip(np.asarray(t, dtype=float), -1, 1)
+    lo = np.where(t < 0, 0, 1)
+    frac = np.where(t < 0, t + 1, t)[..., None]
+    return rgb[lo] * (1 - frac) + rgb[lo + 1] * frac
+
+
+class DenseEdges(VGroup):
+    def __init__(self, src, dst, weights=None, bins=9, max_edges=None, colors=WEIGHT_COLORS,
+                 min_width=0.3, max_width=2.0, min_opacity=0.15, max_opacity=0.8, **kwargs):
+        super().__init__(**kwargs)
+        src, dst = np.asarray(src, dtype=float), np.asarray(dst, dtype=float)
+        if weights is None:
+            weights = np.ones((len(dst), len(src)))
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(dst), len(src)):
+            raise ValueError(f"weights must have shape {(len(dst), len(src))}, got {weights.shape}")
+        rows, cols, level = edge_levels(weights, bins, max_edges)   # W[i, j] is src j -> dst i
+
+        self.weights = weights
+        self.bins = {}                                # level -> batched path
+        for b in np.unique(level):
+            sel = level == b
+            tb = level_weight(b, bins)
+            mag = abs(tb)
+            path = VMobject(
+                stroke_color=rgb_to_color(weight_colors(tb, colors)),
+                stroke_width=float(min_width + (max_width - min_width) * mag),
+                stroke_opacity=float(min_opacity + (max_opacity - min_opacity) * mag),
+                fill_opacity=0,
+            )
+            path.set_points(line_curves(src[cols[sel]], dst[rows[sel]]))
+            self.bins[int(b)] = path
+            self.add(path)
+        self.n_edges = len(level)
+
+
+def weight_heatmap(weights, width, height, colors=WEIGHT_COLORS):
+    """The weight matrix as an image (rows = target neurons), `width` x `height` scene units."""
+    weights = np.asarray(weights, dtype=float)
+    scale = np.abs(weights).max()
+    t = weights / scale if scale > 0 else np.zeros_like(weights)
+    rgba = np.empty(weights.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = np.rint(weight_colors(t, colors) * 255)
+    rgba[..., 3] = 255
+    image = ImageMobject(rgba)
+    image.stretch_to_fit_width(width)
+    image.stretch_to_fit_height(height)
+    nearest = getattr(manim, "RESAMPLING_ALGORITHMS", {}).get("nearest")    # one block per weight, not a blur
+    if nearest is not None:
+        image.set_resampling_algorithm(nearest)
+    return image
+
+
+class NetworkDiagram(Group):
+    def __init__(self, layers_spec, weights=None, x_positions=None, height=6.0, width=10.0,
+                 mode="edges", max_edges=4000, layer_colors=None, **kwargs):
+        if mode not in ("edges", "heatmap"):
+            raise ValueError(f"unknown mode {mode!r}")
+        super().__init__(**kwargs)
+        n_layers = len(layers_spec)
+        if x_positions is None:
+            x_positions = np.linspace(-width / 2, width / 2, n_layers)
+        if weights is None:
+            weights = [None] * (n_layers - 1)
+        if layer_colors is None:
+            layer_colors = [BLUE] + [GREY_B] * (n_layers - 2) + [RED]
+
+        self.points_by_layer = [layer_points(n, x, height) for n, x in zip(layers_spec, x_positions)]
+        self.neurons = VGroup()
+        for pts, col in zip(self.points_by_layer, layer_colors):
+            step = abs(pts[0, 1] - pts[1, 1]) if len(pts) > 1 else 1.0
+            radius = min(0.35, 0.4 * step)
+            self.neurons.add(VGroup(*[
+                Circle(radius=radius, stroke_color=col, stroke_width=min(2.5, 20 * radius),
+                       fill_color=col, fill_opacity=0.25).move_to(p)
+                for p in pts
+            ]))
+
+        self.edges, self.heatmaps = {}, {}
+        for l in range(1, n_layers):
+            src, dst, W = self.points_by_layer[l - 1], self.points_by_layer[l], weights[l - 1]
+            if mode == "heatmap" and W is not None:
+                gap = dst[0, 0] - src[0, 0]
+                span = max(np.ptp(src[:, 1]), np.ptp(dst[:, 1]), 0.5)
+                band = weight_heatmap(W, 0.4 * abs(gap), span)
+                band.move_to([(src[0, 0] + dst[0, 0]) / 2, 0, 0])
+                self.heatmaps[l] = band
+                self.add(band)
+                # a sparse set of the strongest edges over the band
+                edges = DenseEdges(src, dst, W, max_edges=min(max_edges, 200))
+            else:
+                edges = DenseEdges(src, dst, W, max_edges=max_edges)
+            self.edges[l] = edges
+            self.add(edges)
+        self.add(self.neurons)
@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from dirty_regions import DirtyRegionMixin
+from group_style import GroupStyle
+from mlp import MLP
+from nn_diagram import NetworkIndex
+from tex_cache import MathTex
+
 # ── palette ──────────────────────────────────────────────────────
 INPUT_COL   = BLUE
 HIDDEN_COL  = GREEN
@@ -26,13 +32,14 @@ def make_caption(text, max_words=6):
     return t
 
 
-class FeedforwardNN(MovingCameraScene):
+class FeedforwardNN(DirtyRegionMixin, MovingCameraScene):
     def construct(self):
         self.camera.background_color = BG
 
         # ═══════════════════════════════════════════════
         # PART 1 – TITLE
         # ═══════════════════════════════════════════════
+        self.next_section("PART 1 – TITLE")
         title = Text("Feedforward Neural Networks", font_size=48, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(1.5)
@@ -42,6 +49,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 1b – WHAT A NN IS
         # ═══════════════════════════════════════════════
+        self.next_section("PART 1b – WHAT A NN IS")
         idea_title = Text("The Big Idea", font_size=40, color=ACCENT)
         idea_title.to_edge(UP, buff=0.5)
         self.play(Write(idea_title))
@@ -91,6 +99,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 2 – BUILDING BLOCKS
         # ═══════════════════════════════════════════════
+        self.next_section("PART 2 – BUILDING BLOCKS")
         bb_title = Text("Two Building Blocks", font_size=40, color=ACCENT)
         bb_title.to_edge(UP, buff=0.5)
         self.play(Write(bb_title))
@@ -147,6 +156,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 3 – BUILD THE 2-3-3-2 NETWORK
         # ═══════════════════════════════════════════════
+        self.next_section("PART 3 – BUILD THE 2-3-3-2 NETWORK")
         net_title = Text("A 2-3-3-2 Network", font_size=40, color=ACCENT)
         net_title.to_edge(UP, buff=0.4)
         self.play(Write(net_title))
@@ -197,6 +207,7 @@ class FeedforwardNN(MovingCameraScene):
                     edges_by_layer[target].append(edge)
                     all_edges_list.append(edge)
         all_edges = VGroup(*all_edges_list)
+        index = NetworkIndex(neurons, edges_by_layer)
         self.play(LaggedStart(
             *[Create(e) for e in all_edges_list], lag_ratio=0.01,
         ), run_time=1.5)
@@ -236,26 +247,23 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 3b – SHOW WEIGHTS & BIASES
         # ═══════════════════════════════════════════════
+        self.next_section("PART 3b – SHOW WEIGHTS & BIASES")
         W1 = np.array([[1, -2], [0.5, 1], [-1, 0]])
         b1 = np.array([0.1, 0.2, -0.3])
         W2 = np.array([[1, 0, -1], [0, 2, 0.5], [-0.5, 0, 1]])
         b2 = np.array([0, 0.1, -0.2])
         W3 = np.array([[1, -1, 0.5], [-0.5, 1, 1]])
         b3 = np.array([0.1, -0.1])
-
         Ws = [None, W1, W2, W3]
         bs = [None, b1, b2, b3]
 
         # Clean LaTeX annotations (no \! spacing hacks)
         wb_annot_w_str = {
-            1: [r"w=(1,-2)", r"w=(0.5, 1)", r"w=(-1, 0)"],
-            2: [r"w=(1,0,-1)", r"w=(0,2,0.5)", r"w=(-0.5,0,1)"],
-            3: [r"w=(1,-1,0.5)", r"w=(-0.5,1,1)"],
+            l: [r"w=(" + ",".join(f"{w:g}" for w in row) + ")" for row in Ws[l]]
+            for l in [1, 2, 3]
         }
         wb_annot_b_str = {
-            1: [r"b=0.1", r"b=0.2", r"b=-0.3"],
-            2: [r"b=0", r"b=0.1", r"b=-0.2"],
-            3: [r"b=0.1", r"b=-0.1"],
+            l: [f"b={b:g}" for b in bs[l]] for l in [1, 2, 3]
         }
 
         # Build annotation mobjects: wb_annots[layer][node] = VGroup(w_tex, b_tex)
@@ -273,6 +281,7 @@ class FeedforwardNN(MovingCameraScene):
                 annot = VGroup(w_tex, b_tex).arrange(DOWN, buff=0.06)
                 annot.next_to(neurons[l_idx][n_idx], DOWN, buff=0.18)
                 wb_annots[l_idx].append(annot)
+                index.add("weights", l_idx, n_idx, annot)
                 wb_annots_flat.append(annot)
 
         wb_group = VGroup(*wb_annots_flat)
@@ -294,18 +303,14 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 4 – FORWARD PASS WITH ZOOM
         # ═══════════════════════════════════════════════
+        self.next_section("PART 4 – FORWARD PASS WITH ZOOM")
         input_vals = np.array([1.0, -1.0])
 
-        def relu(z):
-            return np.maximum(0, z)
+        net = MLP(Ws[1:], bs[1:], ["relu", "relu", "identity"])
+        fwd = net.forward(input_vals[None])
+        y_hat = fwd.output[0]
 
-        z1 = W1 @ input_vals + b1;  h1 = relu(z1)
-        z2 = W2 @ h1 + b2;          h2 = relu(z2)
-        y_hat = W3 @ h2 + b3
-
-        all_vals = [input_vals, h1, h2, y_hat]
-        all_z = [None, z1, z2, None]
-        has_relu = [False, True, True, False]
+        has_relu = [False] + [a == "relu" for a in net.activation_names]
 
         value_labels = {}
 
@@ -318,6 +323,7 @@ class FeedforwardNN(MovingCameraScene):
             vl = Text(vstr, font_size=18, color=ACCENT)
             vl.next_to(n, UP, buff=0.12)
             value_labels[(0, n_idx)] = vl
+            index.add("value", 0, n_idx, vl)
             self.play(
                 n.animate.set_fill(ACCENT, opacity=0.5),
                 FadeIn(vl), run_time=0.5,
@@ -333,47 +339,18 @@ class FeedforwardNN(MovingCameraScene):
             2: [r"h^{(1)}_1", r"h^{(1)}_2", r"h^{(1)}_3"],
             3: [r"h^{(2)}_1", r"h^{(2)}_2", r"h^{(2)}_3"],
         }
-        prev_vals_list = {1: input_vals, 2: h1, 3: h2}
         node_syms = {1: h1_ltex, 2: h2_ltex, 3: output_ltex}
 
-        def get_incoming_edges(cur_layer, cur_node):
-            elist = edges_by_layer[cur_layer]
-            return [elist[i] for i in range(len(elist))
-                    if i % layers_spec[cur_layer] == cur_node]
-
         def get_others(cur_layer, cur_node):
-            others = []
-            others.append(net_title)
-            others.append(ll_group)
-            # All wb annotations EXCEPT the current node's
-            for li in wb_annots:
-                for ni, annot in enumerate(wb_annots[li]):
-                    if li == cur_layer and ni == cur_node:
+            # everything but the focused neuron, its inputs and their edges
+            others = [net_title, ll_group, nl_group]
+            for kind in ("weights", "neuron", "incoming", "value"):
+                for li in index.layers(kind):
+                    if li == cur_layer - 1 and kind in ("neuron", "value"):
                         continue
-                    others.append(annot)
-            for lbl in all_neuron_labels:
-                others.append(lbl)
-            for li in range(len(layers_spec)):
-                for ni, n in enumerate(neurons[li]):
-                    if li == cur_layer and ni == cur_node:
-                        continue
-                    if li == cur_layer - 1:
-                        continue
-                    others.append(n)
-            for tgt, elist in edges_by_layer.items():
-                if tgt != cur_layer:
-                    for e in elist:
-                        others.append(e)
-                else:
-                    for idx, e in enumerate(elist):
-                        if idx % layers_spec[cur_layer] != cur_node:
-                            others.append(e)
-            for key, vl in value_labels.items():
-                li, ni = key
-                if li == cur_layer - 1:
-                    continue
-                others.append(vl)
-            return VGroup(*others)
+                    skip = cur_node if li == cur_layer else None
+                    others += index.layer(kind, li, skip=skip)
+            return others
 
         for l_idx in range(1, 4):
             n_count = layers_spec[l_idx]
@@ -398,7 +375,7 @@ class FeedforwardNN(MovingCameraScene):
                 cam_target = np.array([mid_x, mid_y, 0])
 
                 others = get_others(l_idx, n_idx)
-                incoming = get_incoming_edges(l_idx, n_idx)
+                incoming = index.incoming(l_idx, n_idx)
 
                 # ── Fade others, zoom in ──
                 edge_anims = [
@@ -406,7 +383,7 @@ class FeedforwardNN(MovingCameraScene):
                     for e in incoming
                 ]
                 self.play(
-                    others.animate.set_opacity(0.07),
+                    GroupStyle(*others, opacity=0.07),
                     self.camera.frame.animate.set_width(6).move_to(cam_target),
                     neurons[l_idx][n_idx].animate.set_stroke(ACCENT, width=4),
                     *edge_anims,
@@ -417,24 +394,19 @@ class FeedforwardNN(MovingCameraScene):
                 cur_annot = wb_annots[l_idx][n_idx]
 
                 inp_syms = prev_input_syms[l_idx]
-                inp_vals_arr = prev_vals_list[l_idx]
-                z_val = (all_z[l_idx][n_idx]
-                         if all_z[l_idx] is not None
-                         else all_vals[l_idx][n_idx])
-                act_val = all_vals[l_idx][n_idx]
-                bias_num = bs[l_idx][n_idx]
+                w_row, inp_vals_arr, bias_num, z_val, act_val = fwd.neuron(l_idx, n_idx)
 
                 # Line 1 (symbolic): z = (w1)(x1) + (w2)(x2) + (b)
                 parts = []
                 for k in range(prev_n):
-                    w_num = Ws[l_idx][n_idx, k]
+                    w_num = w_row[k]
                     parts.append(f"({w_num:g})({inp_syms[k]})")
                 sym_line = r"z = " + " + ".join(parts) + f" + ({bias_num:g})"
 
                 # Line 2 (numeric): = products + bias = z
                 num_parts = []
                 for k in range(prev_n):
-                    w_num = Ws[l_idx][n_idx, k]
+                    w_num = w_row[k]
                     v_num = inp_vals_arr[k]
                     prod = w_num * v_num
                     num_parts.append(f"{prod:g}")
@@ -502,6 +474,7 @@ class FeedforwardNN(MovingCameraScene):
                 vl = Text(f"{act_val:.2g}", font_size=16, color=ACCENT)
                 vl.next_to(neurons[l_idx][n_idx], UP, buff=0.12)
                 value_labels[(l_idx, n_idx)] = vl
+                index.add("value", l_idx, n_idx, vl)
 
                 result_col = ACCENT
                 result_opacity = 0.5
@@ -528,7 +501,7 @@ class FeedforwardNN(MovingCameraScene):
                     self.camera.frame.animate.set_width(
                         default_frame_width
                     ).move_to(default_frame_center),
-                    others.animate.set_opacity(1),
+                    GroupStyle(*others, opacity=1),
                     run_time=0.6,
                 )
 
@@ -554,6 +527,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 5 – WHY NONLINEARITIES MATTER
         # ═══════════════════════════════════════════════
+        self.next_section("PART 5 – WHY NONLINEARITIES MATTER")
         why_title = Text("Why Nonlinearities Matter", font_size=40, color=ACCENT)
         why_title.to_edge(UP, buff=0.5)
         self.play(Write(why_title))
@@ -614,6 +588,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 6 – PIECEWISE LINEAR RELU
         # ═══════════════════════════════════════════════
+        self.next_section("PART 6 – PIECEWISE LINEAR RELU")
         relu_title = Text(
             "ReLU Builds Piecewise\nLinear Functions",
             font_size=38, color=ACCENT,
@@ -713,6 +688,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 7 – PARAMETER COUNTING
         # ═══════════════════════════════════════════════
+        self.next_section("PART 7 – PARAMETER COUNTING")
         pc_title = Text("Counting Parameters", font_size=40, color=ACCENT)
         pc_title.to_edge(UP, buff=0.5)
         self.play(Write(pc_title))
@@ -756,6 +732,7 @@ class FeedforwardNN(MovingCameraScene):
         # ═══════════════════════════════════════════════
         # PART 8 – SUMMARY
         # ═══════════════════════════════════════════════
+        self.next_section("PART 8 – SUMMARY")
         summary_title = Text("Summary", font_size=44, color=ACCENT)
         summary_title.to_edge(UP, buff=0.6)
         self.play(Write(summary_title))
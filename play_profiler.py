@@ -0,0 +1,196 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import manim
+
+import render_sections
+
+# ── Per-animation profiling ──
+# Every self.play / self.wait is tagged with the scene source line that
+# issued it and the section it ran in, and its time is split into
+#   setup        compile_animation_data + begin_animations
+#   interpolate  update_to_time (mobject interpolation per frame)
+#   render       camera rasterisation of the frame
+#   encode       handing frames to the movie writer
+# Reports aggregate by file:line and by section; `folded()` emits
+# flamegraph/speedscope "folded stacks".
+#
+#     python play_profiler.py MDPVideo -q l --top 25 --folded mdp.folded
+
+PHASES = ("setup", "interpolate", "render", "encode")
+SCENE_FILES = frozenset(render_sections.SCENES.values())
+
+
+def caller_tag(depth=2):
+    """file:line of the innermost frame inside a scene file."""
+    f = sys._getframe(depth)
+    while f is not None:
+        name = os.path.basename(f.f_code.co_filename)
+        if name in SCENE_FILES:
+            return f"{name}:{f.f_lineno}"
+        f = f.f_back
+    return "<unknown>"
+
+
+class PlayProfiler:
+    def __init__(self):
+        self.records = []
+        self.section = "prelude"
+        self._current = None
+        self._stack = []
+        self._patched = []
+
+    # ── patching ──
+    def _patch(self, owner, attr, wrapper):
+        fn = owner.__dict__.get(attr)
+        if fn is None:
+            return
+        self._patched.append((owner, attr, fn))
+        setattr(owner, attr, wrapper(fn))
+
+    def _call(self, kind):
+        prof = self
+
+        def wrapper(fn):
+            def profiled(scene, *args, **kwargs):
+                if prof._current is not None:
+                    # wait() is implemented with play(): count it once
+                    return fn(scene, *args, **kwargs)
+                rec = dict(tag=caller_tag(), section=prof.section, kind=kind,
+                           frames=0, **dict.fromkeys(PHASES, 0.0))
+                prof._current = rec
+                start = time.perf_counter()
+                try:
+                    return fn(scene, *args, **kwargs)
+                finally:
+                    rec["total"] = time.perf_counter() - start
+                    prof._current = None
+                    prof.records.append(rec)
+            return profiled
+        return wrapper
+
+    def _phase(self, phase, count_frames=False):
+        prof = self
+
+        def wrapper(fn):
+            def timed(*args, **kwargs):
+                rec = prof._current
+                if rec is None:
+                    return fn(*args, **kwargs)
+                prof._stack.append([time.perf_counter(), 0.0])
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    start, child = prof._stack.pop()
+                    elapsed = time.perf_counter() - start
+                    rec[phase] += elapsed - child
+                    if prof._stack:
+                        prof._stack[-1][1] += elapsed
+                    if count_frames:
+                        # frozen waits write one frame with num_frames=N
+                        rec["frames"] += render_sections.frame_count(args, kwargs)
+            return timed
+        return wrapper
+
+    def _section(self, fn):
+        prof = self
+
+        def next_section(scene, name="unnamed", *args, **kwargs):
+            prof.section = name
+            return fn(scene, name, *args, **kwargs)
+        return next_section
+
+    def __enter__(self):
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        Scene = manim.Scene
+        self._patch(Scene, "play", self._call("play"))
+        self._patch(Scene, "wait", self._call("wait"))
+        self._patch(Scene, "next_section", self._section)
+        self._patch(Scene, "compile_animation_data", self._phase("setup"))
+        self._patch(Scene, "begin_animations", self._phase("setup"))
+        self._patch(Scene, "update_to_time", self._phase("interpolate"))
+        self._patch(CairoRenderer, "update_frame", self._phase("render"))
+        self._patch(SceneFileWriter, "write_frame", self._phase("encode", count_frames=True))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, attr, fn in reversed(self._patched):
+            setattr(owner, attr, fn)
+        self._patched.clear()
+
+    # ── reports ──
+    def aggregate(self, key):
+        out = defaultdict(lambda: dict(calls=0, frames=0, total=0.0, **dict.fromkeys(PHASES, 0.0)))
+        for r in self.records:
+            agg = out[r[key]]
+            agg["calls"] += 1
+            for k in ("frames", "total") + PHASES:
+                agg[k] += r[k]
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["total"]))
+
+    def folded(self, scene_name):
+        """'scene;section;file:line;phase microseconds' lines."""
+        agg = defaultdict(float)
+        for r in self.records:
+            for p in PHASES:
+                agg[(r["section"], r["tag"], p)] += r[p]
+            agg[(r["section"], r["tag"], "other")] += r["total"] - sum(r[p] for p in PHASES)
+        return [f"{scene_name};{s};{t};{p} {int(v * 1e6)}"
+                for (s, t, p), v in agg.items() if v > 0]
+
+    def table(self, key="tag", top=20):
+        rows = list(self.aggregate(key).items())[:top]
+        grand = sum(r["total"] for r in self.records) or 1.0
+        lines = [f"{key:<40} {'calls':>5} {'frames':>6} {'total':>7} "
+                 + " ".join(f"{p:>11}" for p in PHASES)]
+        for name, a in rows:
+            bar = "█" * int(round(30 * a["total"] / grand))
+            lines.append(f"{str(name)[:40]:<40} {a['calls']:>5} {a['frames']:>6} {a['total']:>7.2f} "
+                         + " ".join(f"{a[p]:>11.2f}" for p in PHASES) + "  " + bar)
+        return "\n".join(lines)
+
+
+def profile(name, quality="l", section=None):
+    """Render `name` (or one of its sections) under the profiler."""
+    index = 0 if section is None else section
+    cfg = render_sections.section_config(name, index, quality)
+    cfg.update(media_dir=os.path.join(render_sections.ROOT, "media", "profile"), output_file=name)
+    with manim.tempconfig(cfg), PlayProfiler() as prof:
+        scene_cls = render_sections.load_scene(name)
+        if section is not None:
+            scene_cls = render_sections.section_scene(scene_cls, section)
+        scene_cls().render()
+    return prof
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile every play/wait of a scene.")
+    parser.add_argument("scene", choices=sorted(render_sections.SCENES))
+    parser.add_argument("-q", "--quality", choices=sorted(render_sections.QUALITIES), default="l")
+    parser.add_argument("-s", "--section", type=int, help="profile only this section")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", help="write raw records and aggregates here")
+    parser.add_argument("--folded", help="write folded stacks here (flamegraph.pl / speedscope)")
+    args = parser.parse_args(argv)
+
+    prof = profile(args.scene, args.quality, args.section)
+    print(prof.table("tag", args.top))
+    print()
+    print(prof.table("section", args.top))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"records": prof.records, "by_tag": prof.aggregate("tag"),
+                       "by_section": prof.aggregate("section")}, f, indent=1)
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as f:
+            f.write("\n".join(prof.folded(args.scene)) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import numpy as np
+
+import manim
+from manim.camera.camera import Camera
+
+from dirty_regions import animation_extent
+
+# ── Frozen raster layers ──
+# A frozen group is rasterised once into an ImageMobject that takes the
+# group's place (and z-order) in the scene, so each frame composites one
+# bitmap instead of re-filling every circle, glyph and arrow.
+#
+# RasterLayerMixin keeps frozen layers honest: before a play/add/remove
+# that touches a member, or a play after a member changed in place
+# (transform, colour, opacity), the layer thaws back into the live
+# mobjects.  It is re-rasterised lazily, at the first later play that
+# doesn't touch it, so a run of Indicates on members costs one re-freeze
+# instead of one per play.
+#
+#     class MDPVideo(RasterLayerMixin, DirtyRegionMixin, Scene): ...
+#     self.freeze_layer(self.mdp_group)
+
+
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def group_state(group):
+    """What the group's pixels are drawn from, cheap enough to compare on every play.
+
+    Points and RGBA rows are copied by value: shift, stretch and colour
+    setters usually write into the existing arrays in place, so keeping
+    references would miss them.  One concatenated copy per play is a memcpy
+    next to the re-rasterisation it saves.
+    """
+    family = group.get_family()
+    points, rows, scalars = [], [], []
+    for m in family:
+        points.append(np.asarray(m.points, dtype=float).ravel())
+        for attr in STYLE_ARRAYS:
+            v = getattr(m, attr, None)
+            if v is not None:
+                rows.append(np.asarray(v, dtype=float).ravel())
+        scalars.append((len(m.points), getattr(m, "stroke_width", None), m.z_index))
+    points = np.concatenate(points) if points else np.zeros(0)
+    style = np.concatenate(rows) if rows else np.zeros(0)
+    return family, points, style, scalars
+
+
+def same_state(a, b):
+    return (len(a[0]) == len(b[0])
+            and all(x is y for x, y in zip(a[0], b[0]))
+            and a[3] == b[3]
+            and np.array_equal(a[1], b[1]) and np.array_equal(a[2], b[2]))
+
+
+class RasterLayer:
+    def __init__(self, group):
+        self.group = group
+        self.family = set(group.get_family())
+        self.image = None
+        self.members = []         # top-level scene mobjects the image stands in for
+        self._state = None
+
+    @property
+    def frozen(self):
+        return self.image is not None
+
+    def touches(self, mobjects):
+        return any(m in self.family for m in mobjects)
+
+    def stale(self):
+        return self.frozen and not same_state(group_state(self.group), self._state)
+
+    def rasterize(self, scene):
+        src = scene.camera
+        cam = Camera(pixel_height=src.pixel_height, pixel_width=src.pixel_width,
+                     frame_height=src.frame_height, frame_width=src.frame_width,
+                     frame_center=src.frame_center, background_opacity=0)
+        cam.capture_mobjects(self.members)
+        pixels = cam.pixel_array
+        rows = np.flatnonzero(pixels[:, :, 3].any(axis=1))
+        cols = np.flatnonzero(pixels[:, :, 3].any(axis=0))
+        if not len(rows):
+            return None
+        r0, r1, c0, c1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        unit = src.frame_height / src.pixel_height
+        image = manim.ImageMobject(np.ascontiguousarray(pixels[r0:r1, c0:c1]))
+        image.stretch_to_fit_height((r1 - r0) * unit)
+        image.stretch_to_fit_width((c1 - c0) * unit)
+        centre = src.frame_center + np.array([
+            -src.frame_width / 2 + (c0 + c1) / 2 * unit,
+            src.frame_height / 2 - (r0 + r1) / 2 * unit,
+            0.0,
+        ])
+        image.move_to(centre)
+        # the bitmap sits exactly on the pixel grid, so don't resample it
+        nearest = getattr(manim, "RESAMPLING_ALGORITHMS", {}).get("nearest")
+        if nearest is not None:
+            image.set_resampling_algorithm(nearest)
+        return image
+
+    def freeze(self, scene):
+        self.family = set(self.group.get_family())
+        self.members = [m for m in scene.mobjects if m in self.family]
+        if not self.members or self.frozen:
+            return
+        image = self.rasterize(scene)
+        if image is None:
+            return
+        index = scene.mobjects.index(self.members[0])
+        scene.mobjects[:] = [m for m in scene.mobjects if m not in self.family]
+        scene.mobjects.insert(index, image)
+        self.image = image
+        self._state = group_state(self.group)
+
+    def sync(self, scene):
+        # the bitmap itself was removed (e.g. a FadeOut of every scene mobject): so are the members
+        if self.frozen and self.image not in scene.mobjects:
+            self.image, self.members = None, []
+
+    def thaw(self, scene):
+        if not self.frozen:
+            return
+        index = scene.mobjects.index(self.image)
+        scene.mobjects[index:index + 1] = self.members
+        self.image = None
+
+
+class RasterLayerMixin:
+    def freeze_layer(self, group):
+        layers = self.__dict__.setdefault("_raster_layers", [])
+        layer = RasterLayer(group)
+        layers.append(layer)
+        layer.freeze(self)
+        return layer
+
+    def thaw_layer(self, group):
+        for layer in list(self.__dict__.get("_raster_layers", [])):
+            if layer.group is group:
+                layer.thaw(self)
+                self._raster_layers.remove(layer)
+
+    def _thaw_touched(self, mobjects, check_stale=False):
+        for layer in self.__dict__.get("_raster_layers", []):
+            layer.sync(self)
+            if layer.frozen and (layer.touches(mobjects) or (check_stale and layer.stale())):
+                layer.thaw(self)
+
+    def _refreeze(self, mobjects):
+        # thawed layers stay live while consecutive plays keep touching them
+        for layer in self.__dict__.get("_raster_layers", []):
+            layer.sync(self)
+            if not layer.frozen and not layer.touches(mobjects):
+                layer.freeze(self)
+
+    def play(self, *args, **kwargs):
+        touched = []
+        for anim in args:
+            animation_extent(anim, touched)
+        touched = [m for mob in touched for m in mob.get_family()]
+        # in-place edits only show up once frames are drawn, so only plays check for them
+        self._thaw_touched(touched, check_stale=True)
+        self._refreeze(touched)
+        super().play(*args, **kwargs)
+
+    def add(self, *mobjects):
+        self._thaw_touched([m for mob in mobjects for m in mob.get_family()])
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects):
+        self._thaw_touched([m for mob in mobjects for m in mob.get_family()])
+        return super().remove(*mobjects)
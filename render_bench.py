@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import manim
+
+import render_sections
+import tex_cache
+
+# ── Render benchmarks ──
+# Renders each scene class at the requested qualities, each case in a fresh
+# process, and splits wall time into the stages below by timing the manim
+# entry points that implement them.  Timers are exclusive: time spent in a
+# nested stage (e.g. SVG parsing inside a Text) is only counted once.
+#
+#     python render_bench.py -q l p -o bench.json
+#     python render_bench.py -q l --baseline bench.json     # exit 1 on regressions
+
+STAGES = ("latex", "svg_parse", "text_layout", "rasterize", "encode")
+THRESHOLD = 0.30
+
+
+def _targets():
+    from manim.camera import camera
+    from manim.mobject.svg import svg_mobject
+    from manim.mobject.text import tex_mobject, text_mobject
+    from manim.scene import scene_file_writer
+    from manim.utils import tex_file_writing
+
+    return [
+        ("latex", tex_file_writing, "tex_to_svg_file"),
+        ("latex", tex_mobject, "tex_to_svg_file"),
+        ("svg_parse", svg_mobject.SVGMobject, "generate_mobject"),
+        ("text_layout", text_mobject.Text, "_text2svg"),
+        ("text_layout", text_mobject.MarkupText, "_text2svg"),
+        ("rasterize", camera.Camera, "capture_mobjects"),
+        ("encode", scene_file_writer.SceneFileWriter, "write_frame"),
+        ("encode", scene_file_writer.SceneFileWriter, "close_partial_movie_stream"),
+        ("encode", scene_file_writer.SceneFileWriter, "combine_to_movie"),
+    ]
+
+
+class StageTimer:
+    def __init__(self):
+        self.totals = dict.fromkeys(STAGES, 0.0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.frames = 0
+        self._stack = []      # [stage, start, child time]
+        self._patched = []
+
+    def wrap(self, stage, fn, frames=False):
+        def timed(*args, **kwargs):
+            if frames:
+                self.frames += render_sections.frame_count(args, kwargs)
+            self._stack.append([stage, time.perf_counter(), 0.0])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _, start, child = self._stack.pop()
+                elapsed = time.perf_counter() - start
+                self.totals[stage] += elapsed - child
+                self.calls[stage] += 1
+                if self._stack:
+                    self._stack[-1][2] += elapsed
+        timed.__wrapped__ = fn
+        return timed
+
+    def __enter__(self):
+        for stage, owner, attr in _targets():
+            fn = owner.__dict__.get(attr) if isinstance(owner, type) else getattr(owner, attr, None)
+            if fn is None:
+                continue      # not present in this manim version
+            self._patched.append((owner, attr, fn))
+            setattr(owner, attr, self.wrap(stage, fn, frames=attr == "write_frame"))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, attr, fn in reversed(self._patched):
+            setattr(owner, attr, fn)
+        self._patched.clear()
+
+
+def bench_case(name, quality, cold=True):
+    """Render one scene at one quality in this process; returns the timing record."""
+    with tempfile.TemporaryDirectory(prefix=f"bench_{name}_{quality}_") as tmp:
+        if cold:
+            tex_cache.cache = tex_cache.TexCache(os.path.join(tmp, "tex_cache"))
+        cfg = {
+            "quality": render_sections.QUALITIES[quality],
+            "media_dir": tmp if cold else os.path.join(render_sections.ROOT, "media", "bench"),
+            "disable_caching": True,
+            "progress_bar": "none",
+        }
+        with manim.tempconfig(cfg), StageTimer() as timer:
+            scene_cls = render_sections.load_scene(name)
+            start = time.perf_counter()
+            scene = scene_cls()
+            scene.render()
+            wall = time.perf_counter() - start
+    record = {"wall": wall, **timer.totals}
+    record["other"] = wall - sum(timer.totals.values())
+    record["frames"] = timer.frames
+    record["plays"] = scene.renderer.num_plays
+    return record
+
+
+def run(scenes, qualities, cold=True):
+    report = {
+        "manim": manim.__version__,
+        "python": sys.version.split()[0],
+        "machine": platform.platform(),
+        "cold": cold,
+        "results": {},
+    }
+    ctx = get_context("spawn")
+    for name in scenes:
+        for q in qualities:
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                report["results"][f"{name}/{q}"] = pool.submit(bench_case, name, q, cold).result()
+            r = report["results"][f"{name}/{q}"]
+            print(f"{name}/{q}: {r['wall']:.1f}s  "
+                  + "  ".join(f"{s}={r[s]:.1f}" for s in STAGES + ("other",)))
+    return report
+
+
+def compare(report, baseline, threshold=THRESHOLD):
+    """[(case, metric, base, now, ratio)] for every metric that got `threshold` slower."""
+    regressions = []
+    for case, now in report["results"].items():
+        base = baseline.get("results", {}).get(case)
+        if base is None:
+            continue
+        for metric in ("wall",) + STAGES:
+            # ignore stages too small to time reliably
+            if base.get(metric, 0) < 0.5:
+                continue
+            ratio = now[metric] / base[metric]
+            if ratio > 1 + threshold:
+                regressions.append((case, metric, base[metric], now[metric], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene renders.")
+    parser.add_argument("-s", "--scenes", nargs="+", choices=sorted(render_sections.SCENES),
+                        default=list(render_sections.SCENES))
+    parser.add_argument("-q", "--qualities", nargs="+", choices=sorted(render_sections.QUALITIES),
+                        default=["l", "p"])
+    parser.add_argument("-o", "--output", default="bench.json")
+    parser.add_argument("--baseline", help="report to diff against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--warm", action="store_true",
+                        help="keep the shared tex cache and media dir instead of starting cold")
+    args = parser.parse_args(argv)
+
+    report = run(args.scenes, args.qualities, cold=not args.warm)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for case, metric, base, now, ratio in regressions:
+            print(f"REGRESSION {case} {metric}: {base:.1f}s -> {now:.1f}s ({ratio - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
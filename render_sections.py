@@ -0,0 +1,191 @@
+import argparse
+import importlib.util
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import manim
+
+from section_manifest import Manifest, fingerprints, probe_scene, section_reads
+
+# ── Parallel per-section rendering ──
+# Every scene marks its banner sections with `self.next_section("...")`.
+# A worker renders section k by replaying construct() with all earlier
+# sections skipped (no frames are rasterised, animations jump to their end
+# state), so section k starts from exactly the mobjects, camera and Python
+# state the serial render would have; it stops as soon as section k + 1
+# begins.  The per-section movies are then concatenated without re-encoding.
+# Sections whose fingerprint (see section_manifest.py) is unchanged since the
+# last render are reused from the manifest instead of being rendered again.
+#
+#     python render_sections.py LimitsVideo -q h -j 8
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MEDIA_DIR = os.path.join(ROOT, "media", "sections")
+
+SCENES = {
+    "MultiArmedBandit": "bandit.py",
+    "ContextualBanditsVideo": "contextual_bandits.py",
+    "LimitsVideo": "limits.py",
+    "MDPVideo": "mdp_video_v9.py",
+    "FeedforwardNN": "nn_video6.py",
+}
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+SECTION_RE = re.compile(r'self\.next_section\("([^"]*)"\)')
+
+
+def scene_path(name):
+    return os.path.join(ROOT, SCENES[name])
+
+
+def load_scene(name):
+    path = scene_path(name)
+    spec = importlib.util.spec_from_file_location(os.path.splitext(SCENES[name])[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def section_names(name):
+    with open(scene_path(name), encoding="utf-8") as f:
+        return SECTION_RE.findall(f.read())
+
+
+def frame_count(args, kwargs):
+    """Frames one write_frame(self, frame, n) call writes (`num_frames`, `repeat` in newer manim)."""
+    if len(args) > 2:
+        return int(args[2])
+    return int(kwargs.get("num_frames", kwargs.get("repeat", 1)))
+
+
+class SectionDone(Exception):
+    pass
+
+
+def section_scene(scene_cls, index, stream=False):
+    """Subclass of `scene_cls` that only renders its `index`-th section."""
+
+    class SectionScene(scene_cls):
+        def setup(self):
+            if stream:
+                # stream_writer imports this module for SCENES / load_scene
+                from stream_writer import use_streaming
+                use_streaming(self, dedup=stream == "dedup")
+            super().setup()
+            self._section = -1
+            # anything played before the first banner belongs to no section
+            super().next_section("prelude", skip_animations=True)
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            self._section += 1
+            if self._section > index:
+                raise SectionDone
+            super().next_section(name, skip_animations=self._section != index)
+
+        def construct(self):
+            try:
+                super().construct()
+            except SectionDone:
+                pass
+
+    SectionScene.__name__ = f"{scene_cls.__name__}_{index:02d}"
+    return SectionScene
+
+
+def section_config(name, index, quality):
+    return {
+        "quality": QUALITIES[quality],
+        "media_dir": os.path.join(MEDIA_DIR, name, f"{index:02d}"),
+        "output_file": f"{name}_{index:02d}",
+        "progress_bar": "none",
+    }
+
+
+def render_section(name, index, quality="l", stream=False):
+    """Render one section in this process; returns the movie path (None if it has no frames)."""
+    with manim.tempconfig(section_config(name, index, quality)):
+        scene = section_scene(load_scene(name), index, stream)()
+        scene.render()
+        path = scene.renderer.file_writer.movie_file_path
+    return str(path) if path and os.path.exists(path) else None
+
+
+def stitch(paths, output):
+    """Concatenate section movies (same codec/size) without re-encoding."""
+    list_file = output + ".txt"
+    with open(list_file, "w", encoding="utf-8") as f:
+        for p in paths:
+            f.write("file '" + p.replace("'", r"'\''") + "'\n")
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                    "-i", list_file, "-c", "copy", output], check=True)
+    os.remove(list_file)
+    return output
+
+
+def probe(name, quality="l"):
+    """Entry-state digest of every section from one frameless pass over construct()."""
+    digests = []
+    cfg = section_config(name, 0, quality)
+    cfg.update(media_dir=os.path.join(MEDIA_DIR, name, "probe"), output_file=f"{name}_probe")
+    with manim.tempconfig(cfg):
+        probe_scene(load_scene(name), digests, section_reads(scene_path(name)))().render()
+    return digests
+
+
+def render(name, quality="l", jobs=None, output=None, sections=None, incremental=True,
+           stream=False):
+    n = len(section_names(name))
+    indices = list(range(n) if sections is None else sections)
+    manifest = Manifest(os.path.join(MEDIA_DIR, name, f"manifest_{quality}.json"))
+    prints = fingerprints(scene_path(name), probe(name, quality),
+                          {"quality": QUALITIES[quality], "stream": stream})
+    todo = [i for i in indices if not (incremental and manifest.fresh(i, prints[i]))]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {i: pool.submit(render_section, name, i, quality, stream) for i in todo}
+        for i, f in futures.items():
+            manifest.record(i, prints[i], f.result())
+            manifest.save()
+    paths = [manifest.movie(i) for i in indices]
+    paths = [p for p in paths if p]
+    output = output or os.path.join(MEDIA_DIR, name, f"{name}.mp4")
+    return stitch(paths, output), todo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene section by section in parallel.")
+    parser.add_argument("scene", choices=sorted(SCENES))
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-o", "--output")
+    parser.add_argument("-s", "--sections", type=int, nargs="+",
+                        help="only these section indices (default: all)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every section even if its fingerprint is unchanged")
+    parser.add_argument("--stream", action="store_const", const=True, default=False,
+                        help="encode each section through one streaming encoder (no partial files)")
+    parser.add_argument("--dedup", dest="stream", action="store_const", const="dedup",
+                        help="like --stream, and encode static stretches as one long frame")
+    parser.add_argument("--list", action="store_true", help="print the sections and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for i, s in enumerate(section_names(args.scene)):
+            print(f"{i:3d}  {s}")
+        return
+    output, rendered = render(args.scene, args.quality, args.jobs, args.output,
+                              args.sections, incremental=not args.force, stream=args.stream)
+    print(f"rendered sections {rendered}, reused the rest")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
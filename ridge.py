@@ -0,0 +1,129 @@
+import numpy as np
+
+try:
+    from scipy.linalg import solve_triangular
+except ImportError:      # numpy's general solve works on the triangular factors too, just slower
+    solve_triangular = None
+
+# ── Streaming ridge regression ──
+# θ̂ = V⁻¹b with V = λI + Σ a_i a_iᵀ and b = Σ r_i a_i, accumulated in place
+# from chunks of (contexts, rewards), so memory stays O(d²) however many
+# samples stream through.  Solves go through a cached Cholesky factor V = LLᵀ;
+# single samples update or downdate that factor in O(d²) instead of
+# refactorising, and whole chunks refactorise lazily on the next solve.
+# Σ r_i² is kept as well, so the squared error of any θ needs no data.
+#
+#     est = StreamingRidge(d=1)
+#     est.add(np.ones((5, 1)), [2, 4, 5, 7, 8])
+#     est.solve()               # [5.2], the empirical mean
+
+
+def chol_rank_one(L, x, sign=1.0):
+    """In-place update (sign=+1) or downdate (sign=-1) of L so that LLᵀ ± xxᵀ = L'L'ᵀ."""
+    x = np.array(x, dtype=float)
+    for k in range(len(x)):
+        r2 = L[k, k] ** 2 + sign * x[k] ** 2
+        if r2 <= 0:
+            raise ValueError("downdate would make V singular")
+        r = np.sqrt(r2)
+        c, s = r / L[k, k], x[k] / L[k, k]
+        L[k, k] = r
+        L[k + 1:, k] = (L[k + 1:, k] + sign * s * x[k + 1:]) / c
+        x[k + 1:] = c * x[k + 1:] - s * L[k + 1:, k]
+    return L
+
+
+def _tri_solve(L, y, lower):
+    if solve_triangular is not None:
+        return solve_triangular(L, y, lower=lower)
+    return np.linalg.solve(L, y)
+
+
+def chunks(X, r, size=1 << 16):
+    """(X, r) in row blocks of `size`."""
+    for i in range(0, len(X), size):
+        yield X[i:i + size], r[i:i + size]
+
+
+class StreamingRidge:
+    def __init__(self, d, lam=0.0):
+        self.d, self.lam = d, float(lam)
+        self.V = lam * np.eye(d)
+        self.b = np.zeros(d)
+        self.rr = 0.0             # Σ r_i²
+        self.n = 0
+        self._L = None            # Cholesky factor of V, None when stale
+
+    def _rows(self, X, r):
+        X = np.asarray(X, dtype=float).reshape(-1, self.d)
+        r = np.asarray(r, dtype=float).reshape(-1)
+        if len(X) != len(r):
+            raise ValueError(f"{len(X)} contexts but {len(r)} rewards")
+        return X, r
+
+    def add(self, X, r):
+        """Accumulate a chunk of contexts X (n, d) and rewards r (n,)."""
+        X, r = self._rows(X, r)
+        # n rank-one updates cost n·d², refactorising d³/3
+        if self._L is not None and len(X) < self.d:
+            for x in X:
+                chol_rank_one(self._L, x, +1.0)
+        else:
+            self._L = None
+        self.V += X.T @ X
+        self.b += X.T @ r
+        self.rr += r @ r
+        self.n += len(r)
+        return self
+
+    def remove(self, X, r):
+        """Take samples back out (sliding windows); the factor is downdated row by row."""
+        X, r = self._rows(X, r)
+        if self._L is not None:
+            # downdate a copy: a failure partway through must not leave a half-downdated factor
+            L = self._L.copy()
+            try:
+                for x in X:
+                    chol_rank_one(L, x, -1.0)
+            except ValueError:
+                L = None          # refactorised (or reported singular) on the next solve
+            self._L = L
+        self.V -= X.T @ X
+        self.b -= X.T @ r
+        self.rr -= r @ r
+        self.n -= len(r)
+        return self
+
+    def fit(self, stream):
+        """Consume an iterator of (X, r) chunks."""
+        for X, r in stream:
+            self.add(X, r)
+        return self
+
+    @property
+    def cholesky(self):
+        if self._L is None:
+            try:
+                self._L = np.linalg.cholesky(self.V)
+            except np.linalg.LinAlgError:
+                raise ValueError("V is singular; add more samples or use lam > 0") from None
+        return self._L
+
+    def solve(self):
+        """θ̂ = V⁻¹b via the Cholesky factor."""
+        L = self.cholesky
+        return _tri_solve(L.T, _tri_solve(L, self.b, lower=True), lower=False)
+
+    def predict(self, X, theta=None):
+        theta = self.solve() if theta is None else theta
+        return np.asarray(X, dtype=float).reshape(-1, self.d) @ theta
+
+    def residuals(self, X, r, theta=None):
+        X, r = self._rows(X, r)
+        return r - self.predict(X, theta)
+
+    def sse(self, theta=None):
+        """Σ (r_i − a_iᵀθ)² over every sample seen, from the accumulated sums alone."""
+        theta = self.solve() if theta is None else np.asarray(theta, dtype=float)
+        gram = self.V - self.lam * np.eye(self.d)
+        return float(self.rr - 2 * theta @ self.b + theta @ gram @ theta)
@@ -0,0 +1,361 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    import yaml
+except ImportError:      # YAML specs are optional; JSON and plain dicts always work
+    yaml = None
+
+# ── Declarative scenes ──
+# A spec is plain data (a dict, JSON or YAML) listing sections of steps:
+#
+#     {"name": "LimitsIntro", "background": "#1a1a2e",
+#      "caption": {"font_size": 28, "color": "YELLOW", "buff": 0.4},
+#      "sections": [
+#        {"name": "Title", "steps": [
+#           {"title": "Limits of Sequences\nand Functions", "sub": "An Introduction"},
+#           {"wait": 1.5},
+#           {"clear": true}]},
+#        {"name": "Motivation", "steps": [
+#           {"caption": "Imagine a sequence\nof numbers..."},
+#           {"formula": "a_1,\\; a_2,\\; a_3,\\; \\dots", "id": "seq", "font_size": 48},
+#           {"transform": "seq", "tex": "a_n = \\frac{1}{n}"},
+#           {"wait": 2}]}]}
+#
+# compile_spec() validates it and produces a Plan with a start time for every
+# step, per-section fingerprints (for caching and partial re-render) and a
+# diff against another plan.  plan_scene() turns a Plan into a manim Scene;
+# manim is only imported when a plan is actually rendered.  limits_intro.json
+# is a complete example:
+#
+#     python scene_plan.py limits_intro.json                  # validate + timeline
+#     python scene_plan.py new.json --diff limits_intro.json --render --changed-only
+
+# op -> (required fields, optional fields, default run_time)
+OPS = {
+    "title": (("title",), ("sub", "font_size", "color"), 2.0),
+    "text": (("text",), ("id", "font_size", "color", "at"), 1.0),
+    "formula": (("formula",), ("id", "font_size", "color", "at"), 1.0),
+    "caption": (("caption",), (), 0.5),
+    "transform": (("transform", "tex"), ("color",), 1.0),
+    "indicate": (("indicate",), ("color",), 1.0),
+    "fadeout": (("fadeout",), (), 0.5),
+    "clear": (("clear",), (), 0.7),
+    "wait": (("wait",), (), None),
+}
+EDGES = ("up", "down", "left", "right", "ul", "ur", "dl", "dr")
+POSITION_KEYS = ("below", "above", "left_of", "right_of", "buff", "shift")
+
+
+class Step:
+    def __init__(self, op, args, run_time, start):
+        self.op, self.args, self.run_time, self.start = op, args, run_time, start
+
+    @property
+    def end(self):
+        return self.start + self.run_time
+
+    def describe(self):
+        value = self.args[self.op]
+        return f"{self.op}: {value!r}" if not isinstance(value, bool) else self.op
+
+
+class Section:
+    def __init__(self, name, steps, source):
+        self.name, self.steps, self.source = name, steps, source
+
+    @property
+    def start(self):
+        return self.steps[0].start if self.steps else 0.0
+
+    @property
+    def end(self):
+        return self.steps[-1].end if self.steps else self.start
+
+    @property
+    def fingerprint(self):
+        return hashlib.sha256(json.dumps(self.source, sort_keys=True).encode()).hexdigest()
+
+
+class Plan:
+    def __init__(self, name, style, sections):
+        self.name, self.style, self.sections = name, style, sections
+
+    @property
+    def duration(self):
+        return self.sections[-1].end if self.sections else 0.0
+
+    def fingerprints(self):
+        # Each fingerprint is chained onto the previous one: a section starts from
+        # whatever the earlier ones left on screen (ids, the current caption), so
+        # editing `seq` in one section changes every section after it.  The shared
+        # style is the start of the chain, so a caption restyle invalidates all.
+        prev = hashlib.sha256(json.dumps(self.style, sort_keys=True).encode()).hexdigest()
+        prints = {}
+        for s in self.sections:
+            prev = prints[s.name] = hashlib.sha256((prev + s.fingerprint).encode()).hexdigest()
+        return prints
+
+    def diff(self, other):
+        """Sections of this plan that are new or changed relative to `other`."""
+        old = other.fingerprints() if other is not None else {}
+        return [name for name, fp in self.fingerprints().items() if old.get(name) != fp]
+
+    def timeline(self):
+        return [(step.start, step.end, sec.name, step.describe())
+                for sec in self.sections for step in sec.steps]
+
+
+def _check_position(where, at, ids):
+    if at is None or at == "center":
+        return
+    if isinstance(at, str):
+        if at not in EDGES:
+            raise ValueError(f"{where}: unknown position {at!r}, expected center or one of {EDGES}")
+        return
+    if not isinstance(at, dict):
+        raise ValueError(f"{where}: position must be a string or a mapping")
+    unknown = set(at) - set(POSITION_KEYS)
+    if unknown:
+        raise ValueError(f"{where}: unknown position keys {sorted(unknown)}")
+    for key in ("below", "above", "left_of", "right_of"):
+        if key in at and at[key] not in ids:
+            raise ValueError(f"{where}: position refers to unknown id {at[key]!r}")
+
+
+def compile_spec(spec):
+    """Validate a spec and lay its steps out on the timeline."""
+    if "sections" not in spec:
+        raise ValueError("spec has no 'sections'")
+    style = {"background": spec.get("background"), "caption": spec.get("caption", {})}
+    t = 0.0
+    ids = set()
+    sections, names = [], set()
+    for i, sec in enumerate(spec["sections"]):
+        name = sec.get("name", f"section {i + 1}")
+        if name in names:
+            raise ValueError(f"duplicate section name {name!r}")
+        names.add(name)
+        steps = []
+        for j, raw in enumerate(sec.get("steps", [])):
+            where = f"section {name!r} step {j + 1}"
+            ops = [k for k in raw if k in OPS]
+            if len(ops) != 1:
+                raise ValueError(f"{where}: expected exactly one of {sorted(OPS)}, got {sorted(raw)}")
+            op = ops[0]
+            required, optional, default_rt = OPS[op]
+            unknown = set(raw) - set(required) - set(optional) - {"run_time"}
+            if unknown:
+                raise ValueError(f"{where}: unknown fields {sorted(unknown)} for {op!r}")
+            missing = [k for k in required if k not in raw]
+            if missing:
+                raise ValueError(f"{where}: {op!r} needs {missing}")
+
+            if op in ("text", "formula"):
+                _check_position(where, raw.get("at"), ids)
+                if "id" in raw:
+                    if raw["id"] in ids:
+                        raise ValueError(f"{where}: duplicate id {raw['id']!r}")
+                    ids.add(raw["id"])
+            elif op in ("transform", "indicate") and raw[op] not in ids:
+                raise ValueError(f"{where}: unknown id {raw[op]!r}")
+            elif op == "fadeout":
+                targets = raw[op] if isinstance(raw[op], list) else [raw[op]]
+                for k in targets:
+                    if k not in ids:
+                        raise ValueError(f"{where}: unknown id {k!r}")
+                ids -= set(targets)
+            elif op == "clear":
+                ids.clear()
+
+            value = raw[op] if op == "wait" else raw.get("run_time", default_rt)
+            try:
+                run_time = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{where}: run_time must be a number, got {value!r}") from None
+            if not run_time > 0:
+                raise ValueError(f"{where}: run_time must be positive")
+            steps.append(Step(op, dict(raw), run_time, t))
+            t += run_time
+        sections.append(Section(name, steps, sec))
+    return Plan(spec.get("name", "PlanScene"), style, sections)
+
+
+def load_plan(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("PyYAML is required to load YAML scene specs")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    return compile_spec(spec)
+
+
+def plan_scene(plan, only=None):
+    """A manim Scene class that plays `plan`; sections not in `only` are skipped."""
+    import manim
+    from tex_cache import MathTex
+
+    def color(name, default):
+        if name is None:
+            return default
+        return getattr(manim, name, name)
+
+    class PlanScene(manim.Scene):
+        def construct(self):
+            if plan.style["background"]:
+                self.camera.background_color = plan.style["background"]
+            self.ids = {}
+            self.current_caption = None
+            for sec in plan.sections:
+                self.next_section(sec.name, skip_animations=only is not None and sec.name not in only)
+                for step in sec.steps:
+                    getattr(self, "op_" + step.op)(step.args, step.run_time)
+
+        # ── placement ──
+        def place(self, mob, at):
+            if at in (None, "center"):
+                return mob
+            if isinstance(at, str):
+                direction = {"up": manim.UP, "down": manim.DOWN, "left": manim.LEFT,
+                             "right": manim.RIGHT, "ul": manim.UL, "ur": manim.UR,
+                             "dl": manim.DL, "dr": manim.DR}[at]
+                return mob.to_edge(direction) if at in ("up", "down", "left", "right") \
+                    else mob.to_corner(direction)
+            buff = at.get("buff", 0.4)
+            for key, direction in (("below", manim.DOWN), ("above", manim.UP),
+                                   ("left_of", manim.LEFT), ("right_of", manim.RIGHT)):
+                if key in at:
+                    mob.next_to(self.ids[at[key]], direction, buff=buff)
+            if "shift" in at:
+                mob.shift(at["shift"][0] * manim.RIGHT + at["shift"][1] * manim.UP)
+            return mob
+
+        # ── ops ──
+        def op_title(self, a, rt):
+            title = manim.Text(a["title"], font_size=a.get("font_size", 52),
+                               color=color(a.get("color"), manim.WHITE))
+            anims = [manim.Write(title)]
+            if "sub" in a:
+                sub = manim.Text(a["sub"], font_size=30, color=manim.GREY_B)
+                sub.next_to(title, manim.DOWN, buff=0.5)
+                anims.append(manim.FadeIn(sub, shift=manim.UP * 0.3))
+            self.play(*anims, run_time=rt)
+
+        def op_text(self, a, rt):
+            mob = manim.Text(a["text"], font_size=a.get("font_size", 28),
+                             color=color(a.get("color"), manim.WHITE))
+            self.place(mob, a.get("at"))
+            self.ids[a.get("id", id(mob))] = mob
+            self.play(manim.FadeIn(mob), run_time=rt)
+
+        def op_formula(self, a, rt):
+            mob = MathTex(a["formula"], font_size=a.get("font_size", 40),
+                          color=color(a.get("color"), manim.WHITE))
+            self.place(mob, a.get("at"))
+            self.ids[a.get("id", id(mob))] = mob
+            self.play(manim.Write(mob), run_time=rt)
+
+        def op_caption(self, a, rt):
+            style = plan.style["caption"]
+            new = manim.Text(a["caption"], font_size=style.get("font_size", 26),
+                             color=color(style.get("color"), manim.WHITE))
+            new.to_edge(manim.DOWN, buff=style.get("buff", 0.4))
+            old = self.current_caption
+            self.play(*([manim.FadeOut(old)] if old is not None else []), manim.FadeIn(new), run_time=rt)
+            self.current_caption = new
+
+        def op_transform(self, a, rt):
+            old = self.ids[a["transform"]]
+            new = MathTex(a["tex"], font_size=old.font_size, color=color(a.get("color"), old.get_color()))
+            new.move_to(old)
+            self.play(manim.TransformMatchingTex(old, new), run_time=rt)
+            self.ids[a["transform"]] = new
+
+        def op_indicate(self, a, rt):
+            self.play(manim.Indicate(self.ids[a["indicate"]], color=color(a.get("color"), manim.YELLOW)),
+                      run_time=rt)
+
+        def op_fadeout(self, a, rt):
+            keys = a["fadeout"] if isinstance(a["fadeout"], list) else [a["fadeout"]]
+            self.play(*[manim.FadeOut(self.ids.pop(k)) for k in keys], run_time=rt)
+
+        def op_clear(self, a, rt):
+            if self.mobjects:
+                self.play(*[manim.FadeOut(m) for m in self.mobjects], run_time=rt)
+            self.ids.clear()
+            self.current_caption = None
+
+        def op_wait(self, a, rt):
+            self.wait(rt)
+
+    PlanScene.__name__ = plan.name
+    return PlanScene
+
+
+def render(plan, quality="low_quality", only=None, media_dir=None):
+    """Render `plan` to one movie.
+
+    Every rendered section is also kept as its own movie, named by its
+    fingerprint.  With `only`, the other sections are not rendered but taken
+    from those movies (sections without one are rendered after all) and the
+    full movie is stitched back together from them.
+    """
+    import manim
+    from render_sections import stitch
+
+    cfg = {"quality": quality, "output_file": plan.name, "save_sections": True}
+    if media_dir:
+        cfg["media_dir"] = media_dir
+    with manim.tempconfig(cfg):
+        cache_dir = os.path.join(manim.config.media_dir, "plan_sections", plan.name)
+        prints = plan.fingerprints()
+        kept = {name: os.path.join(cache_dir, fp + ".mp4") for name, fp in prints.items()}
+        if only is not None:
+            only = set(only) | {name for name, path in kept.items() if not os.path.exists(path)}
+        scene = plan_scene(plan, only)()
+        scene.render()
+        writer = scene.renderer.file_writer
+        movie = str(writer.movie_file_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        for sec in writer.sections:
+            if sec.video is not None and sec.name in kept:
+                shutil.copyfile(os.path.join(writer.sections_output_dir, sec.video), kept[sec.name])
+    if only is None:
+        return movie
+    return stitch([kept[s.name] for s in plan.sections if os.path.exists(kept[s.name])], movie)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate, diff or render a declarative scene spec.")
+    parser.add_argument("spec")
+    parser.add_argument("--diff", metavar="OLD_SPEC", help="list sections changed since OLD_SPEC")
+    parser.add_argument("--render", action="store_true")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="with --render: re-render only sections changed since --diff "
+                             "(or not rendered before) and reuse the rest")
+    parser.add_argument("-q", "--quality", default="low_quality")
+    args = parser.parse_args(argv)
+
+    plan = load_plan(args.spec)
+    for start, end, section, what in plan.timeline():
+        print(f"{start:7.2f} {end:7.2f}  {section:<24} {what}")
+    print(f"total {plan.duration:.2f}s in {len(plan.sections)} sections")
+
+    changed = None
+    if args.diff:
+        changed = plan.diff(load_plan(args.diff))
+        print("changed sections:", ", ".join(changed) or "none")
+    if args.render:
+        only = None
+        if args.changed_only:
+            only = set(changed or ())
+        print(render(plan, args.quality, only))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import types
+
+import numpy as np
+
+try:
+    import manim
+except ImportError:      # only probing renders; digests of plain values and source fingerprints don't need it
+    manim = None
+
+# ── Section fingerprints for incremental re-render ──
+# fingerprint(k) = hash(section k's source, the code shared by all sections,
+#                       the local modules the scene imports, the render
+#                       parameters, and a digest of the state section k starts
+#                       from).
+# The entry-state digests come from one probe pass over construct() with
+# every section skipped: at each section marker we hash the mobjects on
+# screen, the camera, the RNG state and the state carried into the section.
+# A caption edit in section 3 therefore only invalidates section 3, unless it
+# leaves something behind that later sections see.
+#
+# construct() locals are not hashed wholesale: most of them are captions and
+# helpers that are long gone from the screen.  Section k's carried state is the
+# construct() locals whose names appear in section k's source (`true_means`,
+# `Ws`, `ep`, ...), so editing a value in section 2 invalidates exactly the
+# later sections that read it.  State that hides behind scene attributes or
+# helper closures is named in `section_state` (construct() locals first, then
+# attributes of the scene):
+#
+#     class MDPVideo(Scene):
+#         section_state = ("mdp_group",)      # frozen into a raster layer in between
+
+SECTION_MARK = re.compile(r'^\s*self\.next_section\("[^"]*"\)', re.M)
+LOCAL_IMPORT = re.compile(r"^from (\w+) import", re.M)
+IDENTIFIER = re.compile(r"\b[A-Za-z_]\w*\b")
+
+
+def _sha(*parts):
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(p.encode() if isinstance(p, str) else p)
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+# ── source split ──
+def split_source(path):
+    """(shared source, [section source, ...]) for a scene file.
+
+    Section k runs from its marker to the next one; the last section ends
+    where construct() ends (first line indented at class level or less).
+    """
+    with open(path, encoding="utf-8") as f:
+        src = f.read()
+    starts = [m.start() for m in SECTION_MARK.finditer(src)]
+    if not starts:
+        return src, []
+    tail = re.compile(r"^ {0,4}\S", re.M).search(src, starts[-1] + 1)
+    end = tail.start() if tail else len(src)
+    bounds = starts + [end]
+    sections = [src[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+    shared = src[:starts[0]] + src[end:]
+    return shared, sections
+
+
+def section_reads(path):
+    """Per section, the names its source mentions (a superset of the locals it loads)."""
+    _, sections = split_source(path)
+    return [frozenset(IDENTIFIER.findall(src)) - {"self"} for src in sections]
+
+
+def local_modules_digest(path):
+    root = os.path.dirname(path)
+    with open(path, encoding="utf-8") as f:
+        names = sorted(set(LOCAL_IMPORT.findall(f.read())))
+    parts = []
+    for name in names:
+        mod = os.path.join(root, name + ".py")
+        if os.path.exists(mod):
+            with open(mod, encoding="utf-8") as f:
+                parts += [name, f.read()]
+    return _sha(*parts)
+
+
+# ── entry-state digest ──
+def _update_mobject(h, mob):
+    for m in mob.get_family():
+        h.update(type(m).__name__.encode())
+        h.update(np.ascontiguousarray(m.points, dtype=float).tobytes())
+        for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array"):
+            v = getattr(m, attr, None)
+            if v is not None:
+                h.update(np.ascontiguousarray(v).tobytes())
+        h.update(repr((getattr(m, "stroke_width", None), m.z_index)).encode())
+
+
+def _update_value(h, v, depth=0):
+    if manim is not None and isinstance(v, manim.Mobject):
+        _update_mobject(h, v)
+    elif isinstance(v, np.ndarray):
+        h.update(str(v.dtype).encode() + repr(v.shape).encode())
+        h.update(np.ascontiguousarray(v).tobytes() if v.dtype != object else repr(v).encode())
+    elif v is None or isinstance(v, (bool, int, float, complex, str, bytes, np.generic)):
+        h.update(repr(v).encode())
+    elif callable(v) or isinstance(v, types.ModuleType):
+        # functions, classes and modules are covered by the source hashes
+        h.update(b"<callable>")
+    elif depth >= 4:
+        h.update(type(v).__name__.encode())
+    elif isinstance(v, dict):
+        for k in sorted(v, key=repr):
+            h.update(repr(k).encode())
+            _update_value(h, v[k], depth + 1)
+    elif isinstance(v, (list, tuple, set, frozenset)):
+        items = sorted(v, key=repr) if isinstance(v, (set, frozenset)) else v
+        h.update(f"{type(v).__name__}{len(items)}".encode())
+        for x in items:
+            _update_value(h, x, depth + 1)
+    elif hasattr(v, "__dict__"):
+        h.update(type(v).__name__.encode())
+        _update_value(h, vars(v), depth + 1)
+    else:
+        h.update(type(v).__name__.encode())
+
+
+def carried_state(scene, local_vars, reads=()):
+    """The construct() locals a section reads plus the declared `section_state` values."""
+    declared = tuple(getattr(scene, "section_state", ()))
+    state = {}
+    for name in sorted(set(reads) | set(declared)):
+        if name in local_vars and local_vars[name] is not scene:
+            state[name] = local_vars[name]
+        elif name in declared and hasattr(scene, name):
+            state[name] = getattr(scene, name)
+    return state
+
+
+def state_digest(scene, carried=None):
+    h = hashlib.sha256()
+    for mob in scene.mobjects:
+        _update_mobject(h, mob)
+    frame = getattr(scene.camera, "frame", None)
+    if frame is not None:
+        _update_mobject(h, frame)
+    h.update(repr(scene.camera.background_color).encode())
+    for name, value in sorted((carried or {}).items()):
+        h.update(name.encode())
+        _update_value(h, value)
+    h.update(repr(random.getstate()).encode())
+    h.update(np.random.get_state()[1].tobytes())
+    return h.hexdigest()
+
+
+def probe_scene(scene_cls, digests, reads=()):
+    """Subclass of `scene_cls` that renders nothing and records the entry digest of every section.
+
+    `reads` is `section_reads(path)` for the scene's file; without it only the
+    declared `section_state` is carried.
+    """
+
+    class ProbeScene(scene_cls):
+        def setup(self):
+            super().setup()
+            super().next_section("prelude", skip_animations=True)
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            k = len(digests)
+            names = reads[k] if k < len(reads) else ()
+            digests.append(state_digest(self, carried_state(self, sys._getframe(1).f_locals, names)))
+            super().next_section(name, skip_animations=True)
+
+    ProbeScene.__name__ = f"{scene_cls.__name__}_probe"
+    return ProbeScene
+
+
+def fingerprints(path, entry_digests, params):
+    shared, sections = split_source(path)
+    base = _sha(getattr(manim, "__version__", ""), shared, local_modules_digest(path),
+                json.dumps(params, sort_keys=True))
+    return [_sha(base, src, digest) for src, digest in zip(sections, entry_digests)]
+
+
+# ── manifest ──
+class Manifest:
+    """fingerprint + movie path per section, persisted as JSON next to the section renders."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def fresh(self, index, fingerprint):
+        e = self.entries.get(str(index))
+        return (e is not None and e["fingerprint"] == fingerprint
+                and (e["movie"] is None or os.path.exists(e["movie"])))
+
+    def movie(self, index):
+        return self.entries[str(index)]["movie"]
+
+    def record(self, index, fingerprint, movie):
+        self.entries[str(index)] = {"fingerprint": fingerprint, "movie": movie}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
@@ -0,0 +1,144 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+import manim
+from manim.scene.scene_file_writer import SceneFileWriter
+
+import render_sections
+from video_encoders import PipeEncoder, VfrEncoder
+
+# ── Streaming movie output ──
+# The stock writer opens a partial movie file per play() and concatenates
+# them at the end.  StreamingFileWriter instead starts one ffmpeg process on
+# the first written frame and pipes raw RGBA frames into its stdin for the
+# whole scene, so there are no partial files and no concat pass.  Sections
+# are recorded as timestamps in a JSON sidecar next to the movie.
+#
+# With dedup=True a frame identical to the previous one is not sent to the
+# encoder at all: frames carry explicit timestamps (variable frame rate via
+# PyAV), so a static hold becomes one encoded frame whose duration runs until
+# the next change.  wait() without updaters already rasterises only once
+# (manim's frozen-frame path), so holds then cost neither rasterisation nor
+# encoding.
+#
+#     python stream_writer.py MDPVideo -q h --dedup
+
+
+class StreamingFileWriter(SceneFileWriter):
+    dedup = False
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        # set before super().__init__, which already opens the first section
+        self._encoder = None
+        self._last_frame = None
+        self.frames_written = 0
+        self.frames_deduped = 0
+        self.markers = []
+        super().__init__(renderer, scene_name, **kwargs)
+
+    # ── encoder ──
+    def _start_encoder(self):
+        os.makedirs(os.path.dirname(str(self.movie_file_path)), exist_ok=True)
+        encoder = VfrEncoder if self.dedup else PipeEncoder
+        self._encoder = encoder(str(self.movie_file_path), manim.config.pixel_width,
+                                manim.config.pixel_height, manim.config.frame_rate)
+
+    @property
+    def time(self):
+        return self.frames_written / manim.config.frame_rate
+
+    # ── SceneFileWriter hooks ──
+    def next_section(self, name, type_, skip_animations):
+        super().next_section(name, type_, skip_animations)
+        self.markers.append({"name": name, "start": self.time, "skipped": skip_animations})
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if allow_write and manim.config.write_to_movie and self._encoder is None:
+            self._start_encoder()
+
+    def end_animation(self, allow_write=False):
+        # the encoder stays open across animations
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self._encoder is None:
+            return
+        frame = frame_or_renderer
+        if not hasattr(frame, "tobytes"):
+            frame = frame.get_frame()       # OpenGL renderer
+        frame = np.ascontiguousarray(frame)
+        if self.dedup and self._last_frame is not None and np.array_equal(frame, self._last_frame):
+            self.frames_deduped += num_frames
+        else:
+            self._encoder.write(frame, self.frames_written, num_frames)
+            if self.dedup:
+                self.frames_deduped += num_frames - 1
+                self._last_frame = frame.copy()
+        self.frames_written += num_frames
+
+    def combine_to_movie(self):
+        pass
+
+    def combine_to_section_videos(self):
+        pass
+
+    def clean_cache(self):
+        pass
+
+    def finish(self):
+        if self._encoder is not None:
+            self._encoder.close(self.frames_written)
+            self._encoder = None
+        if manim.config.write_to_movie:
+            with open(self.markers_path, "w", encoding="utf-8") as f:
+                json.dump({"duration": self.time, "frames": self.frames_written,
+                           "frames_deduped": self.frames_deduped,
+                           "sections": self.markers}, f, indent=1)
+
+    @property
+    def markers_path(self):
+        return os.path.splitext(str(self.movie_file_path))[0] + ".sections.json"
+
+
+def use_streaming(scene, dedup=False):
+    """Swap the scene's writer for a StreamingFileWriter (call from setup())."""
+    if manim.config.movie_file_extension != ".mp4" or manim.config.transparent:
+        return  # both encoders target opaque H.264; keep the stock writer otherwise
+    writer = StreamingFileWriter(scene.renderer, type(scene).__name__)
+    writer.dedup = dedup
+    scene.renderer.file_writer = writer
+
+
+def streaming_scene(scene_cls, dedup=False):
+    class StreamingScene(scene_cls):
+        def setup(self):
+            use_streaming(self, dedup)
+            super().setup()
+
+    StreamingScene.__name__ = scene_cls.__name__
+    return StreamingScene
+
+
+def render(name, quality="l", dedup=False):
+    cfg = {"quality": render_sections.QUALITIES[quality], "disable_caching": True}
+    with manim.tempconfig(cfg):
+        scene = streaming_scene(render_sections.load_scene(name), dedup)()
+        scene.render()
+        return scene.renderer.file_writer.movie_file_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene through a single streaming encoder.")
+    parser.add_argument("scene", choices=sorted(render_sections.SCENES))
+    parser.add_argument("-q", "--quality", choices=sorted(render_sections.QUALITIES), default="l")
+    parser.add_argument("--dedup", action="store_true",
+                        help="encode static stretches as one long frame (variable frame rate)")
+    args = parser.parse_args(argv)
+    print(render(args.scene, args.quality, args.dedup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from adaptive_plot import SampleCache, adaptive_samples, function_key, slice_samples
+
+
+def make_line(k):
+    return lambda x: k * x
+
+
+def test_function_key_tracks_closure_and_global_values():
+    assert function_key(lambda x: x ** 2) == function_key(lambda x: x ** 2)
+    assert function_key(make_line(2)) == function_key(make_line(2))
+    assert function_key(make_line(2)) != function_key(make_line(3))
+    g = {"np": np, "K": 2.0}
+    f = eval("lambda x: K * np.sin(x)", g)
+    before = function_key(f)
+    g["K"] = 3.0
+    assert function_key(f) != before
+
+
+def test_cache_keeps_different_closures_apart():
+    c = SampleCache()
+    _, y2, _ = c.samples(make_line(2), 0.0, 1.0)
+    _, y3, _ = c.samples(make_line(3), 0.0, 1.0)
+    assert c.misses == 2 and c.hits == 0
+    assert y2[-1] == pytest.approx(2.0) and y3[-1] == pytest.approx(3.0)
+
+
+def test_sign_has_one_jump_at_zero():
+    x, y, jump = adaptive_samples(np.sign, -3.0, 2.0)
+    assert jump.sum() == 1
+    i = np.flatnonzero(jump)[0]
+    assert x[i] < 0 < x[i + 1] and x[i + 1] - x[i] < 1e-3
+    assert (y[:i + 1] == -1).all() and (y[i + 1:] == 1).all()
+
+
+def test_steep_but_continuous_is_not_a_jump():
+    x, y, jump = adaptive_samples(lambda x: np.tanh(20 * x), -1.0, 1.0)
+    assert not jump.any()
+    # points concentrate where the curve bends
+    assert np.sum(np.abs(x) < 0.2) > np.sum(np.abs(x) > 0.6)
+
+
+class Counted:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return x ** 2 - 2 * x
+
+
+def test_slice_matches_reevaluation():
+    f = Counted()
+    c = SampleCache()
+    c.samples(f, 0.5, 3.2)
+    n_calls = f.calls
+    xs, ys, jump = c.samples(f, 1.8, 2.2)
+    assert c.hits == 1 and f.calls == n_calls
+    assert xs[0] == 1.8 and xs[-1] == 2.2 and not jump.any()
+    # interior points are exact, the interpolated ends are within the sampling tolerance
+    np.testing.assert_allclose(ys[1:-1], f(xs[1:-1]), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(ys[[0, -1]], f(xs[[0, -1]]), atol=1e-3 * np.ptp(f(np.linspace(0.5, 3.2, 99))))
+
+
+def test_slice_inside_a_jump_takes_the_nearer_side():
+    x, y, jump = adaptive_samples(np.sign, -3.0, 2.0)
+    xs, ys, j = slice_samples(x, y, jump, -1.0, 1.0)
+    assert ys[0] == -1 and ys[-1] == 1 and j.sum() == 1
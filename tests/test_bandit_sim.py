@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from bandit_sim import POLICIES, simulate
+
+
+def test_round_robin_then_greedy_on_noiseless_arms():
+    # σ = 0: every reward is the arm's mean, so greedy locks onto the best arm after round-robin
+    run = simulate([0.1, 0.5, 0.9], policy="greedy", horizon=50, n_runs=4,
+                   arms="gaussian", sigma=0.0, seed=0)
+    assert (run.arms[:, :3] == [0, 1, 2]).all()
+    assert (run.arms[:, 3:] == 2).all()
+    np.testing.assert_allclose(run.regret_curve()[-1], 0.8 + 0.4)
+    np.testing.assert_allclose(run.rewards, run.true_means[run.arms])
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_counts_and_shapes(policy):
+    run = simulate([0.2, 0.4, 0.6, 0.8], policy=policy, horizon=200, n_runs=16, seed=1)
+    assert run.arms.shape == run.rewards.shape == (16, 200)
+    assert (run.counts.sum(axis=1) == 200).all()
+    assert set(np.unique(run.rewards)) <= {0.0, 1.0}
+    assert (np.diff(run.cumulative_regret, axis=1) >= 0).all()
+
+
+def test_ucb1_concentrates_on_the_best_arm():
+    run = simulate([0.2, 0.8], policy="ucb1", horizon=2000, n_runs=32, seed=2)
+    assert run.counts[:, 1].mean() > 0.9 * 2000
+
+
+def test_unknown_policy_and_arms():
+    with pytest.raises(ValueError):
+        simulate([0.5], policy="softmax")
+    with pytest.raises(ValueError):
+        simulate([0.5], arms="poisson")
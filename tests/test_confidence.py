@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from confidence import confidence_ellipsoid, simulate, trajectory
+
+
+def test_diagonal_V():
+    E = confidence_ellipsoid(np.diag([4.0, 1.0]), [1.0, 2.0], beta=4.0)
+    # semi-axes √(β/λ): 2 along θ₂ (λ = 1) first, then 1 along θ₁ (λ = 4)
+    np.testing.assert_allclose(E.radii, [2.0, 1.0])
+    np.testing.assert_allclose(np.abs(E.axes), [[0, 1], [1, 0]])
+    assert E.angle == pytest.approx(np.pi / 2)
+
+
+def test_rotated_V_boundary_lies_on_the_ellipse():
+    R = np.array([[np.cos(0.4), -np.sin(0.4)], [np.sin(0.4), np.cos(0.4)]])
+    V = R @ np.diag([0.5, 3.0]) @ R.T
+    centre = np.array([0.3, -0.2])
+    E = confidence_ellipsoid(V, centre, beta=2.0)
+    assert E.angle == pytest.approx(0.4)
+    d = E.boundary(64) - centre
+    np.testing.assert_allclose(np.einsum("ni,ij,nj->n", d, V, d), 2.0)
+    assert E.contains(centre) and not E.contains(centre + 1.01 * d[0])
+
+
+def test_trajectory_matches_per_round_ridge():
+    rng = np.random.default_rng(0)
+    X, r = rng.standard_normal((30, 2)), rng.standard_normal(30)
+    E = trajectory(X, r, lam=1.0, beta=1.0)
+    assert len(E) == 30
+    t = 19
+    V = np.eye(2) + X[:t + 1].T @ X[:t + 1]
+    np.testing.assert_allclose(E[t].centre, np.linalg.solve(V, X[:t + 1].T @ r[:t + 1]))
+    np.testing.assert_allclose(E[t].radii, confidence_ellipsoid(V, E[t].centre).radii)
+
+
+def test_ellipsoids_shrink_and_cover_theta_star():
+    theta_star = np.array([0.6, -0.4])
+    E = simulate(theta_star, T=2000, beta=9.0, seed=1)
+    assert E[-1].radii.max() < 0.1 * E[9].radii.max()
+    assert E[-1].contains(theta_star)
+
+
+def test_rejects_indefinite_V():
+    with pytest.raises(ValueError):
+        confidence_ellipsoid(np.diag([1.0, 0.0]), [0, 0])
@@ -0,0 +1,46 @@
+import numpy as np
+
+from dense_layout import edge_levels, layer_points, level_weight, line_curves, strongest
+
+
+def test_layer_points_fit_the_height():
+    pts = layer_points(3, 2.0)
+    np.testing.assert_allclose(pts, [[2, 1.1, 0], [2, 0, 0], [2, -1.1, 0]])
+    tall = layer_points(128, -1.0, height=6.0)
+    assert tall[0, 1] == 3.0 and tall[-1, 1] == -3.0
+
+
+def test_strongest_k():
+    W = np.array([[0.1, -0.9, 0.3], [0.5, -0.05, 0.7]])
+    assert strongest(W, 3).tolist() == [1, 3, 5]         # -0.9, 0.5, 0.7
+    assert strongest(W, None).tolist() == list(range(6))
+    assert strongest(W, 10).tolist() == list(range(6))
+
+
+def test_edge_levels_count_and_bins():
+    W = np.array([[-2.0, -1.0, 0.0], [0.5, 1.0, 2.0]])
+    rows, cols, level = edge_levels(W, bins=5)
+    assert len(level) == W.size
+    # W[i, j] is the edge src j -> dst i
+    assert list(zip(rows, cols)) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    assert level.tolist() == [0, 1, 2, 2, 3, 4]          # t = -1, -0.5, 0, 0.25, 0.5, 1
+    assert [level_weight(b, 5) for b in (0, 2, 4)] == [-1, 0, 1]
+
+
+def test_edge_levels_keep_the_strongest():
+    rng = np.random.default_rng(0)
+    W = rng.standard_normal((128, 784))
+    rows, cols, level = edge_levels(W, bins=9, max_edges=4000)
+    assert len(rows) == 4000
+    kept = np.abs(W[rows, cols])
+    assert kept.min() >= np.sort(np.abs(W).ravel())[-4000]
+    assert level.min() >= 0 and level.max() <= 8
+    assert set(level.tolist()) <= set(range(9)) and 4 not in level     # weak edges dropped
+
+
+def test_line_curves():
+    starts, ends = np.zeros((2, 3)), np.array([[3.0, 0, 0], [0, 3.0, 0]])
+    pts = line_curves(starts, ends)
+    assert pts.shape == (8, 3)
+    np.testing.assert_allclose(pts[:4, 0], [0, 1, 2, 3])
+    np.testing.assert_allclose(pts[4:, 1], [0, 1, 2, 3])
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from epsilon import SEQUENCES, DeltaSolver, EpsilonN, Sequence, find_N
+
+WIGGLE = Sequence(a=lambda n: np.abs(np.sin(n)) / np.sqrt(n))
+
+
+def brute_N(a, eps, n_max):
+    n = np.arange(1, n_max + 1)
+    out = n[np.abs(a(n)) >= eps]
+    return int(out[-1]) if len(out) else 0
+
+
+@pytest.mark.parametrize("name, eps, N", [("1/n", 0.2, 5), ("1/n", 0.01, 100),
+                                         ("1/sqrt(n)", 0.1, 100), ("(-1)^n/n", 0.3, 3)])
+def test_known_cutoffs(name, eps, N):
+    assert find_N(SEQUENCES[name], eps, n_max=10**6) == N
+    assert find_N(SEQUENCES[name], eps, monotone=True) == N
+
+
+def test_non_monotone_sequence():
+    # |sin n|/√n dips into the 0.1-band as early as n = 3 but keeps leaving it until n = 99
+    assert brute_N(WIGGLE.a, 0.1, 10**5) == 99
+    assert find_N(WIGGLE, 0.1, n_max=10**5, chunk=17) == 99
+    fit = EpsilonN(WIGGLE, 0.1, n_show=120)
+    assert fit.N == 99
+    assert fit.before.max() == 99 and fit.after.min() == 100
+
+
+def test_partial_sums_across_chunks():
+    seq = SEQUENCES["alternating harmonic"]
+    # |S_n − ln 2| < 1/(n + 1), and is ≥ 1/(2(n + 1)); the chunk boundary must not matter
+    assert find_N(seq, 1e-3, n_max=10**4, chunk=97) == find_N(seq, 1e-3, n_max=10**4)
+    assert 499 <= find_N(seq, 1e-3, n_max=10**4) <= 999
+
+
+def test_never_enters_band():
+    with pytest.raises(ValueError):
+        find_N(Sequence(a=lambda n: np.ones(len(n))), 0.5, n_max=1000)
+
+
+def test_delta_for_x_squared():
+    fit = DeltaSolver(lambda x: x ** 2, c=2, L=4).solve(1.0)
+    assert fit.delta == pytest.approx(np.sqrt(5) - 2, rel=1e-9)
+    lo, hi = fit.strip
+    assert hi - 2 == pytest.approx(np.sqrt(5) - 2) and 2 - lo == pytest.approx(np.sqrt(5) - 2)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from mdp_solver import LayeredMDP, SparseTransitions
+
+# the MDP of mdp_video_v9.py: (r_1, r_2, P(·|a_1), P(·|a_2)) per state
+STATE_DATA = {
+    "x0": (0.2, 0.8, [0.9, 0.1], [0.8, 0.2]),
+    "x1L": (0.3, 0.4, [0.4, 0.6], [0.5, 0.5]),
+    "x2L": (0.5, 0.6, [0.1, 0.9], [0.3, 0.7]),
+    "x1R": (0.3, 0.4, [1], [1]),
+    "x2R": (0.7, 0.8, [1], [1]),
+}
+LAYERS = [["x0"], ["x1L", "x2L"], ["x1R", "x2R"], ["T"]]
+NAMES = {k: k for layer in LAYERS for k in layer}
+
+
+@pytest.fixture
+def mdp():
+    return LayeredMDP.from_state_data(LAYERS, STATE_DATA)
+
+
+def test_optimal_values(mdp):
+    sol = mdp.solve()
+    assert sol.value("x0") == pytest.approx(1.856)
+    assert sol.value("x1L") == pytest.approx(1.0)
+    assert sol.value("x2L") == pytest.approx(1.28)
+    assert sol.value("x1R") == pytest.approx(0.4)
+    assert sol.value("x2R") == pytest.approx(0.8)
+    assert [sol.action(k) for k in ("x0", "x1L", "x2L")] == [1, 1, 1]
+
+
+def test_backward_induction_matches_dense(mdp):
+    P = mdp.P.to_dense()
+    V = np.zeros(mdp.S)
+    for h in range(mdp.H - 1, -1, -1):
+        V = (mdp.R[h] + P[h] @ V).max(axis=1)
+    assert mdp.solve().V[0, 0] == pytest.approx(V[0])
+
+
+def test_sparse_roundtrip(mdp):
+    P = mdp.P.to_dense()
+    np.testing.assert_allclose(SparseTransitions.from_dense(P).to_dense(), P)
+
+
+def test_evaluate_fixed_policy(mdp):
+    # always a_1: V(x1R) = 0.3, V(x2R) = 0.7, V(x1L) = 0.3 + 0.4·0.3 + 0.6·0.7, ...
+    V = mdp.evaluate(0)
+    v1L = 0.3 + 0.4 * 0.3 + 0.6 * 0.7
+    v2L = 0.5 + 0.1 * 0.3 + 0.9 * 0.7
+    assert V[1, :2] == pytest.approx([v1L, v2L])
+    assert V[0, 0] == pytest.approx(0.2 + 0.9 * v1L + 0.1 * v2L)
+
+
+def test_q_tex_parts_keep_zero_probability_terms():
+    data = dict(STATE_DATA, x1L=(0.3, 0.4, [0.0, 1.0], [0.5, 0.5]))
+    sol = LayeredMDP.from_state_data(LAYERS, data).solve()
+    parts = sol.q_tex_parts("x1L", 0, NAMES)
+    assert len(parts) == len(sol.q_tex_parts("x1L", 1, NAMES)) == 8
+    assert parts[3].endswith("0") and parts[5].endswith("1")
+    assert parts[7] == "=1.1"
+
+
+def test_rollout_mean_converges_to_policy_value(mdp):
+    policy = {"x0": 1, "x1L": 0, "x2L": 1}
+    runs = mdp.rollout(policy, n_episodes=200_000, seed=0)
+    v_pi = mdp.evaluate(policy)[0, 0]
+    # returns lie in [0, 2], so 4.5 standard errors is < 0.01
+    assert runs.running_mean()[-1] == pytest.approx(v_pi, abs=0.01)
+    assert (runs.actions[:, 0] == 1).all()
+
+
+def test_rollout_transition_frequencies(mdp):
+    runs = mdp.rollout(0, n_episodes=100_000, seed=1)
+    counts = runs.visit_counts()
+    assert (counts.sum(axis=1) == 100_000).all()
+    # x0 --a_1--> x1L with probability 0.9
+    assert counts[1, 0] / 100_000 == pytest.approx(0.9, abs=0.005)
+    assert runs.states[0, -1] == 0 and runs.trajectory(0)[-1][3] == "T"
+
+
+def test_sampler_handles_rounding_short_of_one():
+    P = np.zeros((1, 1, 1, 3))
+    P[0, 0, 0] = [0.1, 0.2, 0.7 - 1e-12]
+    sp = SparseTransitions.from_dense(P)
+    assert sp.sample(0, np.zeros(3, dtype=np.intp), np.array([0.0, 0.25, 1 - 1e-15])).tolist() == [0, 1, 2]
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from mlp import ACTIVATIONS, MLP, SGD
+
+
+def loss(net, X, Y):
+    return 0.5 * np.mean(np.sum((net.predict(X) - Y) ** 2, axis=1))
+
+
+@pytest.mark.parametrize("act", ["relu", "tanh", "sigmoid", (np.sin, np.cos)],
+                         ids=["relu", "tanh", "sigmoid", "custom"])
+def test_gradients_match_central_differences(act):
+    rng = np.random.default_rng(0)
+    net = MLP.random([3, 5, 4, 2], activations=act if isinstance(act, str) else [act, act, "identity"],
+                     seed=1)
+    X, Y = rng.standard_normal((8, 3)), rng.standard_normal((8, 2))
+    sgd = SGD(net, batch_size=8)
+    assert sgd.backward(X, Y) == pytest.approx(loss(net, X, Y))
+
+    eps = 1e-6
+    for params, grads in ((net.weights, sgd.grad_W), (net.biases, sgd.grad_b)):
+        for P, G in zip(params, grads):
+            numeric = np.empty_like(P)
+            for i in np.ndindex(P.shape):
+                old = P[i]
+                P[i] = old + eps
+                up = loss(net, X, Y)
+                P[i] = old - eps
+                down = loss(net, X, Y)
+                P[i] = old
+                numeric[i] = (up - down) / (2 * eps)
+            np.testing.assert_allclose(G, numeric, atol=1e-7)
+
+
+@pytest.mark.parametrize("name", sorted(ACTIVATIONS))
+def test_activations_write_into_out(name):
+    f, df = ACTIVATIONS[name]
+    z = np.linspace(-3, 3, 13).reshape(1, -1)
+    for fn in (f, df):
+        out = np.empty_like(z)
+        assert fn(z, out=out) is out
+        np.testing.assert_allclose(out, fn(z.copy()))
+
+
+def test_forward_known_values():
+    net = MLP([[[1.0, -1.0]], [[2.0]]], [[0.5], [-1.0]], ["relu", "identity"])
+    fwd = net.forward([[3.0, 1.0], [0.0, 2.0]])
+    np.testing.assert_allclose(fwd.z[1], [[2.5], [-1.5]])
+    np.testing.assert_allclose(fwd.output, [[4.0], [-1.0]])
+
+
+def test_sgd_reduces_loss_and_rejects_oversized_batches():
+    rng = np.random.default_rng(2)
+    X = rng.standard_normal((256, 2))
+    Y = X @ [[1.0], [-2.0]] + 0.5
+    net = MLP.random([2, 8, 1], "tanh", seed=0)
+    sgd = SGD(net, lr=0.05, batch_size=32, seed=0)
+    before = loss(net, X, Y)
+    sgd.fit(X, Y, 500)
+    assert loss(net, X, Y) < 0.05 * before
+    with pytest.raises(ValueError):
+        sgd.backward(X[:33], Y[:33])
+
+
+def test_train_runs_eagerly_and_snapshots_change():
+    rng = np.random.default_rng(3)
+    X = rng.standard_normal((128, 2))
+    Y = np.tanh(X @ [[1.0], [-1.0]])
+    net = MLP.random([2, 4, 1], "tanh", seed=0)
+    sgd = SGD(net, lr=0.1, batch_size=16, seed=0)
+    losses = []
+    snaps = sgd.train(X, Y, 100, snapshot_every=25, on_step=lambda step, l: losses.append((step, l)))
+    assert sgd.step_count == 100 and [s for s, _ in losses] == list(range(1, 101))
+    assert [s.step for s in snaps] == [25, 50, 75, 100]
+    for a, b in zip(snaps, snaps[1:]):
+        assert not np.array_equal(a.weights[0], b.weights[0])
+    # snapshots are copies, the last one equals the trained net
+    np.testing.assert_array_equal(snaps[-1].weights[1], net.weights[1])
+    assert snaps[-1].weights[1] is not net.weights[1]
+    assert snaps[-1].loss == losses[-1][1]
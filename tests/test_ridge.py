@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from ridge import StreamingRidge, chol_rank_one, chunks
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((500, 4))
+    r = X @ [1.0, -2.0, 0.5, 0.0] + 0.1 * rng.standard_normal(500)
+    return X, r
+
+
+def ridge(X, r, lam):
+    return np.linalg.solve(lam * np.eye(X.shape[1]) + X.T @ X, X.T @ r)
+
+
+def test_empirical_mean():
+    est = StreamingRidge(d=1).add(np.ones((5, 1)), [2, 4, 5, 7, 8])
+    assert est.solve() == pytest.approx([5.2])
+    assert est.sse() == pytest.approx(np.sum((np.array([2, 4, 5, 7, 8]) - 5.2) ** 2))
+
+
+def test_chunked_fit_matches_solve(data):
+    X, r = data
+    est = StreamingRidge(d=4, lam=0.5).fit(chunks(X, r, size=37))
+    np.testing.assert_allclose(est.solve(), ridge(X, r, 0.5))
+    theta = est.solve()
+    assert est.sse() == pytest.approx(np.sum((r - X @ theta) ** 2))
+
+
+def test_rank_one_updates_and_downdates(data):
+    X, r = data
+    est = StreamingRidge(d=4, lam=1.0).add(X[:100], r[:100])
+    est.solve()                          # factor cached: later small chunks update it in place
+    for i in range(100, 110):
+        est.add(X[i:i + 1], r[i:i + 1])
+    est.remove(X[:3], r[:3])
+    np.testing.assert_allclose(est.cholesky @ est.cholesky.T, est.V)
+    np.testing.assert_allclose(est.solve(), ridge(X[3:110], r[3:110], 1.0))
+
+
+def test_chol_rank_one():
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((6, 6))
+    V = A @ A.T + np.eye(6)
+    x = rng.standard_normal(6)
+    L = chol_rank_one(np.linalg.cholesky(V), x, +1.0)
+    np.testing.assert_allclose(L @ L.T, V + np.outer(x, x))
+
+
+def test_failed_downdate_leaves_no_corrupted_factor():
+    est = StreamingRidge(d=2, lam=1.0).add(np.eye(2), [1.0, 1.0])
+    est.solve()
+    est.remove([[10.0, 0.0]], [0.0])     # the downdate fails partway through
+    with pytest.raises(ValueError):
+        est.solve()                      # V is indefinite now
+    est.add([[10.0, 0.0]], [0.0])        # put the sample back
+    np.testing.assert_allclose(est.solve(), [0.5, 0.5])
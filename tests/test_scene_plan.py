@@ -0,0 +1,112 @@
+import copy
+import json
+import os
+
+import pytest
+
+from scene_plan import compile_spec, load_plan, main
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "limits_intro.json")
+
+SPEC = {
+    "name": "Demo",
+    "caption": {"font_size": 28},
+    "sections": [
+        {"name": "Title", "steps": [{"title": "Limits"}, {"wait": 1.5}, {"clear": True}]},
+        {"name": "Seq", "steps": [
+            {"formula": "a_n", "id": "seq"},
+            {"transform": "seq", "tex": "a_n = \\frac{1}{n}", "run_time": 2}]},
+        {"name": "Use", "steps": [{"indicate": "seq"}, {"fadeout": "seq"}]},
+        {"name": "End", "steps": [{"caption": "Done."}, {"wait": 1}]},
+    ],
+}
+
+
+def with_step(section, step, spec=SPEC):
+    spec = copy.deepcopy(spec)
+    spec["sections"][section]["steps"].append(step)
+    return spec
+
+
+def test_timeline():
+    plan = compile_spec(SPEC)
+    assert plan.timeline() == [
+        (0.0, 2.0, "Title", "title: 'Limits'"),
+        (2.0, 3.5, "Title", "wait: 1.5"),
+        (3.5, 4.2, "Title", "clear"),
+        (4.2, 5.2, "Seq", "formula: 'a_n'"),
+        (5.2, 7.2, "Seq", "transform: 'seq'"),
+        (7.2, 8.2, "Use", "indicate: 'seq'"),
+        (8.2, 8.7, "Use", "fadeout: 'seq'"),
+        (8.7, 9.2, "End", "caption: 'Done.'"),
+        (9.2, 10.2, "End", "wait: 1"),
+    ]
+    assert plan.duration == pytest.approx(10.2)
+    assert [(s.start, s.end) for s in plan.sections][1] == (4.2, 7.2)
+
+
+@pytest.mark.parametrize("step, message", [
+    ({"text": "x", "colour": "RED"}, r"unknown fields \['colour'\]"),
+    ({"text": "x", "wait": 1}, "expected exactly one of"),
+    ({"transform": "seq"}, r"'transform' needs \['tex'\]"),
+    ({"indicate": "nope"}, "unknown id 'nope'"),
+    ({"text": "x", "at": "middle"}, "unknown position 'middle'"),
+    ({"text": "x", "at": {"below": "nope"}}, "unknown id 'nope'"),
+    ({"text": "x", "at": {"bellow": "seq"}}, r"unknown position keys \['bellow'\]"),
+    ({"text": "x", "at": 3}, "position must be a string or a mapping"),
+    ({"formula": "b", "id": "seq"}, "duplicate id 'seq'"),
+    ({"text": "x", "run_time": "fast"}, "run_time must be a number"),
+    ({"wait": 0}, "run_time must be positive"),
+    ({"wait": float("nan")}, "run_time must be positive"),
+])
+def test_validation_errors(step, message):
+    with pytest.raises(ValueError, match=message) as err:
+        compile_spec(with_step(1, step))
+    assert str(err.value).startswith("section 'Seq' step 3")
+
+
+def test_spec_level_errors():
+    with pytest.raises(ValueError, match="no 'sections'"):
+        compile_spec({"name": "x"})
+    spec = copy.deepcopy(SPEC)
+    spec["sections"][2]["name"] = "Seq"
+    with pytest.raises(ValueError, match="duplicate section name 'Seq'"):
+        compile_spec(spec)
+    # ids do not survive a clear
+    with pytest.raises(ValueError, match="unknown id 'seq'"):
+        compile_spec(with_step(2, {"indicate": "seq"}, with_step(1, {"clear": True})))
+
+
+def test_chained_fingerprints_drive_the_diff():
+    old = compile_spec(SPEC)
+    assert compile_spec(copy.deepcopy(SPEC)).diff(old) == []
+    assert compile_spec(SPEC).diff(None) == ["Title", "Seq", "Use", "End"]
+
+    edited = copy.deepcopy(SPEC)
+    edited["sections"][1]["steps"][1]["tex"] = "a_n = \\frac{2}{n}"
+    # Use and End start from what Seq left behind, so they change with it
+    assert compile_spec(edited).diff(old) == ["Seq", "Use", "End"]
+
+    edited = copy.deepcopy(SPEC)
+    edited["sections"][3]["steps"][1]["wait"] = 2
+    assert compile_spec(edited).diff(old) == ["End"]
+
+    edited = copy.deepcopy(SPEC)
+    edited["caption"]["font_size"] = 30
+    assert compile_spec(edited).diff(old) == ["Title", "Seq", "Use", "End"]
+
+
+def test_example_spec(tmp_path, capsys):
+    plan = load_plan(EXAMPLE)
+    assert [s.name for s in plan.sections] == ["Title", "Motivation", "Definition"]
+    assert plan.duration == pytest.approx(20.6)
+
+    with open(EXAMPLE, encoding="utf-8") as f:
+        spec = json.load(f)
+    spec["sections"][1]["steps"][4]["tex"] = "a_n = \\frac{(-1)^n}{n}"
+    new = tmp_path / "new.json"
+    new.write_text(json.dumps(spec), encoding="utf-8")
+    main([str(new), "--diff", EXAMPLE])
+    out = capsys.readouterr().out
+    assert "total 20.60s in 3 sections" in out
+    assert "changed sections: Motivation, Definition" in out
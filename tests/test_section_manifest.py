@@ -0,0 +1,67 @@
+import textwrap
+from types import SimpleNamespace
+
+from section_manifest import fingerprints, probe_scene, section_reads
+
+SCENE = textwrap.dedent('''\
+    class Demo(Base):
+        def construct(self):
+            self.next_section("1. SETUP")
+            true_means = {means}
+            caption = "arms"
+            self.next_section("2. CAPTION ONLY")
+            self.log.append(caption)
+            self.next_section("3. GAPS")
+            self.log.append(max(true_means) - min(true_means))
+    ''')
+
+
+class Base:
+    """Just enough of a Scene for the probe: no mobjects, a camera with a background."""
+
+    def __init__(self):
+        self.mobjects = []
+        self.camera = SimpleNamespace(background_color="#000000")
+        self.log = []
+
+    def setup(self):
+        pass
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        pass
+
+    def render(self):
+        self.setup()
+        self.construct()
+
+
+def scene_prints(root, means):
+    root.mkdir()
+    path = root / "demo.py"
+    path.write_text(SCENE.format(means=means), encoding="utf-8")
+    namespace = {"Base": Base}
+    exec(compile(path.read_text(encoding="utf-8"), str(path), "exec"), namespace)
+    digests = []
+    probe_scene(namespace["Demo"], digests, section_reads(str(path)))().render()
+    return fingerprints(str(path), digests, {"quality": "l"})
+
+
+def test_section_reads_names_in_each_section(tmp_path):
+    path = tmp_path / "demo.py"
+    path.write_text(SCENE.format(means=[0.5, 0.7]), encoding="utf-8")
+    reads = section_reads(str(path))
+    assert len(reads) == 3
+    assert "true_means" in reads[0] and "true_means" not in reads[1] and "true_means" in reads[2]
+    assert "self" not in reads[2]
+
+
+def test_editing_an_earlier_value_invalidates_its_readers(tmp_path):
+    before = scene_prints(tmp_path / "a", [0.5, 0.7])
+    after = scene_prints(tmp_path / "b", [0.5, 0.9])
+    assert before[0] != after[0]          # the edited section itself
+    assert before[1] == after[1]          # never looks at true_means
+    assert before[2] != after[2]          # reads true_means set two sections earlier
+
+
+def test_fingerprints_are_stable(tmp_path):
+    assert scene_prints(tmp_path / "a", [0.5, 0.7]) == scene_prints(tmp_path / "b", [0.5, 0.7])
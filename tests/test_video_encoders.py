@@ -0,0 +1,75 @@
+import shutil
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+
+from video_encoders import PipeEncoder, VfrEncoder
+
+W, H, FPS = 64, 48, 15
+# (first frame, grey level) of each hold; the movie ends at frame END
+HOLDS = [(0, 0), (10, 80), (15, 160)]
+END = 30
+
+
+def _frame(level):
+    frame = np.full((H, W, 4), level, dtype=np.uint8)
+    frame[..., 3] = 255
+    return frame
+
+
+def encode(encoder_cls, path):
+    """Write HOLDS the way StreamingFileWriter does: every frame for CFR, one per hold for VFR."""
+    enc = encoder_cls(str(path), W, H, FPS)
+    stops = [start for start, _ in HOLDS[1:]] + [END]
+    for (start, level), stop in zip(HOLDS, stops):
+        if encoder_cls is VfrEncoder:
+            enc.write(_frame(level), start, stop - start)
+        else:
+            for k in range(start, stop):
+                enc.write(_frame(level), k, 1)
+    enc.close(END)
+    return path
+
+
+def holds(path):
+    """[(start, end)] in seconds of each run of identical decoded frames, and the movie duration."""
+    runs = []
+    with av.open(str(path)) as container:
+        for f in container.decode(video=0):
+            level = int(np.median(f.to_ndarray(format="gray")))
+            start, end = float(f.time), float(f.time + f.duration * f.time_base)
+            if runs and abs(runs[-1][2] - level) <= 2:
+                runs[-1][1] = end
+            else:
+                runs.append([start, end, level])
+        duration = container.duration / 1e6
+    return [(round(a, 4), round(b, 4)) for a, b, _ in runs], duration
+
+
+def cfr_holds():
+    """The CFR path's timeline: frame k shown from k / FPS for 1 / FPS."""
+    t = np.arange(END + 1) / FPS
+    stops = [start for start, _ in HOLDS[1:]] + [END]
+    return [(round(t[a], 4), round(t[b], 4)) for (a, _), b in zip(HOLDS, stops)]
+
+
+def test_vfr_encodes_one_frame_per_hold(tmp_path):
+    path = encode(VfrEncoder, tmp_path / "vfr.mp4")
+    with av.open(str(path)) as container:
+        assert container.streams.video[0].frames == len(HOLDS)
+
+
+def test_vfr_timestamps_and_duration_match_cfr(tmp_path):
+    runs, duration = holds(encode(VfrEncoder, tmp_path / "vfr.mp4"))
+    assert runs == cfr_holds()
+    assert duration == pytest.approx(END / FPS, abs=1e-3)
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="PipeEncoder needs the ffmpeg CLI")
+def test_vfr_matches_pipe_encoder(tmp_path):
+    vfr, vfr_duration = holds(encode(VfrEncoder, tmp_path / "vfr.mp4"))
+    cfr, cfr_duration = holds(encode(PipeEncoder, tmp_path / "cfr.mp4"))
+    assert vfr == cfr
+    assert vfr_duration == pytest.approx(cfr_duration, abs=1e-3)
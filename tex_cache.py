@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import manim
+
+# ── Shared Tex / MathTex cache ──
+# Compiled formulas are keyed on everything that shapes their paths (class,
+# tex strings, font size, template, manim version) but not on colour, which is
+# applied to a copy afterwards.  Hits come from an in-process LRU first, then
+# from pickled mobjects on disk shared by every scene, so a repeated formula
+# never reaches LaTeX or the SVG parser.
+#
+# Scenes opt in by shadowing the manim names after the star import:
+#     from manim import *
+#     from tex_cache import MathTex, Tex
+
+CACHE_DIR = os.environ.get(
+    "BRUINML_TEX_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "bruinml-academy", "tex"),
+)
+MAX_ENTRIES = 2048
+
+# applied after the lookup, so they never split cache entries
+STYLE_KWARGS = ("color", "fill_color", "fill_opacity", "stroke_color", "stroke_opacity")
+
+
+class TexCache:
+    def __init__(self, directory=CACHE_DIR, max_entries=MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def key(self, cls, strings, kwargs):
+        template = kwargs.get("tex_template") or manim.config.tex_template
+        parts = [manim.__version__, cls.__name__, repr(strings),
+                 repr(sorted((k, repr(v)) for k, v in kwargs.items() if k != "tex_template")),
+                 template.body]
+        return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # missing, truncated or written by an incompatible manim: rebuild
+            return None
+
+    def _store(self, key, mob):
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(mob, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def _remember(self, key, mob):
+        self._memory[key] = mob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, cls, *strings, **kwargs):
+        style = {k: kwargs.pop(k) for k in STYLE_KWARGS if k in kwargs}
+        key = self.key(cls, strings, kwargs)
+        proto = self._memory.get(key)
+        if proto is not None:
+            self.hits += 1
+            self._memory.move_to_end(key)
+        else:
+            proto = self._load(key)
+            if proto is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                proto = cls(*strings, **kwargs)
+                self._store(key, proto)
+            self._remember(key, proto)
+        mob = proto.copy()
+        if "color" in style:
+            mob.set_color(style["color"])
+        if "fill_color" in style or "fill_opacity" in style:
+            mob.set_fill(style.get("fill_color"), opacity=style.get("fill_opacity"))
+        if "stroke_color" in style or "stroke_opacity" in style:
+            mob.set_stroke(style.get("stroke_color"), opacity=style.get("stroke_opacity"))
+        return mob
+
+    def clear(self, disk=False):
+        self._memory.clear()
+        if disk and os.path.isdir(self.directory):
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if name.endswith(".pkl"):
+                        os.remove(os.path.join(root, name))
+
+    def stats(self):
+        return {"memory_hits": self.hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "entries": len(self._memory)}
+
+
+cache = TexCache()
+
+
+def MathTex(*tex_strings, **kwargs):
+    return cache.get(manim.MathTex, *tex_strings, **kwargs)
+
+
+def Tex(*tex_strings, **kwargs):
+    return cache.get(manim.Tex, *tex_strings, **kwargs)
@@ -0,0 +1,84 @@
+import subprocess
+from fractions import Fraction
+
+try:
+    import av
+except ImportError:      # only needed for --dedup; newer manim releases depend on it anyway
+    av = None
+
+# ── Movie encoders ──
+# Both take frames as (H, W, 4) uint8 RGBA arrays with a frame-index
+# timestamp and write opaque H.264/mp4; neither needs manim, so they can
+# be checked on their own (tests/test_video_encoders.py).
+#
+#     enc = VfrEncoder("out.mp4", 1920, 1080, 60)
+#     enc.write(frame, 0, 1); enc.write(other, 90, 1)
+#     enc.close(120)          # `other` held from 1.5 s to 2 s
+
+ENCODER_ARGS = ["-c:v", "libx264", "-preset", "medium", "-crf", "18", "-pix_fmt", "yuv420p"]
+
+
+class PipeEncoder:
+    """Constant frame rate: raw frames into an ffmpeg subprocess."""
+
+    def __init__(self, path, width, height, fps):
+        cmd = ["ffmpeg", "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+               "-r", str(fps), "-i", "-",
+               *ENCODER_ARGS, "-movflags", "+faststart", path]
+        # a large pipe buffer lets the renderer run ahead of the encoder
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=1 << 24)
+
+    def write(self, frame, pts, num_frames):
+        data = memoryview(frame).cast("B")
+        for _ in range(num_frames):
+            self.proc.stdin.write(data)
+
+    def close(self, end_pts):
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.proc.returncode}")
+
+
+class VfrEncoder:
+    """Variable frame rate: one encoded frame per write, held until the next pts."""
+
+    def __init__(self, path, width, height, fps):
+        if av is None:
+            raise ImportError("PyAV is required for frame deduplication")
+        self.container = av.open(path, mode="w")
+        self.stream = self.container.add_stream("libx264", rate=Fraction(fps).limit_denominator(1001))
+        self.stream.width, self.stream.height = width, height
+        self.stream.pix_fmt = "yuv420p"
+        # no B-frames: packets then leave the encoder in presentation order, so the
+        # last one muxed is the last frame and its duration sets the movie's length
+        self.stream.options = {"crf": "18", "preset": "medium", "bf": "0"}
+        self.stream.codec_context.time_base = 1 / Fraction(fps).limit_denominator(1001)
+        self._pending = None      # (VideoFrame, pts) waiting for the next pts
+        self._durations = {}
+
+    def _mux(self, packets):
+        for packet in packets:
+            # libx264 leaves packet durations at 0, which would cut the final hold
+            packet.duration = self._durations.pop(packet.pts)
+            self.container.mux(packet)
+
+    def _flush_pending(self, next_pts):
+        vf, pts = self._pending
+        self._durations[pts] = next_pts - pts
+        self._mux(self.stream.encode(vf))
+        self._pending = None
+
+    def write(self, frame, pts, num_frames):
+        if self._pending is not None:
+            self._flush_pending(pts)
+        # from_ndarray copies, so the caller may reuse `frame`
+        vf = av.VideoFrame.from_ndarray(frame, format="rgba")
+        vf.pts = pts
+        self._pending = (vf, pts)
+
+    def close(self, end_pts):
+        if self._pending is not None:
+            self._flush_pending(end_pts)
+        self._mux(self.stream.encode())
+        self.container.close()